@@ -31,9 +31,10 @@ bot.run_forever()
 
 import typing
 
-from .api import API, APIError, APIResponse, APIServerError, Token
+from .api import API, APIError, APIResponse, APIServerError, RateLimiter, Token
 from .bot import (
     ABCDispatch,
+    ABCExecutor,
     ABCHandler,
     ABCMiddleware,
     ABCPolling,
@@ -59,6 +60,8 @@ from .bot import (
     ErrorView,
     EventModelView,
     EventView,
+    Executor,
+    ExecutorMetrics,
     FilterMiddleware,
     FuncHandler,
     InlineQueryCute,
@@ -82,7 +85,9 @@ from .bot import (
     PreCheckoutQueryReturnManager,
     RawEventView,
     Router,
+    ShardedExecutor,
     ShippingQueryCute,
+    StatePrefetchMiddleware,
     StickerReplyHandler,
     Telegrinder,
     UpdateCute,
@@ -91,6 +96,7 @@ from .bot import (
     ViewBox,
     ViewMiddlewareBox,
     WaiterMiddleware,
+    Webhook,
     action,
     register_manager,
 )
@@ -161,6 +167,7 @@ __all__ = (
     "MESSAGE_IN_CHAT",
     "ABCClient",
     "ABCDispatch",
+    "ABCExecutor",
     "ABCGlobalContext",
     "ABCHandler",
     "ABCKeyboard",
@@ -202,6 +209,8 @@ __all__ = (
     "ErrorView",
     "EventModelView",
     "EventView",
+    "Executor",
+    "ExecutorMetrics",
     "FilterMiddleware",
     "FuncHandler",
     "GlobalContext",
@@ -245,13 +254,16 @@ __all__ = (
     "PreCheckoutQueryReturnManager",
     "PrimaryButton",
     "PrimaryInlineButton",
+    "RateLimiter",
     "RawEventView",
     "Router",
     "RowButtons",
+    "ShardedExecutor",
     "ShippingQuery",
     "ShippingQueryCute",
     "ShortState",
     "StateData",
+    "StatePrefetchMiddleware",
     "StickerReplyHandler",
     "SuccessButton",
     "SuccessInlineButton",
@@ -267,6 +279,7 @@ __all__ = (
     "ViewMiddlewareBox",
     "WaiterMachine",
     "WaiterMiddleware",
+    "Webhook",
     "WreqClient",
     "action",
     "configure_dotenv",
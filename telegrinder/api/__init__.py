@@ -1,15 +1,25 @@
 from telegrinder.api.api import API
+from telegrinder.api.broadcast import Broadcast, BroadcastResult
 from telegrinder.api.error import APIError, APIServerError, InvalidTokenError
+from telegrinder.api.rate_limiter import Limit, RateLimiter
 from telegrinder.api.response import APIResponse
 from telegrinder.api.token import Token
+from telegrinder.api.upload_cache import ABCUploadCache, MemoryUploadCache, SQLiteUploadCache
 from telegrinder.api.validators import validate_token
 
 __all__ = (
     "API",
+    "ABCUploadCache",
     "APIError",
     "APIResponse",
     "APIServerError",
+    "Broadcast",
+    "BroadcastResult",
     "InvalidTokenError",
+    "Limit",
+    "MemoryUploadCache",
+    "RateLimiter",
+    "SQLiteUploadCache",
     "Token",
     "validate_token",
 )
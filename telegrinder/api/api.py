@@ -1,4 +1,5 @@
 import asyncio
+import os
 import pathlib
 import typing
 from datetime import timedelta
@@ -10,15 +11,20 @@ from kungfu.library.misc import is_ok
 from kungfu.library.monad.result import Error, Ok, Result
 from msgspex import decoder
 
+from telegrinder.api.broadcast import DEFAULT_CONCURRENCY, Broadcast, BroadcastMethod, Recipients
 from telegrinder.api.error import APIError
+from telegrinder.api.rate_limiter import RateLimiter
 from telegrinder.api.response import APIResponse
 from telegrinder.api.token import Token
+from telegrinder.api.upload_cache import ABCUploadCache, request_with_upload_cache
 from telegrinder.client import ABCClient, WreqClient
+from telegrinder.tools.aio import maybe_awaitable
 from telegrinder.types.methods import APIMethods
 
 type Json = str | int | float | bool | list[Json] | dict[str, Json] | None
 type Data = dict[str, typing.Any]
-type Files = dict[str, tuple[str, bytes]]
+type Files = dict[str, tuple[str, bytes | pathlib.Path]]
+type ProgressCallback = typing.Callable[[int], typing.Any]
 type APIRequestMethod[T: API, **P, R] = typing.Callable[
     typing.Concatenate[T, P],
     typing.Coroutine[typing.Any, typing.Any, Result[R, APIError]],
@@ -29,6 +35,10 @@ DEFAULT_MAX_RETRIES: typing.Final = 5
 DEFAULT_TIMEOUT: typing.Final = timedelta(seconds=30)
 
 
+class FileWriter(typing.Protocol):
+    def write(self, data: bytes, /) -> typing.Any: ...
+
+
 def retryer[T: API, **P, R](func: APIRequestMethod[T, P, R], /) -> APIRequestMethod[T, P, R]:
     @wraps(func)
     async def wrapper(
@@ -76,25 +86,36 @@ class API(APIMethods):
         http: ABCClient | None = None,
         retryer: bool = True,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        rate_limiter: RateLimiter | None = None,
+        upload_cache: ABCUploadCache | None = None,
     ) -> None:
         self.token = token
         self.http = http or WreqClient()
+        self.rate_limiter = rate_limiter
+        self.upload_cache = upload_cache
         self._retryer_is_enabled = retryer
         self._max_retries = max_retries
         super().__init__(api=self)
 
     def __repr__(self) -> str:
-        return "<{}: id={}, http={!r}, max_retries={}>".format(
+        return "<{}: id={}, http={!r}, max_retries={}, rate_limiter={!r}, upload_cache={!r}>".format(
             type(self).__name__,
             self.id,
             self.http,
             self._max_retries,
+            self.rate_limiter,
+            self.upload_cache,
         )
 
     @cached_property
     def id(self) -> int:
         return self.token.bot_id
 
+    @cached_property
+    def broadcast_rate_limiter(self) -> RateLimiter:
+        """Rate limiter shared by the broadcasts of the API without its own rate limiter."""
+        return RateLimiter()
+
     @property
     def request_url(self) -> str:
         return self.API_URL + f"bot{self.token}/"
@@ -111,6 +132,35 @@ class API(APIMethods):
     def max_retries(self) -> int:
         return self._max_retries
 
+    def broadcast[T](
+        self,
+        method: BroadcastMethod[T],
+        recipients: Recipients,
+        /,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        start_from: int = 0,
+        **params: typing.Any,
+    ) -> Broadcast[T]:
+        """Call the API method for each recipient with bounded concurrency, see `Broadcast`.
+
+        Requests of the broadcast are limited by the rate limiter of the API. If the API has no rate limiter,
+        all broadcasts of the API share the `broadcast_rate_limiter` to respect the flood limits.
+        """
+        return Broadcast(
+            method,
+            recipients,
+            concurrency=concurrency,
+            rate_limiter=self.broadcast_rate_limiter if self.rate_limiter is None else None,
+            start_from=start_from,
+            **params,
+        )
+
+    @staticmethod
+    def _file_error(content: bytes, /) -> APIError:
+        error = decoder.decode(content, type=APIResponse)
+        return APIError(code=error.error_code, error=error.description, data=error.parameters)
+
     async def download_file(
         self,
         file_path: str | pathlib.Path,
@@ -124,8 +174,66 @@ class API(APIMethods):
         if response.status.is_success:
             return Ok(response.content)
 
-        error = decoder.decode(response.content, type=APIResponse)
-        return Error(APIError(code=error.error_code, error=error.description, data=error.parameters))
+        return Error(self._file_error(response.content))
+
+    async def iter_file(
+        self,
+        file_path: str | pathlib.Path,
+        timeout: int | float | timedelta = DEFAULT_TIMEOUT,
+    ) -> typing.AsyncGenerator[bytes, None]:
+        """Download the file by chunks without buffering the whole file in memory.
+
+        Raises:
+            APIError: If the file cannot be downloaded.
+
+        """
+        async with self.http.request_stream(
+            url=f"{self.request_file_url}/{file_path}",
+            timeout=timeout,
+        ) as response:
+            if not response.status.is_success:
+                raise self._file_error(b"".join([chunk async for chunk in response.chunks]))
+
+            async for chunk in response.chunks:
+                yield chunk
+
+    async def download_file_to(
+        self,
+        file_path: str | pathlib.Path,
+        destination: str | os.PathLike[str] | FileWriter,
+        *,
+        timeout: int | float | timedelta = DEFAULT_TIMEOUT,
+        on_progress: ProgressCallback | None = None,
+    ) -> Result[int, APIError]:
+        """Download the file by chunks to the path or the (async) writer
+        and return the number of downloaded bytes.
+
+        `on_progress` is called (or awaited) with the number of bytes downloaded so far after each chunk.
+        """
+        if isinstance(destination, str | os.PathLike):
+            path = pathlib.Path(destination)
+
+            with path.open("wb") as file:
+                result = await self.download_file_to(file_path, file, timeout=timeout, on_progress=on_progress)
+
+            if not is_ok(result):
+                path.unlink(missing_ok=True)
+
+            return result
+
+        downloaded = 0
+
+        try:
+            async for chunk in self.iter_file(file_path, timeout=timeout):
+                await maybe_awaitable(destination.write(chunk))
+                downloaded += len(chunk)
+
+                if on_progress is not None:
+                    await maybe_awaitable(on_progress(downloaded))
+        except APIError as error:
+            return Error(error)
+
+        return Ok(downloaded)
 
     @retryer
     async def request(
@@ -135,41 +243,77 @@ class API(APIMethods):
         files: Files | None = None,
         **kwargs: typing.Any,
     ) -> Result[Json, APIError]:
-        """Request a `JSON` response using http method `POST` and passing data & files as `multipart`."""
+        """Request a `JSON` response using http method `POST` and passing data as `JSON` body
+        or data & files as `multipart` if there are files to upload.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(method, data)
+
         response = await self.http.request_json(
             url=self.request_url + method,
             method="POST",
-            data=self.http.get_form(data=data, files=files),
+            data=self.http.get_body(data=data, files=files),
             **kwargs,
         )
 
         if response.get("ok", False) is True:
             return Ok(response["result"])
 
-        return Error(
-            APIError(
-                code=response.get("error_code", 400),
-                error=response.get("description", "Something went wrong"),
-                data=response.get("parameters", {}),
-            ),
+        error = APIError(
+            code=response.get("error_code", 400),
+            error=response.get("description", "Something went wrong"),
+            data=response.get("parameters", {}),
         )
 
-    @retryer
-    async def request_raw(
+        if self.rate_limiter is not None:
+            self.rate_limiter.feedback(method, data, error)
+
+        return Error(error)
+
+    async def _request_raw(
         self,
         method: str,
         data: Data | None = None,
         files: Files | None = None,
         **kwargs: typing.Any,
     ) -> Result[msgspec.Raw, APIError]:
-        """Request a `raw` response using http method `POST` and passing data & files as `multipart`."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(method, data)
+
         response_bytes = await self.http.request_bytes(
             url=self.request_url + method,
             method="POST",
-            data=self.http.get_form(data=data, files=files),
+            data=self.http.get_body(data=data, files=files),
             **kwargs,
         )
-        return decoder.decode(response_bytes, type=APIResponse).to_result()
+        result = decoder.decode(response_bytes, type=APIResponse).to_result()
+
+        if self.rate_limiter is not None and not is_ok(result):
+            self.rate_limiter.feedback(method, data, result.error)
+
+        return result
 
+    @retryer
+    async def request_raw(
+        self,
+        method: str,
+        data: Data | None = None,
+        files: Files | None = None,
+        **kwargs: typing.Any,
+    ) -> Result[msgspec.Raw, APIError]:
+        """Request a `raw` response using http method `POST` and passing data as `JSON` body
+        or data & files as `multipart` if there are files to upload.
+
+        If the API has an upload cache, input files which were already uploaded are sent by their `file_id`.
+        """
+        if self.upload_cache is None or not data:
+            return await self._request_raw(method, data, files, **kwargs)
+
+        return await request_with_upload_cache(
+            self.upload_cache,
+            lambda data: self._request_raw(method, data, files, **kwargs),
+            data,
+            namespace=f"{self.id}:",
+        )
 
 __all__ = ("API",)
@@ -0,0 +1,166 @@
+import asyncio
+import dataclasses
+import typing
+
+from kungfu.library.monad.result import Error, Result
+
+from telegrinder.api.error import APIError
+from telegrinder.api.rate_limiter import RateLimiter
+
+type ChatId = int | str
+type Recipients = typing.Iterable[ChatId] | typing.AsyncIterable[ChatId]
+type BroadcastMethod[T] = typing.Callable[..., typing.Awaitable[Result[T, APIError]]]
+
+DEFAULT_CONCURRENCY: typing.Final = 25
+
+
+def get_api_method_name(method: typing.Callable[..., typing.Any], /) -> str:
+    """Get the Bot API name of the bound `APIMethods` method, e.g. `sendMessage` for `send_message`."""
+    first, *rest = getattr(method, "__name__", "broadcast").split("_")
+    return first + "".join(map(str.capitalize, rest))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BroadcastResult[T]:
+    index: int
+    """Index of the recipient in the recipients iterable."""
+
+    chat_id: ChatId
+    """Chat id of the recipient."""
+
+    result: Result[T, APIError | Exception]
+    """Result of the method call."""
+
+
+class Broadcast[T]:
+    """Calls the API method for each recipient with bounded concurrency
+    and asynchronously iterates over per-recipient results in order of completion.
+
+    The method is called as `method(chat_id=chat_id, **params)`, so any bound method of `APIMethods`
+    accepting `chat_id` can be used, API errors are retried by the API `retryer`.
+    If `rate_limiter` is set, each call waits for it to respect the flood limits.
+
+    `checkpoint` is the index of the first recipient whose result has not been yielded yet,
+    all recipients before it are done. Pass it as `start_from` to resume an interrupted broadcast.
+
+    Example:
+    ```python
+    broadcast = api.broadcast(api.send_message, user_ids, text="Hello!")
+
+    async for sent in broadcast:
+        if not sent.result:
+            logger.warning("Failed to send message to {}: {}", sent.chat_id, sent.result.error)
+
+        save_checkpoint(broadcast.checkpoint)
+    ```
+    """
+
+    __slots__ = (
+        "method",
+        "recipients",
+        "params",
+        "concurrency",
+        "rate_limiter",
+        "start_from",
+        "_checkpoint",
+        "_done_indexes",
+    )
+
+    def __init__(
+        self,
+        method: BroadcastMethod[T],
+        recipients: Recipients,
+        /,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: RateLimiter | None = None,
+        start_from: int = 0,
+        **params: typing.Any,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("Broadcast concurrency must be a positive number.")
+
+        self.method = method
+        self.recipients = recipients
+        self.params = params
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.start_from = max(0, start_from)
+        self._checkpoint = self.start_from
+        self._done_indexes: set[int] = set()
+
+    def __repr__(self) -> str:
+        return "<{}: method={}, concurrency={}, checkpoint={}>".format(
+            type(self).__name__,
+            getattr(self.method, "__name__", self.method),
+            self.concurrency,
+            self._checkpoint,
+        )
+
+    @property
+    def checkpoint(self) -> int:
+        return self._checkpoint
+
+    async def _iter_recipients(self) -> typing.AsyncGenerator[tuple[int, ChatId], None]:
+        if isinstance(self.recipients, typing.AsyncIterable):
+            index = 0
+            async for chat_id in self.recipients:
+                if index >= self.start_from:
+                    yield index, chat_id
+                index += 1
+        else:
+            for index, chat_id in enumerate(self.recipients):
+                if index >= self.start_from:
+                    yield index, chat_id
+
+    async def _send(self, index: int, chat_id: ChatId, /) -> BroadcastResult[T]:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(get_api_method_name(self.method), dict(chat_id=chat_id))
+
+        try:
+            result: Result[T, APIError | Exception] = await self.method(chat_id=chat_id, **self.params)
+        except Exception as exc:
+            result = Error(exc)
+
+        return BroadcastResult(index, chat_id, result)
+
+    def _mark_done(self, index: int, /) -> None:
+        self._done_indexes.add(index)
+
+        while self._checkpoint in self._done_indexes:
+            self._done_indexes.remove(self._checkpoint)
+            self._checkpoint += 1
+
+    async def __aiter__(self) -> typing.AsyncGenerator[BroadcastResult[T], None]:
+        recipients = self._iter_recipients()
+        pending: set[asyncio.Task[BroadcastResult[T]]] = set()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        index, chat_id = await anext(recipients)
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        pending.add(asyncio.create_task(self._send(index, chat_id)))
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    sent = task.result()
+                    self._mark_done(sent.index)
+                    yield sent
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+            await recipients.aclose()
+
+
+__all__ = ("Broadcast", "BroadcastResult", "get_api_method_name")
@@ -0,0 +1,218 @@
+import asyncio
+import dataclasses
+import time
+import typing
+from http import HTTPStatus
+
+from telegrinder.api.error import APIError
+
+type ChatId = int | str
+
+DEFAULT_MAX_CHATS: typing.Final = 100_000
+DEFAULT_RETRY_AFTER: typing.Final = 5.0
+DEFAULT_COUNTED_METHODS: typing.Final = frozenset(
+    {
+        "copyMessage",
+        "copyMessages",
+        "forwardMessage",
+        "forwardMessages",
+    },
+)
+DEFAULT_EXEMPT_METHODS: typing.Final = frozenset({"sendChatAction"})
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Limit:
+    """Allows `rate` requests per `per` seconds."""
+
+    rate: int
+    per: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.rate < 1 or self.per <= 0:
+            raise ValueError("Limit rate and period must be positive numbers.")
+
+
+DEFAULT_GLOBAL_LIMIT: typing.Final = Limit(30, 1.0)
+DEFAULT_PRIVATE_CHAT_LIMIT: typing.Final = Limit(1, 1.0)
+DEFAULT_GROUP_CHAT_LIMIT: typing.Final = Limit(20, 60.0)
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at", "blocked_until", "lock")
+
+    def __init__(self, limit: Limit, now: float, /) -> None:
+        self.capacity = float(limit.rate)
+        self.refill_rate = limit.rate / limit.per
+        self.tokens = self.capacity
+        self.updated_at = now
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return "<{}: tokens={:.2f}/{}, blocked_until={}>".format(
+            type(self).__name__,
+            self.tokens,
+            self.capacity,
+            self.blocked_until,
+        )
+
+    def _refill(self, now: float, /) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def delay(self, now: float, /) -> float:
+        """Seconds to wait until the token is available."""
+        self._refill(now)
+        return max(self.blocked_until - now, (1.0 - self.tokens) / self.refill_rate, 0.0)
+
+    def consume(self, now: float, /) -> None:
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def is_idle(self, now: float, /) -> bool:
+        """Whether the bucket is not in use and is in the same state as a new one, so it can be dropped."""
+        self._refill(now)
+        return not self.lock.locked() and self.blocked_until <= now and self.tokens >= self.capacity
+
+    def penalize(self, now: float, retry_after: float, /) -> None:
+        self.tokens = 0.0
+        self.updated_at = now
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class RateLimiter:
+    """Proactive token bucket rate limiter of the outgoing API requests.
+
+    Every counted request takes a token from the bucket of its chat (keyed by `chat_id` of the method params)
+    and then from the global bucket. By default private chats are limited to 1 request per second,
+    group chats and channels to 20 requests per minute and all requests to 30 requests per second.
+
+    Waiting requests are served in FIFO order: a request waits for its chat bucket first,
+    so a busy chat doesn't hold up requests to other chats. When Telegram responds with
+    `429 Too Many Requests`, the bucket of the chat (or the global bucket, if the request has no chat)
+    is blocked for `retry_after` seconds.
+
+    Only methods which send messages count toward the limits: methods starting with `send`
+    and methods in `counted_methods` (copying and forwarding of messages), except methods in `exempt_methods`
+    (`sendChatAction`). Editing, deleting, chat administration and other methods are not counted.
+
+    At most `max_chats` chat buckets are kept, the least recently used idle buckets are dropped first.
+    Buckets in use are never dropped, so the limit may be exceeded while all of them are busy.
+    """
+
+    __slots__ = (
+        "global_limit",
+        "private_chat_limit",
+        "group_chat_limit",
+        "counted_methods",
+        "exempt_methods",
+        "max_chats",
+        "_global_bucket",
+        "_chat_buckets",
+    )
+
+    def __init__(
+        self,
+        *,
+        global_limit: Limit = DEFAULT_GLOBAL_LIMIT,
+        private_chat_limit: Limit = DEFAULT_PRIVATE_CHAT_LIMIT,
+        group_chat_limit: Limit = DEFAULT_GROUP_CHAT_LIMIT,
+        counted_methods: typing.Iterable[str] = DEFAULT_COUNTED_METHODS,
+        exempt_methods: typing.Iterable[str] = DEFAULT_EXEMPT_METHODS,
+        max_chats: int = DEFAULT_MAX_CHATS,
+    ) -> None:
+        if max_chats < 1:
+            raise ValueError("RateLimiter max_chats must be a positive number.")
+
+        self.global_limit = global_limit
+        self.private_chat_limit = private_chat_limit
+        self.group_chat_limit = group_chat_limit
+        self.counted_methods = frozenset(counted_methods)
+        self.exempt_methods = frozenset(exempt_methods)
+        self.max_chats = max_chats
+        self._global_bucket = TokenBucket(global_limit, time.monotonic())
+        # Ordered from the least recently used bucket to the most recently used one.
+        self._chat_buckets: dict[ChatId, TokenBucket] = {}
+
+    def __repr__(self) -> str:
+        return "<{}: global_limit={!r}, private_chat_limit={!r}, group_chat_limit={!r}, chats={}>".format(
+            type(self).__name__,
+            self.global_limit,
+            self.private_chat_limit,
+            self.group_chat_limit,
+            len(self._chat_buckets),
+        )
+
+    @staticmethod
+    def get_chat_id(data: dict[str, typing.Any] | None, /) -> ChatId | None:
+        if not data or (chat_id := data.get("chat_id")) is None:
+            return None
+        return chat_id if isinstance(chat_id, int | str) else None
+
+    def is_counted(self, method: str, /) -> bool:
+        return (method.startswith("send") or method in self.counted_methods) and method not in self.exempt_methods
+
+    def _drop_idle_buckets(self, now: float, /) -> None:
+        excess = len(self._chat_buckets) - self.max_chats + 1
+        idle: list[ChatId] = []
+
+        for chat_id, bucket in self._chat_buckets.items():
+            if bucket.is_idle(now):
+                idle.append(chat_id)
+
+                if len(idle) >= excess:
+                    break
+
+        for chat_id in idle:
+            del self._chat_buckets[chat_id]
+
+    def _get_chat_bucket(self, chat_id: ChatId, now: float, /) -> TokenBucket:
+        if (bucket := self._chat_buckets.pop(chat_id, None)) is None:
+            if len(self._chat_buckets) >= self.max_chats:
+                self._drop_idle_buckets(now)
+
+            limit = (
+                self.private_chat_limit
+                if isinstance(chat_id, int) and chat_id > 0
+                else self.group_chat_limit
+            )
+            bucket = TokenBucket(limit, now)
+
+        self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    @staticmethod
+    async def _take(bucket: TokenBucket, /) -> None:
+        async with bucket.lock:
+            while (delay := bucket.delay(time.monotonic())) > 0:
+                await asyncio.sleep(delay)
+            bucket.consume(time.monotonic())
+
+    async def acquire(self, method: str, data: dict[str, typing.Any] | None = None, /) -> None:
+        """Wait until the request can be sent without exceeding the limits."""
+        if not self.is_counted(method):
+            return
+
+        if (chat_id := self.get_chat_id(data)) is not None:
+            await self._take(self._get_chat_bucket(chat_id, time.monotonic()))
+
+        await self._take(self._global_bucket)
+
+    def feedback(self, method: str, data: dict[str, typing.Any] | None, error: APIError, /) -> None:
+        """Adapt to the error returned by Telegram: on `429 Too Many Requests`
+        block the bucket for `retry_after` seconds.
+        """
+        if error.code != HTTPStatus.TOO_MANY_REQUESTS:
+            return
+
+        now = time.monotonic()
+        retry_after = float(error.retry_after.unwrap_or(DEFAULT_RETRY_AFTER))
+
+        if (chat_id := self.get_chat_id(data)) is not None:
+            self._get_chat_bucket(chat_id, now).penalize(now, retry_after)
+        else:
+            self._global_bucket.penalize(now, retry_after)
+
+
+__all__ = ("Limit", "RateLimiter", "TokenBucket")
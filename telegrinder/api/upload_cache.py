@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import pathlib
+import sqlite3
+import threading
+import typing
+from abc import ABC, abstractmethod
+
+import msgspec
+from kungfu.library.misc import is_ok
+from kungfu.library.monad.result import Result
+
+from telegrinder.api.error import APIError
+from telegrinder.modules import logger
+from telegrinder.tools.limited_dict import LimitedDict
+from telegrinder.types.input_file import InputFile, PathInputFile
+
+type Data = dict[str, typing.Any]
+type SendRequest = typing.Callable[[Data], typing.Awaitable[Result[msgspec.Raw, APIError]]]
+
+DEFAULT_MAX_SIZE: typing.Final = 10_000
+DEFAULT_SQLITE_PATH: typing.Final = "telegrinder_upload_cache.sqlite3"
+UPLOAD_FIELDS: typing.Final = frozenset(
+    {"animation", "audio", "document", "photo", "sticker", "video", "video_note", "voice"},
+)
+INVALID_FILE_ID_ERRORS: typing.Final = ("file identifier", "file_id", "FILE_REFERENCE", "can't use file of type")
+
+
+class ABCUploadCache(ABC):
+    """Storage of `file_id`s of the uploaded files keyed by the file key."""
+
+    @abstractmethod
+    async def get(self, key: str, /) -> str | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, file_id: str, /) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str, /) -> None:
+        pass
+
+
+class MemoryUploadCache(ABCUploadCache):
+    __slots__ = ("storage",)
+
+    def __init__(self, *, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.storage: LimitedDict[str, str] = LimitedDict(maxlimit=max_size)
+
+    def __repr__(self) -> str:
+        return "<{}: size={}, max_size={}>".format(type(self).__name__, len(self.storage), self.storage.maxlimit)
+
+    async def get(self, key: str, /) -> str | None:
+        return self.storage.get(key)
+
+    async def set(self, key: str, file_id: str, /) -> None:
+        self.storage[key] = file_id
+
+    async def delete(self, key: str, /) -> None:
+        self.storage.pop(key, None)
+
+
+class SQLiteUploadCache(ABCUploadCache):
+    """On-disk upload cache, queries are run in a thread to not block the event loop."""
+
+    __slots__ = ("path", "_connection", "_lock")
+
+    def __init__(self, path: str | pathlib.Path = DEFAULT_SQLITE_PATH) -> None:
+        self.path = pathlib.Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "<{}: path={!r}>".format(type(self).__name__, str(self.path))
+
+    def _execute(self, query: str, parameters: tuple[str, ...], /) -> list[tuple[typing.Any, ...]]:
+        with self._lock:
+            if self._connection is None:
+                self._connection = sqlite3.connect(self.path, check_same_thread=False)
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS upload_cache (key TEXT PRIMARY KEY, file_id TEXT NOT NULL)",
+                )
+
+            rows = self._connection.execute(query, parameters).fetchall()
+            self._connection.commit()
+            return rows
+
+    async def get(self, key: str, /) -> str | None:
+        rows = await asyncio.to_thread(self._execute, "SELECT file_id FROM upload_cache WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    async def set(self, key: str, file_id: str, /) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO upload_cache (key, file_id) VALUES (?, ?)",
+            (key, file_id),
+        )
+
+    async def delete(self, key: str, /) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM upload_cache WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def get_upload_key(input_file: InputFile, /) -> str:
+    """Get the key of the input file: path, modification time and size for the path-backed files,
+    otherwise `sha256` of the content.
+    """
+    if isinstance(input_file, PathInputFile):
+        stat = input_file.path.stat()
+        return "path:{}:{}:{}".format(input_file.path.resolve(), stat.st_mtime_ns, stat.st_size)
+    return "sha256:" + hashlib.sha256(input_file.data).hexdigest()
+
+
+def get_upload_keys(data: Data, /, *, namespace: str = "") -> dict[str, str]:
+    """Get the cache keys of the input files of the request data by their fields.
+    The field is a part of the key, since a `file_id` can only be reused as media of the same type.
+    Path-backed files are stat'ed and other files are hashed, so it should be run in a thread.
+    """
+    return {
+        field: "{}{}:{}".format(namespace, field, get_upload_key(value))
+        for field, value in data.items()
+        if field in UPLOAD_FIELDS and isinstance(value, InputFile)
+    }
+
+
+def get_uploaded_file_id(result: typing.Any, field: str, /) -> str | None:
+    if not isinstance(result, dict) or (media := result.get(field)) is None:
+        return None
+
+    if isinstance(media, list):
+        # Photo sizes, the last one is the original photo.
+        media = media[-1] if media else None
+
+    return media.get("file_id") if isinstance(media, dict) else None
+
+
+def is_invalid_file_id_error(error: APIError, /) -> bool:
+    return error.code == 400 and any(message in error.error for message in INVALID_FILE_ID_ERRORS)
+
+
+async def request_with_upload_cache(
+    cache: ABCUploadCache,
+    send: SendRequest,
+    data: Data,
+    /,
+    *,
+    namespace: str = "",
+) -> Result[msgspec.Raw, APIError]:
+    """Send the request, substituting the input files already uploaded to Telegram with their cached `file_id`s
+    and caching `file_id`s of the newly uploaded files. If Telegram rejects a cached `file_id`,
+    it's invalidated and the request is resent with the original files.
+    """
+    if not any(field in UPLOAD_FIELDS and isinstance(value, InputFile) for field, value in data.items()):
+        return await send(data)
+
+    keys = await asyncio.to_thread(get_upload_keys, data, namespace=namespace)
+
+    cached_data = dict(data)
+    substituted: list[str] = []
+
+    for field, key in keys.items():
+        if (file_id := await cache.get(key)) is not None:
+            cached_data[field] = file_id
+            substituted.append(field)
+
+    result = await send(cached_data)
+
+    if substituted and not is_ok(result) and is_invalid_file_id_error(result.error):
+        logger.debug("Cached file_id was rejected ({}), uploading files again", result.error)
+
+        for field in substituted:
+            await cache.delete(keys[field])
+
+        substituted.clear()
+        result = await send(data)
+
+    if is_ok(result) and len(substituted) != len(keys):
+        message = msgspec.json.decode(result.value)
+
+        for field, key in keys.items():
+            if field not in substituted and (file_id := get_uploaded_file_id(message, field)) is not None:
+                await cache.set(key, file_id)
+
+    return result
+
+
+__all__ = (
+    "ABCUploadCache",
+    "MemoryUploadCache",
+    "SQLiteUploadCache",
+    "get_upload_key",
+    "get_upload_keys",
+    "request_with_upload_cache",
+)
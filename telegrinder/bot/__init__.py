@@ -51,6 +51,7 @@ from telegrinder.bot.dispatch import (
     PreCheckoutQueryReturnManager,
     RawEventView,
     Router,
+    StatePrefetchMiddleware,
     StickerReplyHandler,
     VideoReplyHandler,
     View,
@@ -60,11 +61,13 @@ from telegrinder.bot.dispatch import (
     action,
     register_manager,
 )
-from telegrinder.bot.polling import ABCPolling, Polling
+from telegrinder.bot.executor import ABCExecutor, Executor, ExecutorMetrics, ShardedExecutor
+from telegrinder.bot.polling import ABCPolling, Polling, Webhook
 from telegrinder.bot.rules import ABCRule
 
 __all__ = (
     "ABCDispatch",
+    "ABCExecutor",
     "ABCHandler",
     "ABCMiddleware",
     "ABCPolling",
@@ -90,6 +93,8 @@ __all__ = (
     "ErrorView",
     "EventModelView",
     "EventView",
+    "Executor",
+    "ExecutorMetrics",
     "FilterMiddleware",
     "FuncHandler",
     "InlineQueryCute",
@@ -114,7 +119,9 @@ __all__ = (
     "PreCheckoutQueryReturnManager",
     "RawEventView",
     "Router",
+    "ShardedExecutor",
     "ShippingQueryCute",
+    "StatePrefetchMiddleware",
     "StickerReplyHandler",
     "Telegrinder",
     "UpdateCute",
@@ -123,6 +130,7 @@ __all__ = (
     "ViewBox",
     "ViewMiddlewareBox",
     "WaiterMiddleware",
+    "Webhook",
     "action",
     "register_manager",
 )
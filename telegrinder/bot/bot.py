@@ -1,19 +1,38 @@
+import asyncio
 import typing
 
 from telegrinder.api.api import API
 from telegrinder.bot.dispatch import dispatch as dp
 from telegrinder.bot.dispatch.abc import ABCDispatch
+from telegrinder.bot.executor.abc import ABCExecutor
+from telegrinder.bot.executor.executor import Executor
 from telegrinder.bot.polling import polling as pg
 from telegrinder.bot.polling.abc import ABCPolling
 from telegrinder.modules import logger
 from telegrinder.tools.global_context.builtin_context import TelegrinderContext
 from telegrinder.tools.lifespan import Lifespan
 from telegrinder.tools.loop_wrapper import LoopWrapper
+from telegrinder.types.enums import UpdateType
 
 TELEGRINDER_CONTEXT: typing.Final = TelegrinderContext()
+DEFAULT_SHUTDOWN_TIMEOUT: typing.Final = 10.0
 
 
 class Telegrinder[Dispatch: ABCDispatch = dp.Dispatch, Polling: ABCPolling = pg.Polling]:
+    """Bot running the polling and feeding updates to the dispatch via the executor.
+
+    If `auto_allowed_updates` is True, the polling requests only the update types which the dispatch
+    can handle (see `Dispatch.get_allowed_updates`), restricted to the update types the polling
+    was configured with. They are computed at startup and checked after each batch of updates,
+    so loaded routers and registered waiter hashers are taken into account (`Webhook` registers itself
+    again when they change). `Dispatch` caches them until its routers or handlers change, so nothing
+    is recomputed otherwise. Updates of an event view which has no handlers can only be awaited
+    via a waiter if its hasher is already registered.
+
+    On shutdown of the loop wrapper the polling is stopped and the executor is given `shutdown_timeout`
+    seconds to feed the updates which were already submitted, then it is closed.
+    """
+
     def __init__(
         self,
         api: API,
@@ -21,18 +40,27 @@ class Telegrinder[Dispatch: ABCDispatch = dp.Dispatch, Polling: ABCPolling = pg.
         dispatch: Dispatch | None = None,
         polling: Polling | None = None,
         loop_wrapper: LoopWrapper | None = None,
+        executor: ABCExecutor | None = None,
+        auto_allowed_updates: bool = False,
+        shutdown_timeout: float | None = DEFAULT_SHUTDOWN_TIMEOUT,
     ) -> None:
         self.api = api
         self.dispatch = typing.cast("Dispatch", dispatch or dp.Dispatch())
         self.polling = typing.cast("Polling", polling or pg.Polling(api))
         self.loop_wrapper = loop_wrapper or TELEGRINDER_CONTEXT.loop_wrapper
+        self.executor = executor or Executor(loop_wrapper=self.loop_wrapper)
+        self.auto_allowed_updates = auto_allowed_updates
+        self.shutdown_timeout = shutdown_timeout
+        self._polling_allowed_updates = frozenset(self.polling.allowed_updates)
+        self._dispatch_allowed_updates: list[UpdateType] | None = None
 
     def __repr__(self) -> str:
-        return "<{}: api={!r}, dispatch={!r}, polling={!r}, loop_wrapper={!r}>".format(
+        return "<{}: api={!r}, dispatch={!r}, polling={!r}, executor={!r}, loop_wrapper={!r}>".format(
             type(self).__name__,
             self.api,
             self.dispatch,
             self.polling,
+            self.executor,
             self.loop_wrapper,
         )
 
@@ -44,6 +72,33 @@ class Telegrinder[Dispatch: ABCDispatch = dp.Dispatch, Polling: ABCPolling = pg.
     def lifespan(self) -> Lifespan:
         return self.loop_wrapper.lifespan
 
+    def update_allowed_updates(self) -> None:
+        if (dispatch_allowed_updates := self.dispatch.get_allowed_updates()) is self._dispatch_allowed_updates:
+            return
+
+        self._dispatch_allowed_updates = dispatch_allowed_updates
+        allowed_updates = [
+            update_type for update_type in dispatch_allowed_updates if update_type in self._polling_allowed_updates
+        ]
+
+        if allowed_updates != self.polling.allowed_updates:
+            logger.debug("Polling allowed updates: {}", ", ".join(allowed_updates))
+            self.polling.allowed_updates = allowed_updates
+
+    async def shutdown_executor(self) -> None:
+        self.polling.stop()
+
+        try:
+            async with asyncio.timeout(self.shutdown_timeout):
+                await self.executor.join()
+        except TimeoutError:
+            logger.warning(
+                "Executor didn't feed the submitted updates in {} seconds, dropping them",
+                self.shutdown_timeout,
+            )
+        finally:
+            await self.executor.close()
+
     async def drop_pending_updates(self) -> None:
         logger.debug("Dropping pending updates")
         await self.api.delete_webhook(drop_pending_updates=True)
@@ -56,14 +111,21 @@ class Telegrinder[Dispatch: ABCDispatch = dp.Dispatch, Polling: ABCPolling = pg.
     ) -> None:
         self.polling.offset = offset
 
+        if self.auto_allowed_updates:
+            self.update_allowed_updates()
+
         async def listen_polling() -> None:
             if skip_updates:
                 await self.drop_pending_updates()
 
             async for updates in self.polling.listen():
-                for update in updates:
-                    self.loop_wrapper.add_task(self.dispatch.feed(self.api, update))
+                if self.auto_allowed_updates:
+                    self.update_allowed_updates()
+
+                if updates:
+                    await self.executor.submit_batch(self.dispatch, self.api, updates)
 
+        self.lifespan.add_shutdown_task(self.shutdown_executor)
         self.loop_wrapper.add_task(listen_polling())
 
     def run_forever(self, *, offset: int = 0, skip_updates: bool = False) -> None:
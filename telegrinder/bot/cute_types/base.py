@@ -13,6 +13,7 @@ from telegrinder.api.api import API
 from telegrinder.bot.dispatch.context import Context
 from telegrinder.tools.magic.shortcut import shortcut
 from telegrinder.types.objects import Update
+from telegrinder.types.utils.lazy_option import LazyOption, LazySome
 
 BOUND_API_KEY: typing.Final = "bound_api"
 BOUND_UPDATE_KEY: typing.Final = "bound_update"
@@ -122,6 +123,18 @@ def to_cute(
     return wrap_value(cute, cute_cls.__annotations__[field]) if is_wrapped_value else cute
 
 
+def to_lazy_cute(
+    cute_cls: type[BaseCute],
+    field: str,
+    value: typing.Any,
+    bound_api: API,
+) -> typing.Any:
+    """Convert the value of the `LazyOption` field to the cute on first access, like the decoder does."""
+    if not isinstance(value, Some) or typing.get_origin(cute_cls.__annotations__[field]) is not LazyOption:
+        return to_cute(cute_cls, field, value, bound_api)
+    return LazySome(lambda: to_cute(cute_cls, field, value, bound_api).unwrap())
+
+
 class BaseCute[T: Model = typing.Any](Model):
     def __init_subclass__(cls, *args: typing.Any, **kwargs: typing.Any) -> None:
         cls.__is_resolved_annotations__ = False
@@ -142,6 +155,17 @@ class BaseCute[T: Model = typing.Any](Model):
 
     @classmethod
     def from_update(cls, update: Update, bound_api: API) -> typing.Self:
+        """Create the cute object from the model, binding the API to it. Fields annotated
+        with `LazyOption` are converted to the cute objects on first access.
+
+        If the update is already of this cute type, the API is bound to the same object in place
+        and the object itself is returned, so it's shared with the caller.
+        """
+        if type(update) is cls:
+            # Already cute, only the API is bound.
+            bound = typing.cast("typing.Self", update)
+            return bound.bind(update, bound_api) if isinstance(update, Update) else bound._bind_api(bound_api)
+
         if not cls.__is_resolved_annotations__:
             cls.__is_resolved_annotations__ = True
             cls.__annotations__ = get_class_annotations(cls)
@@ -152,7 +176,7 @@ class BaseCute[T: Model = typing.Any](Model):
         cute: typing.Self = type(Model).model_initialize(  # type: ignore
             cls,
             **{
-                field: to_cute(cls, field, value, bound_api) if field in cls.__cute_annotations__ else value
+                field: to_lazy_cute(cls, field, value, bound_api) if field in cls.__cute_annotations__ else value
                 for field, value in update.to_dict().items()
             },
         )
@@ -14,6 +14,7 @@ from telegrinder.bot.cute_types.utils import MediaType, build_html, compose_reac
 from telegrinder.tools.magic.descriptors import additional_property
 from telegrinder.types import *
 from telegrinder.types.utils import get_params
+from telegrinder.types.utils.lazy_option import LazyOption
 from telegrinder.types.utils.lazy_result import lazy_result
 
 if typing.TYPE_CHECKING:
@@ -2533,21 +2534,28 @@ class MessageCute(
     Message,
     kw_only=True,
 ):
-    reply_to_message: Option[MessageCute] = field(
+    reply_to_message: LazyOption[MessageCute] = field(
         default=...,
         converter=From["MessageCute | None"],
     )
     """Optional. For replies in the same chat and message thread, the original
     message. Note that the Message object in this field will not contain further
-    reply_to_message fields even if it itself is a reply."""
+    reply_to_message fields even if it itself is a reply. Created on first access."""
 
-    pinned_message: Option[Sum[MessageCute, InaccessibleMessage]] = field(
+    external_reply: LazyOption[ExternalReplyInfo] = field(
+        default=...,
+        converter=From["ExternalReplyInfo | None"],
+    )
+    """Optional. Information about the message that is being replied to, which
+    may come from another chat or forum topic. Created on first access."""
+
+    pinned_message: LazyOption[Sum[MessageCute, InaccessibleMessage]] = field(
         default=...,
         converter=From["MessageCute | InaccessibleMessage | None"],
     )
     """Optional. Specified message was pinned. Note that the Message object in
     this field will not contain further reply_to_message fields even if it
-    itself is a reply."""
+    itself is a reply. Created on first access."""
 
     @cached_property
     def html_text(self) -> option.Option[str]:
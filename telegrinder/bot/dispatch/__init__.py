@@ -18,6 +18,7 @@ from telegrinder.bot.dispatch.middleware import (
     FilterMiddleware,
     MediaGroupMiddleware,
     MiddlewareBox,
+    StatePrefetchMiddleware,
     ViewMiddlewareBox,
     WaiterMiddleware,
 )
@@ -74,6 +75,7 @@ __all__ = (
     "PreCheckoutQueryReturnManager",
     "RawEventView",
     "Router",
+    "StatePrefetchMiddleware",
     "StickerReplyHandler",
     "TelegrinderContext",
     "VideoReplyHandler",
@@ -1,3 +1,4 @@
+import asyncio
 import importlib.util as importlib_util
 import os
 import pathlib
@@ -6,6 +7,9 @@ import typing
 from abc import ABC, abstractmethod
 
 from telegrinder.api.api import API
+from telegrinder.bot.dispatch.batch import group_updates
+from telegrinder.modules import logger
+from telegrinder.types.enums import UpdateType
 from telegrinder.types.objects import Update
 
 
@@ -22,6 +26,54 @@ class ABCDispatch(ABC):
     def load(self, external: typing.Self) -> None:
         pass
 
+    async def prepare_batch(self, api: API, updates: typing.Sequence[Update]) -> None:
+        """Prepare the dispatch for feeding the batch of updates, called once per batch before the updates are fed."""
+
+    async def feed_safely(self, api: API, updates: typing.Iterable[Update]) -> None:
+        """Feed the updates one after another, an exception of one update is logged and doesn't affect the others."""
+        for update in updates:
+            try:
+                await self.feed(api, update)
+            except Exception:
+                logger.exception("Traceback message below:")
+
+    async def feed_batch(self, api: API, updates: typing.Sequence[Update], *, ordered: bool = False) -> None:
+        """Feed the batch of updates (e.g. the result of one `getUpdates` request), the batch is prepared first.
+
+        By default the updates are fed concurrently. If `ordered` is True, the updates are grouped by the chat
+        (or the user) of the incoming event: updates of the same chat are fed one after another, different chats
+        are fed concurrently. An exception of one update (or of one group of updates) is logged
+        and doesn't affect the others.
+
+        In the ordered mode, a handler waiting for the next update of the same chat (e.g. `dp.message.wait(...)`)
+        blocks the rest of the chat's updates in the batch, including the awaited one, until the waiter expires.
+        """
+        if not updates:
+            return
+
+        await self.prepare_batch(api, updates)
+        groups = group_updates(updates) if ordered else [(update,) for update in updates]
+
+        if len(groups) == 1:
+            await self.feed_safely(api, groups[0])
+            return
+
+        # Unlike a task group, `gather` doesn't cancel the other groups if a base exception escapes
+        # `feed_safely` of one of them (exceptions are already logged by `feed_safely`).
+        results = await asyncio.gather(*(self.feed_safely(api, group) for group in groups), return_exceptions=True)
+
+        for group, result in zip(groups, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Feeding updates {} was interrupted: {!r}",
+                    ", ".join(str(update.update_id) for update in group),
+                    result,
+                )
+
+    def get_allowed_updates(self) -> list[UpdateType]:
+        """Get update types which the dispatch can handle, all update types by default."""
+        return list(UpdateType)
+
     def load_many(self, *externals: typing.Self) -> None:
         for external in externals:
             self.load(external)
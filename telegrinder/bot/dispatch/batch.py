@@ -0,0 +1,77 @@
+import typing
+
+from kungfu.library.monad.option import Nothing, Some
+
+from telegrinder.types.objects import Update
+
+type Key = typing.Hashable
+type KeyFunction = typing.Callable[[Update], Key | None]
+
+KEY_FIELDS: typing.Final = ("chat", "message", "from_", "user")
+SENDER_FIELDS: typing.Final = ("from_", "user")
+
+
+def _unwrap(value: typing.Any, /) -> typing.Any:
+    if isinstance(value, Some):
+        return value.unwrap()
+    if isinstance(value, Nothing):
+        return None
+    return value
+
+
+def get_update_key(update: Update, /) -> int | None:
+    """Get the key of the update's incoming event: the chat id if the event belongs to a chat,
+    otherwise the id of the user, otherwise None (e.g. for `poll` updates).
+    """
+    event = update.incoming_update
+
+    for field in KEY_FIELDS:
+        obj = _unwrap(getattr(event, field, None))
+
+        if obj is None:
+            continue
+
+        if field == "message":
+            obj = _unwrap(getattr(obj, "chat", None))
+
+        if (obj_id := getattr(obj, "id", None)) is not None:
+            return obj_id
+
+    return None
+
+
+def get_sender_id(update: Update, /) -> int | None:
+    """Get the id of the user who sent the update's incoming event, None if the event has no sender."""
+    event = update.incoming_update
+
+    for field in SENDER_FIELDS:
+        if (user := _unwrap(getattr(event, field, None))) is not None:
+            return user.id
+
+    return None
+
+
+def group_updates(
+    updates: typing.Iterable[Update],
+    /,
+    *,
+    key_function: KeyFunction = get_update_key,
+) -> list[list[Update]]:
+    """Group the updates by their key, keeping the order of the updates within a group.
+    Groups are ordered by their first update, each update without a key is a group on its own.
+    """
+    groups: list[list[Update]] = []
+    keyed_groups: dict[Key, list[Update]] = {}
+
+    for update in updates:
+        if (key := key_function(update)) is None:
+            groups.append([update])
+        elif (group := keyed_groups.get(key)) is not None:
+            group.append(update)
+        else:
+            groups.append(keyed_groups.setdefault(key, [update]))
+
+    return groups
+
+
+__all__ = ("Key", "KeyFunction", "get_sender_id", "get_update_key", "group_updates")
@@ -13,24 +13,67 @@ if typing.TYPE_CHECKING:
     from telegrinder.api.api import API
     from telegrinder.bot.cute_types.update import UpdateCute
     from telegrinder.bot.dispatch.router.base import Router
+    from telegrinder.bot.rules.abc import ABCRule
+    from telegrinder.tools.state_storage.cache import StateCache
     from telegrinder.types.objects import Update
 
 type Key = str
 type AnyValue = typing.Any
 
 SELF_CONTEXT_KEYS: typing.Final = frozenset(("context", "ctx"))
+MISSING: typing.Final = object()
 
 
-class Context(Externals):
-    """Low level per event context storage."""
+class ContextField[T]:
+    """Data descriptor of the context key, which is looked up directly in the context mapping."""
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, default: typing.Any = MISSING) -> None:
+        self.name = ""
+        self.default = default
+
+    def __set_name__(self, owner: type[Context], name: str, /) -> None:
+        self.name = name
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type[Context], /) -> typing.Self: ...
+
+    @typing.overload
+    def __get__(self, instance: Context, owner: type[Context], /) -> T: ...
 
-    api: API
-    update: Update
-    raw_update: Update
-    update_cute: UpdateCute
-    per_event_scope: Scope
-    exceptions_update: dict[Router, Exception]
-    exception_update: Option[Exception] = NOTHING
+    def __get__(self, instance: Context | None, owner: type[Context], /) -> typing.Self | T:
+        if instance is None:
+            return self
+
+        try:
+            return dict.__getitem__(instance, self.name)
+        except KeyError:
+            if self.default is not MISSING:
+                return self.default
+            raise AttributeError(self.name) from None
+
+    def __set__(self, instance: Context, value: T, /) -> None:
+        instance[self.name] = value
+
+
+class Context(Externals):
+    """Low level per event context storage.
+
+    Keys are accessible as attributes. Event roots are data descriptors, so they are looked up
+    without going through `__getattr__`, other keys are looked up only if there is no such attribute.
+    A key named like a method of the context (e.g. `get` or `items`) is accessible only as `context[key]`.
+    """
+
+    api: ContextField[API] = ContextField()
+    update: ContextField[Update] = ContextField()
+    raw_update: ContextField[Update] = ContextField()
+    update_cute: ContextField[UpdateCute] = ContextField()
+    per_event_scope: ContextField[Scope] = ContextField()
+    exceptions_update: ContextField[dict[Router, Exception]] = ContextField()
+    rule_memo: ContextField[dict[int, tuple[ABCRule, bool]]] = ContextField()
+    state_cache: ContextField[StateCache] = ContextField()
+    exception_update: ContextField[Option[Exception]] = ContextField(NOTHING)
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -52,7 +95,7 @@ class Context(Externals):
     def __repr__(self) -> str:
         return "{}({})".format(
             type(self).__name__,
-            ", ".join(f"{k}={repr(v) if v is not self else '<self>'}" for k, v in self.items()),
+            ", ".join(f"{k}={repr(v) if v is not self else '<self>'}" for k, v in dict.items(self)),
         )
 
     def __setitem__(self, __key: Key, __value: AnyValue) -> None:
@@ -67,11 +110,13 @@ class Context(Externals):
     def __setattr__(self, __name: str, __value: AnyValue) -> None:
         self.__setitem__(__name, __value)
 
-    def __getattribute__(self, __name: str) -> AnyValue:
+    def __getattr__(self, __name: str) -> AnyValue:
         try:
             return self[__name]
         except KeyError:
-            return super().__getattribute__(__name)
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(type(self).__name__, __name),
+            ) from None
 
     def __delattr__(self, __name: str) -> None:
         self.__delitem__(__name)
@@ -98,6 +143,7 @@ class Context(Externals):
         /,
     ) -> typing.Self:
         from telegrinder.bot.cute_types.update import UpdateCute
+        from telegrinder.tools.state_storage.cache import StateCache
 
         for key, value in {
             "api": api,
@@ -110,6 +156,8 @@ class Context(Externals):
             ),
             "per_event_scope": per_event_scope,
             "exceptions_update": {},
+            "rule_memo": {},
+            "state_cache": StateCache(),
         }.items():
             self[key] = value
 
@@ -120,7 +168,9 @@ class Context(Externals):
         return self
 
     def copy(self) -> Context:
-        return Context(self)
+        context = dict.__new__(Context)
+        Externals.__init__(context, self)
+        return context
 
     def set(self, key: Key, value: AnyValue) -> None:
         self[key] = value
@@ -148,4 +198,4 @@ class Context(Externals):
         del self[key]
 
 
-__all__ = ("Context",)
+__all__ = ("Context", "ContextField")
@@ -11,22 +11,24 @@ from telegrinder.bot.dispatch.middleware.abc import ABCMiddleware, run_post_midd
 from telegrinder.bot.dispatch.middleware.box import MiddlewareBox
 from telegrinder.bot.dispatch.middleware.waiter import WaiterMiddleware
 from telegrinder.bot.dispatch.router.base import Router
-from telegrinder.bot.dispatch.view.base import ErrorView, View
+from telegrinder.bot.dispatch.view.base import ErrorView, EventView, View
 from telegrinder.bot.dispatch.view.box import ViewBox
 from telegrinder.bot.rules.abc import ABCRule
-from telegrinder.modules import log_buffer, logger
+from telegrinder.modules import NULL_CONTEXT, log_buffer, logger
 from telegrinder.node.scope import create_per_event_scope
 from telegrinder.scenario.checkbox import Checkbox
 from telegrinder.scenario.choice import Choice
 from telegrinder.tools.fullname import fullname
 from telegrinder.tools.global_context import TelegrinderContext
+from telegrinder.tools.waiter_machine.hasher.message import MESSAGE_UPDATE_TYPES
 from telegrinder.tools.waiter_machine.machine import (
     ContextUnpackProto,
     HasherWithData,
     WaiterMachine,
     unpack_to_context,
 )
-from telegrinder.types.objects import Update
+from telegrinder.types.enums import UpdateType
+from telegrinder.types.objects import Message, Update
 
 if typing.TYPE_CHECKING:
     import datetime
@@ -35,8 +37,9 @@ if typing.TYPE_CHECKING:
 
     from telegrinder.bot.cute_types.base import BaseCute
     from telegrinder.bot.dispatch.middleware.filter import FilterMiddleware
-    from telegrinder.bot.dispatch.view.base import EventView, RawEventView, View
+    from telegrinder.bot.dispatch.view.base import EventModelView, EventView, RawEventView, View
     from telegrinder.bot.dispatch.view.media_group import MediaGroupView
+    from telegrinder.bot.polling.prefilter import Prefilter
     from telegrinder.tools.lifespan import Lifespan
     from telegrinder.tools.waiter_machine.actions import WaiterActions
     from telegrinder.tools.waiter_machine.hasher.hasher import Hasher
@@ -47,9 +50,15 @@ if typing.TYPE_CHECKING:
         error_handler: typing.NotRequired[E]
         waiter_machine: typing.NotRequired[WaiterMachine]
         middleware_box: typing.NotRequired[MiddlewareBox]
+        prefilter: typing.NotRequired[Prefilter]
 
 
 NANOSECONDS_PER_MILLISECOND: typing.Final = 1_000_000_000
+ROUTING_EXCEPTIONS_MESSAGE: typing.Final = "Unhandled routing exceptions:"
+
+type RoutingKey = tuple[UpdateType, type[typing.Any]]
+type RoutingTarget = tuple[Router, tuple[EventView | EventModelView[typing.Any], ...]]
+type AllowedUpdatesKey = tuple[tuple[Router, ...], tuple[bool, ...], bool, frozenset[Hasher[typing.Any, typing.Any]]]
 
 
 class _ViewGetter:  # type: ignore
@@ -159,7 +168,11 @@ class Dispatch[
     error_handler: ErrorHandler
     middlewares: T
     waiter_machine: WaiterMachine
+    prefilter: Prefilter | None
     _routers: deque[Router] | None = None
+    _routing_index: dict[RoutingKey, tuple[RoutingTarget, ...]]
+    _indexed_routers: tuple[Router, ...]
+    _allowed_updates: tuple[AllowedUpdatesKey, list[UpdateType]] | None = None
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -178,12 +191,16 @@ class Dispatch[
         waiter_machine: WaiterMachine | None = None,
         error_handler: ErrorHandler | None = None,
         middleware_box: MiddlewareBox | None = None,
+        prefilter: Prefilter | None = None,
     ) -> None:
         self.global_context = TelegrinderContext()
+        self.prefilter = prefilter
         self.main_router = router or Router(name=name)  # type: ignore
         self.error_handler = error_handler or ErrorView()  # type: ignore
         self.global_scope = self.global_context.node_global_scope
         self.loop_wrapper = self.global_context.loop_wrapper
+        self._routing_index = {}
+        self._indexed_routers = ()
 
         if waiter_machine is None:
             waiter = (
@@ -292,10 +309,11 @@ class Dispatch[
         update: Update,
         context: Context,
     ) -> None:
-        logger.debug(
-            "Processing error views with exceptions [{}]",
-            ", ".join(fullname(e) for e in context.exceptions_update.values()),
-        )
+        if logger.is_enabled("DEBUG"):
+            logger.debug(
+                "Processing error views with exceptions [{}]",
+                ", ".join(fullname(e) for e in context.exceptions_update.values()),
+            )
 
         async with self.loop_wrapper.create_task_group() as task_group:
             for router, exception in context.exceptions_update.items():
@@ -309,16 +327,120 @@ class Dispatch[
                     ),
                 )
 
+    def _get_allowed_updates_key(self) -> AllowedUpdatesKey:
+        routers = tuple(self.routers)
+        return (
+            routers,
+            tuple(bool(view) for router in routers for view in (router.raw, *router.event_views.values())),
+            bool(self.middlewares.user_middlewares),
+            frozenset(self.middlewares.waiter.hashers),
+        )
+
+    def get_allowed_updates(self) -> list[UpdateType]:
+        """Get update types which can be handled by the non-empty views of the routers
+        or awaited by the hashers of the dispatch waiter middleware.
+
+        All update types are allowed if the dispatch has user middlewares or a non-empty raw view,
+        since they can handle any update. The same list is returned until the routers, emptiness
+        of their views, user middlewares or waiter hashers are changed.
+        """
+        key = self._get_allowed_updates_key()
+
+        if self._allowed_updates is None or self._allowed_updates[0] != key:
+            self._allowed_updates = (key, self._compute_allowed_updates())
+
+        return self._allowed_updates[1]
+
+    def _compute_allowed_updates(self) -> list[UpdateType]:
+        all_update_types = list(UpdateType)
+
+        if self.middlewares.user_middlewares:
+            return all_update_types
+
+        update_types: set[UpdateType] = set()
+
+        for router in self.routers:
+            if router.raw:
+                return all_update_types
+
+            for view in router.event_views.values():
+                if not view:
+                    continue
+
+                if isinstance(view, EventView):
+                    update_types.add(view.update_type)
+                elif issubclass(view.model, Message):
+                    update_types.update(MESSAGE_UPDATE_TYPES)
+                else:
+                    return all_update_types
+
+        for hasher in self.middlewares.waiter.hashers:
+            if not hasher.update_types:
+                return all_update_types
+
+            update_types.update(hasher.update_types)
+
+        return [update_type for update_type in all_update_types if update_type in update_types]
+
+    def get_routing_targets(self, update: Update) -> tuple[RoutingTarget, ...]:
+        """Get routers with event views which can match the update, in routing order.
+
+        Targets are indexed by the update type and the event model, the index is rebuilt
+        when routers are added, removed or replaced. Emptiness of the views is not indexed,
+        since handlers can be registered at any time.
+        """
+        routers = tuple(self.routers)
+
+        # Routers are compared by identity, a router replaced with an equal one has its own views.
+        if len(routers) != len(self._indexed_routers) or any(
+            router is not indexed_router for router, indexed_router in zip(routers, self._indexed_routers)
+        ):
+            self._routing_index.clear()
+            self._indexed_routers = routers
+
+        key = (update.update_type, update.incoming_update.__class__)
+
+        if (targets := self._routing_index.get(key)) is None:
+            targets = self._routing_index[key] = tuple(
+                (router, event_views)
+                for router in self.routers
+                if (event_views := router.get_event_views(*key))
+            )
+
+        return targets
+
     async def _route_update(self, api: API, update: Update, context: Context) -> None:
-        async with self.loop_wrapper.create_task_group() as task_group:
-            for router in self.routers:
-                logger.debug("Routing to router `{!r}`", router)
-                task_group.create_task(router.route(api, update, context.copy()))
+        targets = tuple(
+            (router, event_views)
+            for router, event_views in self.get_routing_targets(update)
+            if any(event_views)
+        )
+
+        # Exceptions of the routers are raised as one exception group, whether one or several routers were routed to.
+        if len(targets) == 1:
+            router, event_views = targets[0]
+            logger.debug("Routing to router `{!r}`", router)
+
+            try:
+                await router.route(api, update, context.copy(), event_views=event_views)
+            except Exception as exception:
+                raise ExceptionGroup(ROUTING_EXCEPTIONS_MESSAGE, [exception]) from None
+
+            return
+
+        try:
+            async with self.loop_wrapper.create_task_group() as task_group:
+                for router, event_views in targets:
+                    logger.debug("Routing to router `{!r}`", router)
+                    task_group.create_task(router.route(api, update, context.copy(), event_views=event_views))
+        except BaseExceptionGroup as group:
+            raise BaseExceptionGroup(ROUTING_EXCEPTIONS_MESSAGE, group.exceptions) from None
 
     async def feed(self, api: API, update: Update) -> None:
         inject_internals(per_event_scope := create_per_event_scope(), {API: api, Update: update})
 
-        with log_buffer(f"Update:{update.update_id} > Bot:{api.id}"):
+        # Buffering groups the update logs, it's skipped if the update logs would not be written anyway.
+        with log_buffer(f"Update:{update.update_id} > Bot:{api.id}") if logger.is_enabled("INFO") else NULL_CONTEXT:
             logger.info("New update was received, processing...")
 
             context = Context().add_roots(api, update, per_event_scope)
@@ -377,7 +499,9 @@ class Dispatch[
 
                     raise
                 finally:
-                    if not failed:
+                    context.state_cache.release()
+
+                    if not failed and logger.is_enabled("DEBUG"):
                         elapsed_time = self.loop_wrapper.time - start_time
                         elapsed_ms = elapsed_time * 1000
                         logger.debug(
@@ -386,7 +510,27 @@ class Dispatch[
                             "ns" if elapsed_ms < 1 else "ms",
                         )
 
+    async def prepare_batch(self, api: API, updates: typing.Sequence[Update]) -> None:
+        for middleware in self.middlewares:
+            if not middleware.is_pre_batch:
+                continue
+
+            try:
+                await middleware.pre_batch(api, updates)
+            except Exception:
+                logger.exception(
+                    "Dispatch batch pre-middleware `{}` failed, traceback message below:",
+                    fullname(middleware),
+                )
+
     async def feed_raw(self, api: API, raw_update: str | bytes) -> None:
+        """Feed the raw update. If the prefilter is set, the update is fully decoded and fed
+        only if it passes the prefilter.
+        """
+        if self.prefilter is not None and not self.prefilter.check_raw(raw_update):
+            logger.debug("Raw update was dropped by the prefilter")
+            return
+
         await self.feed(api, UpdateCute.from_raw(raw_update))
 
     async def feed_cute(self, api: API, update_cute: UpdateCute) -> None:
@@ -416,6 +560,7 @@ class Dispatch[
     def load(self, external: typing.Self) -> None:
         self.routers.extend(filter(None, external.routers))
         self.error_handler.load(external.error_handler)
+        self._routing_index.clear()
 
 
 __all__ = ("Dispatch",)
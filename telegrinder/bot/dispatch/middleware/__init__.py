@@ -2,6 +2,7 @@ from telegrinder.bot.dispatch.middleware.abc import ABCMiddleware, run_post_midd
 from telegrinder.bot.dispatch.middleware.box import MiddlewareBox, ViewMiddlewareBox
 from telegrinder.bot.dispatch.middleware.filter import FilterMiddleware
 from telegrinder.bot.dispatch.middleware.media_group import MediaGroupMiddleware
+from telegrinder.bot.dispatch.middleware.state_prefetch import StatePrefetchMiddleware
 from telegrinder.bot.dispatch.middleware.waiter import WaiterMiddleware
 
 __all__ = (
@@ -9,6 +10,7 @@ __all__ = (
     "FilterMiddleware",
     "MediaGroupMiddleware",
     "MiddlewareBox",
+    "StatePrefetchMiddleware",
     "ViewMiddlewareBox",
     "WaiterMiddleware",
     "run_post_middleware",
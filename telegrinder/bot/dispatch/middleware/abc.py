@@ -7,12 +7,14 @@ from nodnod.agent.event_loop.agent import EventLoopAgent
 from nodnod.error import NodeError
 from nodnod.interface.node_from_function import create_node_from_function
 
+from telegrinder.api.api import API
 from telegrinder.bot.dispatch.context import Context
 from telegrinder.modules import logger
 from telegrinder.node.compose import compose, create_composable
 from telegrinder.node.utils import get_globals_from_function, get_locals_from_function
 from telegrinder.tools.fullname import fullname
 from telegrinder.tools.lifespan import Lifespan
+from telegrinder.types.objects import Update
 
 if typing.TYPE_CHECKING:
     from nodnod.agent.base import Agent
@@ -76,6 +78,10 @@ class ABCMiddleware(ABC):
     def is_post(self) -> bool:
         return type(self).post is not ABCMiddleware.post
 
+    @property
+    def is_pre_batch(self) -> bool:
+        return type(self).pre_batch is not ABCMiddleware.pre_batch
+
     @cached_property
     def pre_composable(self) -> Composable:
         return self.get_composable(
@@ -110,6 +116,11 @@ class ABCMiddleware(ABC):
 
     def post(self, *args: typing.Any, **kwargs: typing.Any) -> MiddlewareResult: ...
 
+    async def pre_batch(self, api: API, updates: typing.Sequence[Update], /) -> None:
+        """Called once with the whole batch of updates before they are fed one by one,
+        e.g. to load the data required by the middleware for all updates in one round-trip.
+        """
+
     def to_lifespan(self, context: Context) -> Lifespan:
         return Lifespan(
             startup_tasks=[run_pre_middleware(self, context)],
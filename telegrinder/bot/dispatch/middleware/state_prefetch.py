@@ -0,0 +1,96 @@
+import collections
+import typing
+
+from kungfu.library.monad.option import Option
+
+from telegrinder.api.api import API
+from telegrinder.bot.dispatch.batch import get_sender_id
+from telegrinder.bot.dispatch.context import Context
+from telegrinder.bot.dispatch.middleware.abc import ABCMiddleware
+from telegrinder.tools.limited_dict import LimitedDict
+from telegrinder.tools.state_storage.abc import ABCStateStorage, StateData
+from telegrinder.types.objects import Update
+
+type PrefetchedState = tuple[int, Option[StateData[typing.Any]]]
+
+DEFAULT_MAX_PREFETCHED: typing.Final = 10_000
+
+
+class StatePrefetchMiddleware[Payload](ABCMiddleware):
+    """Prefetch states of the senders of all updates in the batch with one `get_many` call of the storage.
+
+    The prefetched state is put into the per-event state cache before the update is routed,
+    so the `State` rule doesn't request the storage again. A state is prefetched only if nothing
+    may change it before the update is processed: senders with several updates in the batch
+    and senders whose updates are still being processed aren't prefetched, and the prefetched state
+    is dropped if another update of the sender starts being processed first.
+    At most `max_prefetched` states are kept for the updates which are not processed yet.
+
+    Example:
+    ```python
+    storage = MemoryStateStorage()
+    bot.dispatch.middlewares.put(StatePrefetchMiddleware(storage))
+    ```
+    """
+
+    def __init__(
+        self,
+        storage: ABCStateStorage[Payload],
+        *,
+        max_prefetched: int = DEFAULT_MAX_PREFETCHED,
+    ) -> None:
+        self.storage = storage
+        self.prefetched: LimitedDict[int, PrefetchedState] = LimitedDict(maxlimit=max_prefetched)
+        self.in_flight: collections.Counter[int] = collections.Counter()
+        self._reading: list[set[int]] = []
+
+    def _release(self, sender_id: int, /) -> None:
+        if (count := self.in_flight[sender_id] - 1) > 0:
+            self.in_flight[sender_id] = count
+        else:
+            del self.in_flight[sender_id]
+
+    async def pre_batch(self, api: API, updates: typing.Sequence[Update], /) -> None:
+        senders = {update.update_id: get_sender_id(update) for update in updates}
+        counts = collections.Counter(sender_id for sender_id in senders.values() if sender_id is not None)
+        user_ids: set[int] = set()
+
+        for sender_id, count in counts.items():
+            # A state prefetched by the previous batch for the sender is stale once the sender has one more update.
+            if self.prefetched.pop(sender_id, None) is None and count == 1 and sender_id not in self.in_flight:
+                user_ids.add(sender_id)
+
+        if not user_ids:
+            return
+
+        # Senders whose updates start being processed while the states are read are dropped from the set.
+        self._reading.append(user_ids)
+
+        try:
+            states = await self.storage.get_many(user_ids)
+        finally:
+            self._reading.remove(user_ids)
+
+        for update_id, sender_id in senders.items():
+            if sender_id in user_ids and sender_id in states:
+                self.prefetched[sender_id] = (update_id, states[sender_id])
+
+    async def pre(self, context: Context) -> bool:
+        if (sender_id := get_sender_id(context.raw_update)) is None:
+            return True
+
+        prefetched = self.prefetched.pop(sender_id, None)
+
+        if prefetched is not None and prefetched[0] == context.raw_update.update_id and not self.in_flight[sender_id]:
+            context.state_cache.put(self.storage, sender_id, prefetched[1])
+
+        for user_ids in self._reading:
+            user_ids.discard(sender_id)
+
+        # The sender is in flight until the dispatch releases the event's state cache.
+        self.in_flight[sender_id] += 1
+        context.state_cache.add_release_callback(lambda: self._release(sender_id))
+        return True
+
+
+__all__ = ("StatePrefetchMiddleware",)
@@ -1,10 +1,10 @@
-import datetime
 import typing
 
 from telegrinder.api.api import API
 from telegrinder.bot.dispatch.context import Context
 from telegrinder.bot.dispatch.middleware.abc import ABCMiddleware
 from telegrinder.modules import logger
+from telegrinder.types.enums import UpdateType
 
 if typing.TYPE_CHECKING:
     from telegrinder.tools.waiter_machine.hasher import Hasher
@@ -15,6 +15,9 @@ class WaiterMiddleware(ABCMiddleware):
     def __init__(self, machine: WaiterMachine) -> None:
         self.machine = machine
         self.hashers: set[Hasher[typing.Any, typing.Any]] = set()
+        self._indexed_hashers = 0
+        self._hashers_by_update_type: dict[UpdateType, tuple[Hasher[typing.Any, typing.Any], ...]] = {}
+        self._any_update_type_hashers: tuple[Hasher[typing.Any, typing.Any], ...] = ()
 
     def __bool__(self) -> bool:
         return bool(self.hashers) and bool(self.machine)
@@ -22,23 +25,46 @@ class WaiterMiddleware(ABCMiddleware):
     def add_hasher(self, hasher: Hasher[typing.Any, typing.Any], /) -> None:
         self.hashers.add(hasher)
 
+    def _build_index(self) -> None:
+        hashers_by_update_type: dict[UpdateType, list[Hasher[typing.Any, typing.Any]]] = {}
+        any_update_type_hashers: list[Hasher[typing.Any, typing.Any]] = []
+
+        for hasher in self.hashers:
+            if not hasher.update_types:
+                any_update_type_hashers.append(hasher)
+
+            for update_type in hasher.update_types:
+                hashers_by_update_type.setdefault(update_type, []).append(hasher)
+
+        self._any_update_type_hashers = tuple(any_update_type_hashers)
+        self._hashers_by_update_type = {
+            update_type: (*hashers, *any_update_type_hashers)
+            for update_type, hashers in hashers_by_update_type.items()
+        }
+        self._indexed_hashers = len(self.hashers)
+
+    def get_hashers(self, update_type: UpdateType, /) -> tuple[Hasher[typing.Any, typing.Any], ...]:
+        """Get hashers which can handle the update type, the index is rebuilt lazily when hashers are added."""
+        if self._indexed_hashers != len(self.hashers):
+            self._build_index()
+        return self._hashers_by_update_type.get(update_type, self._any_update_type_hashers)
+
     async def pre(self, api: API, ctx: Context) -> bool:
         update = ctx.update_cute
         update_type = update.update_type
         event = update.incoming_update
+        storage = self.machine.storage
         initiator = short_state = None
 
-        for hasher in self.hashers:
-            if hasher not in self.machine.storage or (hasher.update_types and update_type not in hasher.update_types):
+        for hasher in self.get_hashers(update_type):
+            if not (hasher_storage := storage.get(hasher)):
                 continue
 
             key = hasher.get_hash_from_data_from_event(event)
             if not key:
                 continue
 
-            if (
-                short_state := self.machine.storage[hasher].get(key.unwrap())
-            ) is not None and datetime.datetime.now() < short_state.expiration_date:
+            if (short_state := hasher_storage.get(key.unwrap())) is not None and not short_state.expired:
                 initiator = hasher
                 break
 
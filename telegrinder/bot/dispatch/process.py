@@ -6,8 +6,9 @@ from nodnod.error import NodeError
 from telegrinder.api.api import API
 from telegrinder.bot.dispatch.context import Context
 from telegrinder.bot.dispatch.middleware.abc import run_post_middleware, run_pre_middleware
-from telegrinder.modules import log_scope, logger
+from telegrinder.modules import debug_log_scope, logger
 from telegrinder.node.compose import compose
+from telegrinder.tools.aio import maybe_awaitable
 from telegrinder.tools.fullname import fullname
 from telegrinder.types.objects import Update
 
@@ -34,7 +35,7 @@ async def process_inner(
     found_handlers: list[ABCHandler] = []
     responses: list[typing.Any] = []
 
-    for handler in view.handlers:
+    for handler in view.get_candidate_handlers(context):
         match await handler.run(api, update, context):
             case Ok(response):
                 found_handlers.append(handler)
@@ -62,26 +63,55 @@ async def process_inner(
 
 
 async def check_rule(rule: ABCRule, context: Context) -> bool:
+    if not rule.pure or (rule_memo := context.get("rule_memo")) is None:
+        return await _check_rule(rule, context)
+
+    # The memo keeps the rule alive and is checked by identity, so an id of a collected rule isn't reused.
+    if (memoized := rule_memo.get(id(rule))) is not None and memoized[0] is rule:
+        logger.debug("  → `{!r}` is {} (memoized)", rule, "ok" if memoized[1] else "failed")
+        return memoized[1]
+
+    result = await _check_rule(rule, context)
+    rule_memo[id(rule)] = (rule, result)
+    return result
+
+
+async def _check_rule(rule: ABCRule, context: Context) -> bool:
     if rule.requires:
-        with log_scope(lambda: f"Rule:{fullname(rule)}"):
+        with debug_log_scope(lambda: f"Rule:{fullname(rule)}"):
             for requirement in rule.requires:
                 if not await check_rule(requirement, context):
                     return False
 
     logger.debug("  → Checking `{!r}`...", rule)
 
+    if (context_parameters := rule.context_parameters) is not None:
+        # Fast path: the rule needs nothing but the context, so it's checked without composing nodes.
+        try:
+            result = await maybe_awaitable(rule.check(**dict.fromkeys(context_parameters, context)))
+        except NodeError as error:
+            return _log_rule_error(rule, error)
+
+        logger.debug("    * `{!r}` is {}", rule, "ok" if result else "failed")
+        return result
+
     async with compose(rule.composable, context) as result:
         match result:
             case Ok(result):
                 logger.debug("    * `{!r}` is {}", rule, "ok" if result else "failed")
                 return result
             case Error(error):
-                logger.debug(
-                    "    * `{}` failed with error:{}\n",
-                    fullname(rule),
-                    NodeError(f"* failed to compose check of `{fullname(rule)}` rule", from_error=error),
-                )
+                return _log_rule_error(rule, error)
+
+    return False
 
+
+def _log_rule_error(rule: ABCRule, error: NodeError, /) -> typing.Literal[False]:
+    logger.debug(
+        "    * `{}` failed with error:{}\n",
+        fullname(rule),
+        NodeError(f"* failed to compose check of `{fullname(rule)}` rule", from_error=error),
+    )
     return False
 
 
@@ -7,13 +7,15 @@ from kungfu.library.monad.result import Ok
 from telegrinder.api.api import API
 from telegrinder.bot.dispatch.context import Context
 from telegrinder.bot.dispatch.router.abc import ABCRouter
+from telegrinder.bot.dispatch.view.base import EventModelView, EventView
 from telegrinder.bot.dispatch.view.box import ViewBox
-from telegrinder.modules import log_scope, logger
+from telegrinder.modules import debug_log_scope, log_scope, logger
 from telegrinder.tools.magic.inspect import get_frame_module_name
+from telegrinder.types.enums import UpdateType
 from telegrinder.types.objects import Update
 
 if typing.TYPE_CHECKING:
-    from telegrinder.bot.dispatch.view.base import ErrorView, EventView, RawEventView, View
+    from telegrinder.bot.dispatch.view.base import ErrorView, RawEventView, View
     from telegrinder.bot.dispatch.view.media_group import MediaGroupView
 
 
@@ -94,9 +96,21 @@ class Router[
     def __bool__(self) -> bool:
         return any(self.event_views.values()) or any(self.views.values())
 
+    def get_event_views(
+        self,
+        update_type: UpdateType,
+        event_model: type[typing.Any],
+    ) -> tuple[EventView | EventModelView[typing.Any], ...]:
+        """Get event views which can match the update of the given type and event model, in routing order."""
+        return tuple(
+            view
+            for view in self.event_views.values()
+            if (view.update_type == update_type if isinstance(view, EventView) else issubclass(event_model, view.model))
+        )
+
     @staticmethod
     async def check_view(view: View, api: API, update: Update, context: Context) -> bool:
-        with log_scope(str, view):
+        with debug_log_scope(str, view):
             logger.debug("Checking...")
 
             match await view.check(api, update, context):
@@ -137,10 +151,17 @@ class Router[
 
             return result
 
-    async def route(self, api: API, update: Update, context: Context) -> bool:
+    async def route(
+        self,
+        api: API,
+        update: Update,
+        context: Context,
+        *,
+        event_views: typing.Iterable[EventView | EventModelView[typing.Any]] | None = None,
+    ) -> bool:
         with log_scope(lambda: f"Module:{self.module} > {self.qualname}"):
             try:
-                for event_view in self.event_views.values():
+                for event_view in self.event_views.values() if event_views is None else event_views:
                     if event_view and await self.check_view(event_view, api, update, context):
                         return await self.process_view(event_view, api, update, context, raw_process_on_fail=True)
 
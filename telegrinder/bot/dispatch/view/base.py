@@ -13,7 +13,8 @@ from telegrinder.bot.dispatch.middleware.waiter import WaiterMiddleware
 from telegrinder.bot.dispatch.process import check_rule, process_inner
 from telegrinder.bot.dispatch.return_manager.abc import ABCReturnManager
 from telegrinder.bot.dispatch.view.abc import ABCView
-from telegrinder.bot.rules.abc import ABCRule, Always
+from telegrinder.bot.dispatch.view.index import HandlerIndex
+from telegrinder.bot.rules.abc import ABCRule, Always, compile_rule
 from telegrinder.tools.waiter_machine.machine import WaiterMachine
 from telegrinder.types.enums import UpdateType
 from telegrinder.types.objects import (
@@ -75,6 +76,7 @@ OK_CHECK: typing.Final = Ok()
 class View(ABCView):
     filter: ABCRule
     handlers: deque[ABCHandler]
+    handler_index: HandlerIndex
     waiter_machine: WaiterMachine
     middlewares: ViewMiddlewareBox
     agent_cls: type[Agent] | None
@@ -90,6 +92,7 @@ class View(ABCView):
     ) -> None:
         self.filter = Always()
         self.handlers = deque()
+        self.handler_index = HandlerIndex()
         self.agent_cls = agent_cls
         self.return_manager = return_manager
         self.waiter_machine = (waiter_machine or WaiterMachine()).bind_view(self)
@@ -105,6 +108,10 @@ class View(ABCView):
     def __repr__(self) -> str:
         return "<{}>".format(type(self).__name__)
 
+    def get_candidate_handlers(self, context: Context, /) -> typing.Iterable[ABCHandler]:
+        """Get handlers which can match the event, in order of registration."""
+        return self.handler_index.get_candidates(self.handlers, context)
+
     @property
     def auto_rules(self) -> ABCRule:
         return self.filter
@@ -114,6 +121,8 @@ class View(ABCView):
         for rule in (value,) if isinstance(value, ABCRule) else value:
             self.filter &= rule
 
+        self.filter = compile_rule(self.filter)
+
     def __call__[T: Function](
         self,
         *rules: ABCRule,
@@ -124,7 +133,7 @@ class View(ABCView):
             self.handlers.append(
                 FuncHandler(
                     function=function,
-                    rules=rules,
+                    rules=map(compile_rule, rules),
                     agent=agent or self.agent_cls,
                     final=final,
                 ),
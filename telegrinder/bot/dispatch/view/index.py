@@ -0,0 +1,166 @@
+import operator
+import typing
+from collections import deque
+
+from telegrinder.bot.cute_types.callback_query import CallbackQueryCute
+from telegrinder.bot.cute_types.message import MessageCute
+from telegrinder.bot.cute_types.pre_checkout_query import PreCheckoutQueryCute
+from telegrinder.bot.cute_types.shipping_query import ShippingQueryCute
+from telegrinder.bot.dispatch.context import Context
+from telegrinder.bot.dispatch.handler.abc import ABCHandler
+from telegrinder.bot.dispatch.handler.func import FuncHandler
+from telegrinder.bot.rules.abc import ABCRule, AndRule
+from telegrinder.bot.rules.callback_data import CallbackDataMap
+from telegrinder.bot.rules.command import Command
+from telegrinder.bot.rules.payload import PayloadEqRule
+from telegrinder.bot.rules.text import Text
+from telegrinder.node.nodes.command import cut_mention, single_split
+
+type Key = typing.Hashable
+type KeyFunction = typing.Callable[[typing.Any], Key | None]
+
+
+def get_text_key(event: typing.Any, /) -> str | None:
+    """Get the value composed by the `Text | Caption` node of the event."""
+    if not isinstance(event, MessageCute):
+        return None
+    return event.text.unwrap_or_none() or event.caption.unwrap_or_none()
+
+
+def get_text_ignore_case_key(event: typing.Any, /) -> str | None:
+    text = get_text_key(event)
+    return text.lower() if text is not None else None
+
+
+def get_command_key(event: typing.Any, /) -> str | None:
+    """Get the name of the command with the prefix, as composed by the `CommandInfo` node of the event."""
+    if (text := get_text_key(event)) is None:
+        return None
+    return cut_mention(single_split(text, " ")[0])[0]
+
+
+def get_command_ignore_case_key(event: typing.Any, /) -> str | None:
+    command = get_command_key(event)
+    return command.lower() if command is not None else None
+
+
+def get_payload_key(event: typing.Any, /) -> str | None:
+    """Get the value composed by the `Payload` node of the event."""
+    if isinstance(event, CallbackQueryCute):
+        return event.data.unwrap_or_none()
+
+    if isinstance(event, PreCheckoutQueryCute | ShippingQueryCute):
+        return event.invoice_payload
+
+    if isinstance(event, MessageCute):
+        return event.successful_payment.map(lambda payment: payment.invoice_payload).unwrap_or_none()
+
+    return None
+
+
+def get_callback_data_keys(event: typing.Any, /) -> frozenset[str] | None:
+    if not isinstance(event, CallbackQueryCute):
+        return None
+    return event.decode_data().map(frozenset).unwrap_or_none()
+
+
+def get_rule_keys(rule: ABCRule, /) -> tuple[KeyFunction, frozenset[Key]] | None:
+    """Get the key function and the set of keys of the event for which the rule can pass.
+    Only the exact rule types are indexed, since subclasses may override the check.
+    """
+    while type(rule) is AndRule and rule.rules:
+        rule = rule.rules[0]
+
+    rule_type = type(rule)
+
+    if rule_type is Command:
+        keys = frozenset(prefix + name for prefix in rule.prefixes for name in rule.names)
+        if rule.ignore_case:
+            return get_command_ignore_case_key, frozenset(map(str.lower, keys))
+        return get_command_key, keys
+
+    if rule_type is Text:
+        return (get_text_ignore_case_key if rule.ignore_case else get_text_key), frozenset(rule.texts)
+
+    if rule_type is PayloadEqRule:
+        return get_payload_key, frozenset(rule.payloads)
+
+    if rule_type is CallbackDataMap and not rule.allow_extra_fields:
+        return get_callback_data_keys, frozenset((frozenset(rule.mapping),))
+
+    return None
+
+
+def get_handler_keys(handler: ABCHandler, /) -> tuple[KeyFunction, frozenset[Key]] | None:
+    # Handlers with the preset context update the event context even if their rules fail, so they are never skipped.
+    if type(handler) is not FuncHandler or handler.preset_context or not handler.check_rules:
+        return None
+    return get_rule_keys(handler.check_rules[0])
+
+
+class HandlerIndex:
+    """Discrimination index of the view handlers by their leading rule.
+
+    Handlers whose leading rule is `Command`, `Text`, `PayloadEqRule` or `CallbackDataMap`
+    are indexed by the keys of the event they can match: command names with prefixes, texts,
+    payloads and callback data keys. Handlers which cannot be indexed are always candidates.
+    Candidates are yielded in the order of registration, so first-match semantics are preserved.
+
+    The index is rebuilt lazily when the handlers are added, removed or replaced.
+    """
+
+    __slots__ = ("_handlers", "_snapshot", "_unindexed", "_index")
+
+    def __init__(self) -> None:
+        self._handlers: deque[ABCHandler] | None = None
+        self._snapshot: tuple[ABCHandler, ...] = ()
+        self._unindexed: list[int] = []
+        self._index: dict[KeyFunction, dict[Key, list[int]]] = {}
+
+    def __repr__(self) -> str:
+        return "<{}: handlers={}, indexed={}>".format(
+            type(self).__name__,
+            len(self._snapshot),
+            len(self._snapshot) - len(self._unindexed),
+        )
+
+    def build(self, handlers: deque[ABCHandler], /) -> None:
+        self._handlers = handlers
+        self._snapshot = tuple(handlers)
+        self._unindexed.clear()
+        self._index.clear()
+
+        for position, handler in enumerate(self._snapshot):
+            if (handler_keys := get_handler_keys(handler)) is None:
+                self._unindexed.append(position)
+                continue
+
+            key_function, keys = handler_keys
+            index = self._index.setdefault(key_function, {})
+
+            for key in keys:
+                index.setdefault(key, []).append(position)
+
+    def get_candidates(self, handlers: deque[ABCHandler], context: Context, /) -> typing.Iterable[ABCHandler]:
+        if (
+            self._handlers is not handlers
+            or len(self._snapshot) != len(handlers)
+            or not all(map(operator.is_, self._snapshot, handlers))
+        ):
+            self.build(handlers)
+
+        if not self._index:
+            return handlers
+
+        event = context.update_cute.incoming_update
+        positions = list(self._unindexed)
+
+        for key_function, index in self._index.items():
+            if (key := key_function(event)) is not None and (found := index.get(key)):
+                positions.extend(found)
+
+        positions.sort()
+        return (self._snapshot[position] for position in positions)
+
+
+__all__ = ("HandlerIndex", "get_handler_keys", "get_rule_keys")
@@ -0,0 +1,5 @@
+from .abc import ABCExecutor, ExecutorMetrics
+from .executor import Executor
+from .sharded import ShardedExecutor, get_update_key
+
+__all__ = ("ABCExecutor", "Executor", "ExecutorMetrics", "ShardedExecutor", "get_update_key")
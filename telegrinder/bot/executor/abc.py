@@ -0,0 +1,54 @@
+import dataclasses
+import typing
+from abc import ABC, abstractmethod
+
+from telegrinder.api.api import API
+from telegrinder.bot.dispatch.abc import ABCDispatch
+from telegrinder.types.objects import Update
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExecutorMetrics:
+    """Snapshot of the executor load.
+
+    `in_flight` is the number of updates being fed to the dispatch right now,
+    `queue_depth` is the number of submitted updates waiting for a free worker
+    and `processed` is the total number of updates fed since the executor was created.
+    """
+
+    in_flight: int
+    queue_depth: int
+    processed: int
+
+
+class ABCExecutor(ABC):
+    @abstractmethod
+    async def submit(self, dispatch: ABCDispatch, api: API, update: Update) -> None:
+        """Submit the update to be fed to the dispatch.
+
+        Awaiting this method may suspend the caller until the executor has capacity
+        for the update, this is how the backpressure is propagated to the update source.
+        """
+
+    async def submit_batch(self, dispatch: ABCDispatch, api: API, updates: typing.Sequence[Update]) -> None:
+        """Submit the batch of updates (e.g. the result of one `getUpdates` request) to be fed to the dispatch.
+        By default the dispatch prepares the batch, then every update is submitted one by one.
+        """
+        await dispatch.prepare_batch(api, updates)
+
+        for update in updates:
+            await self.submit(dispatch, api, update)
+
+    @property
+    @abstractmethod
+    def metrics(self) -> ExecutorMetrics:
+        pass
+
+    async def join(self) -> None:
+        """Wait until the submitted updates which are waiting in the executor are fed to the dispatch."""
+
+    async def close(self) -> None:
+        pass
+
+
+__all__ = ("ABCExecutor", "ExecutorMetrics")
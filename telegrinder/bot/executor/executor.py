@@ -0,0 +1,164 @@
+import asyncio
+import typing
+
+from telegrinder.api.api import API
+from telegrinder.bot.dispatch.abc import ABCDispatch
+from telegrinder.bot.executor.abc import ABCExecutor, ExecutorMetrics
+from telegrinder.tools.aio import cancel_future
+from telegrinder.tools.global_context.builtin_context import TelegrinderContext
+from telegrinder.tools.loop_wrapper import LoopWrapper
+from telegrinder.types.objects import Update
+
+type Job = tuple[ABCDispatch, API, Update]
+
+TELEGRINDER_CONTEXT: typing.Final = TelegrinderContext()
+PENDING_PER_WORKER: typing.Final = 10
+
+
+class Executor(ABCExecutor):
+    """Executor that feeds updates to the dispatch.
+
+    By default every update is fed in a separate task of the loop wrapper without any limits,
+    a submitted batch of updates is fed in one task with `ABCDispatch.feed_batch`: its updates are fed
+    concurrently, or in order per chat if `ordered_batches` is True (see `ABCDispatch.feed_batch`
+    for the caveat about waiting for the next update of the same chat).
+    When `max_concurrency` is set, updates are fed by a fixed number of workers and the submitted
+    updates wait for a free worker in a queue of at most `max_pending` updates (by default ten times
+    `max_concurrency`).
+    If the queue is full, `submit` suspends the caller until a worker takes the next update,
+    so the polling doesn't request the next batch of updates until capacity frees up.
+
+    Example:
+    ```python
+    bot = Telegrinder(api, executor=Executor(max_concurrency=100, max_pending=1000))
+    ```
+    """
+
+    __slots__ = (
+        "max_concurrency",
+        "max_pending",
+        "ordered_batches",
+        "loop_wrapper",
+        "_queue",
+        "_workers",
+        "_in_flight",
+        "_processed",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int | None = None,
+        max_pending: int | None = None,
+        ordered_batches: bool = False,
+        loop_wrapper: LoopWrapper | None = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Executor max_concurrency must be a positive number.")
+
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("Executor max_pending must be a positive number.")
+
+        if max_pending is not None and max_concurrency is None:
+            raise ValueError("Executor max_pending requires max_concurrency to be set.")
+
+        if ordered_batches and max_concurrency is not None:
+            raise ValueError("Executor ordered_batches cannot be combined with max_concurrency.")
+
+        if max_concurrency is not None and max_pending is None:
+            max_pending = max_concurrency * PENDING_PER_WORKER
+
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.ordered_batches = ordered_batches
+        self.loop_wrapper = loop_wrapper or TELEGRINDER_CONTEXT.loop_wrapper
+        self._queue: asyncio.Queue[Job] | None = asyncio.Queue(maxsize=max_pending) if max_pending is not None else None
+        self._workers: set[asyncio.Task[None]] = set()
+        self._in_flight = 0
+        self._processed = 0
+
+    def __repr__(self) -> str:
+        return "<{}: max_concurrency={}, max_pending={}, in_flight={}, queue_depth={}>".format(
+            type(self).__name__,
+            self.max_concurrency or "unlimited",
+            self.max_pending or "unlimited",
+            self.in_flight,
+            self.queue_depth,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def metrics(self) -> ExecutorMetrics:
+        return ExecutorMetrics(
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            processed=self._processed,
+        )
+
+    async def _feed(self, dispatch: ABCDispatch, api: API, update: Update) -> None:
+        self._in_flight += 1
+        try:
+            await dispatch.feed_safely(api, (update,))
+        finally:
+            self._in_flight -= 1
+            self._processed += 1
+
+    async def _feed_batch(self, dispatch: ABCDispatch, api: API, updates: typing.Sequence[Update]) -> None:
+        self._in_flight += len(updates)
+        try:
+            await dispatch.feed_batch(api, updates, ordered=self.ordered_batches)
+        finally:
+            self._in_flight -= len(updates)
+            self._processed += len(updates)
+
+    async def _worker(self, queue: asyncio.Queue[Job]) -> None:
+        while True:
+            dispatch, api, update = await queue.get()
+            try:
+                await self._feed(dispatch, api, update)
+            finally:
+                queue.task_done()
+
+    def _start_workers(self, queue: asyncio.Queue[Job]) -> None:
+        loop = asyncio.get_running_loop()
+
+        for _ in range(typing.cast("int", self.max_concurrency) - len(self._workers)):
+            worker = loop.create_task(self._worker(queue))
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    async def submit(self, dispatch: ABCDispatch, api: API, update: Update) -> None:
+        if self._queue is None:
+            self.loop_wrapper.add_task(self._feed(dispatch, api, update))
+            return
+
+        if len(self._workers) < typing.cast("int", self.max_concurrency):
+            self._start_workers(self._queue)
+
+        await self._queue.put((dispatch, api, update))
+
+    async def submit_batch(self, dispatch: ABCDispatch, api: API, updates: typing.Sequence[Update]) -> None:
+        if self._queue is None:
+            self.loop_wrapper.add_task(self._feed_batch(dispatch, api, updates))
+            return
+
+        await super().submit_batch(dispatch, api, updates)
+
+    async def join(self) -> None:
+        """Wait until all queued updates are processed by the workers."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        for worker in tuple(self._workers):
+            await cancel_future(worker)
+
+
+__all__ = ("Executor",)
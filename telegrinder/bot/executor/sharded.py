@@ -0,0 +1,191 @@
+import asyncio
+import dataclasses
+import typing
+
+from telegrinder.api.api import API
+from telegrinder.bot.dispatch.abc import ABCDispatch
+from telegrinder.bot.dispatch.batch import Key, KeyFunction, get_update_key
+from telegrinder.bot.executor.abc import ABCExecutor, ExecutorMetrics
+from telegrinder.tools.aio import cancel_future
+from telegrinder.types.objects import Update
+
+type Job = tuple[ABCDispatch, API, Update]
+
+
+@dataclasses.dataclass(slots=True)
+class Lane:
+    key: Key
+    queue: asyncio.Queue[Job]
+    worker: asyncio.Task[None] | None = None
+
+
+class ShardedExecutor(ABCExecutor):
+    """Executor that feeds updates with the same key strictly in order,
+    while updates with different keys are fed concurrently.
+
+    By default the key is the chat id of the incoming event, or the user id if the event
+    doesn't belong to a chat (see `get_update_key`). Updates without a key aren't ordered
+    and are fed concurrently. Each key has its own lane: a queue of at most `lane_size` updates
+    consumed by a single worker. A lane is evicted after being idle for `idle_timeout` seconds.
+
+    With `max_lanes` set, an update with a new key waits in `submit` until any lane
+    is evicted, so the polling doesn't request the next batch of updates.
+
+    Example:
+    ```python
+    bot = Telegrinder(api, executor=ShardedExecutor(max_lanes=10_000, idle_timeout=30.0))
+    ```
+    """
+
+    __slots__ = (
+        "max_lanes",
+        "lane_size",
+        "idle_timeout",
+        "key_function",
+        "_lanes",
+        "_lanes_semaphore",
+        "_unkeyed",
+        "_in_flight",
+        "_processed",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_lanes: int | None = None,
+        lane_size: int | None = None,
+        idle_timeout: float = 10.0,
+        key_function: KeyFunction = get_update_key,
+    ) -> None:
+        if max_lanes is not None and max_lanes < 1:
+            raise ValueError("ShardedExecutor max_lanes must be a positive number.")
+
+        if lane_size is not None and lane_size < 1:
+            raise ValueError("ShardedExecutor lane_size must be a positive number.")
+
+        if idle_timeout < 0:
+            raise ValueError("ShardedExecutor idle_timeout cannot be negative.")
+
+        self.max_lanes = max_lanes
+        self.lane_size = lane_size
+        self.idle_timeout = idle_timeout
+        self.key_function = key_function
+        self._lanes: dict[Key, Lane] = {}
+        self._lanes_semaphore = asyncio.Semaphore(max_lanes) if max_lanes is not None else None
+        self._unkeyed: set[asyncio.Task[None]] = set()
+        self._in_flight = 0
+        self._processed = 0
+
+    def __repr__(self) -> str:
+        return "<{}: lanes={}, max_lanes={}, lane_size={}, idle_timeout={}, in_flight={}>".format(
+            type(self).__name__,
+            len(self._lanes),
+            self.max_lanes or "unlimited",
+            self.lane_size or "unlimited",
+            self.idle_timeout,
+            self._in_flight,
+        )
+
+    @property
+    def lanes(self) -> int:
+        return len(self._lanes)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(lane.queue.qsize() for lane in self._lanes.values())
+
+    @property
+    def metrics(self) -> ExecutorMetrics:
+        return ExecutorMetrics(
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            processed=self._processed,
+        )
+
+    async def _feed(self, dispatch: ABCDispatch, api: API, update: Update) -> None:
+        self._in_flight += 1
+        try:
+            await dispatch.feed_safely(api, (update,))
+        finally:
+            self._in_flight -= 1
+            self._processed += 1
+
+    async def _get_job(self, lane: Lane) -> Job | None:
+        if not lane.queue.empty():
+            return lane.queue.get_nowait()
+
+        try:
+            async with asyncio.timeout(self.idle_timeout):
+                return await lane.queue.get()
+        except TimeoutError:
+            return None
+
+    async def _run_lane(self, lane: Lane) -> None:
+        try:
+            while True:
+                job = await self._get_job(lane)
+
+                if job is None:
+                    if not lane.queue.empty():
+                        continue
+                    break
+
+                await self._feed(*job)
+                lane.queue.task_done()
+        finally:
+            if self._lanes.get(lane.key) is lane:
+                del self._lanes[lane.key]
+
+            if self._lanes_semaphore is not None:
+                self._lanes_semaphore.release()
+
+    async def _get_lane(self, key: Key) -> Lane:
+        while (lane := self._lanes.get(key)) is None:
+            if self._lanes_semaphore is not None:
+                await self._lanes_semaphore.acquire()
+
+                if key in self._lanes:
+                    # The lane was created while we were waiting for a free slot.
+                    self._lanes_semaphore.release()
+                    continue
+
+            lane = Lane(key, asyncio.Queue(maxsize=self.lane_size or 0))
+            lane.worker = asyncio.get_running_loop().create_task(self._run_lane(lane))
+            self._lanes[key] = lane
+
+        return lane
+
+    async def submit(self, dispatch: ABCDispatch, api: API, update: Update) -> None:
+        key = self.key_function(update)
+
+        if key is None:
+            task = asyncio.get_running_loop().create_task(self._feed(dispatch, api, update))
+            self._unkeyed.add(task)
+            task.add_done_callback(self._unkeyed.discard)
+            return
+
+        lane = await self._get_lane(key)
+        await lane.queue.put((dispatch, api, update))
+
+    async def join(self) -> None:
+        """Wait until all queued updates are processed by the lanes and the unkeyed updates are fed."""
+        for lane in tuple(self._lanes.values()):
+            await lane.queue.join()
+
+        if self._unkeyed:
+            await asyncio.wait(tuple(self._unkeyed))
+
+    async def close(self) -> None:
+        for lane in tuple(self._lanes.values()):
+            if lane.worker is not None:
+                await cancel_future(lane.worker)
+
+        for task in tuple(self._unkeyed):
+            await cancel_future(task)
+
+
+__all__ = ("ShardedExecutor", "get_update_key")
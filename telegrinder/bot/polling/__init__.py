@@ -1,4 +1,6 @@
 from .abc import ABCPolling
 from .polling import Polling
+from .prefilter import Prefilter, UpdateHeader
+from .webhook import Webhook
 
-__all__ = ("ABCPolling", "Polling")
+__all__ = ("ABCPolling", "Polling", "Prefilter", "UpdateHeader", "Webhook")
@@ -3,11 +3,13 @@ from abc import ABC, abstractmethod
 
 import msgspec
 
+from telegrinder.types.enums import UpdateType
 from telegrinder.types.objects import Update
 
 
 class ABCPolling(ABC):
     offset: int
+    allowed_updates: list[UpdateType]
 
     @abstractmethod
     async def get_updates(self) -> list[msgspec.Raw]:
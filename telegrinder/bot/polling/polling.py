@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import datetime
 import typing
 from http import HTTPStatus
@@ -11,8 +13,10 @@ from telegrinder.api.error import APIServerError, InvalidTokenError
 from telegrinder.bot.cute_types.update import UpdateCute
 from telegrinder.bot.polling.abc import ABCPolling
 from telegrinder.bot.polling.error_handler import ErrorHandler
+from telegrinder.bot.polling.prefilter import Prefilter
 from telegrinder.bot.polling.utils import compute_number
 from telegrinder.modules import logger
+from telegrinder.tools.aio import cancel_future
 from telegrinder.types.objects import Update, UpdateType
 
 DEFAULT_OFFSET: typing.Final = 0
@@ -29,6 +33,8 @@ class Polling(ABCPolling):
         "reconnect_after",
         "max_reconnects",
         "offset",
+        "prefetch",
+        "prefilter",
         "_running",
         "_reconnects_counter",
         "_error_handler",
@@ -46,6 +52,8 @@ class Polling(ABCPolling):
         max_reconnects: int = DEFAULT_MAX_RECONNECTS,
         include_updates: set[UpdateType] | None = None,
         exclude_updates: set[UpdateType] | None = None,
+        prefetch: int = 0,
+        prefilter: Prefilter | None = None,
     ) -> None:
         self.api = api
         self.update_model = update_model
@@ -59,6 +67,8 @@ class Polling(ABCPolling):
         )
         self.reconnect_after = compute_number(DEFAULT_RECONNECT_AFTER, reconnect_after, 0.0)
         self.max_reconnects = compute_number(DEFAULT_MAX_RECONNECTS, max_reconnects, 0)
+        self.prefetch = max(0, prefetch)
+        self.prefilter = prefilter
         self._running = False
         self._reconnects_counter = 0
         self._error_handler = ErrorHandler(self)
@@ -66,7 +76,7 @@ class Polling(ABCPolling):
     def __repr__(self) -> str:
         return (
             "<{}: api={!r}, update_model={!r}, running={}, offset={}, timeout={}, "
-            "limit={}, allowed_updates={!r}, max_reconnects={}, reconnect_after={}>"
+            "limit={}, allowed_updates={!r}, max_reconnects={}, reconnect_after={}, prefetch={}>"
         ).format(
             type(self).__name__,
             self.api,
@@ -78,6 +88,7 @@ class Polling(ABCPolling):
             self.allowed_updates,
             self.max_reconnects,
             self.reconnect_after,
+            self.prefetch,
         )
 
     @staticmethod
@@ -143,16 +154,91 @@ class Polling(ABCPolling):
 
         raise error from None
 
+    def decode_updates(
+        self,
+        raw: msgspec.Raw,
+        updates_decoder: typing.Any,
+        update_decoder: typing.Any,
+        /,
+    ) -> tuple[list[Update], int | None]:
+        """Decode the raw array of updates, returns updates and the offset to confirm them.
+        If the prefilter is set, only updates which pass it are fully decoded with the `update_decoder`.
+        """
+        if self.prefilter is None:
+            updates = updates_decoder.decode(raw)
+            return updates, updates[-1].update_id + 1 if updates else None
+
+        raw_updates, offset = self.prefilter.filter(raw)
+        updates = [update_decoder.decode(raw_update) for raw_update in raw_updates]
+
+        if updates:
+            offset = max(offset or DEFAULT_OFFSET, updates[-1].update_id + 1)
+
+        return updates, offset
+
+    async def _prefetch_updates(self, queue: asyncio.Queue[list[Update]]) -> None:
+        try:
+            with decoder(list[self.update_model]) as updates_decoder, decoder(self.update_model) as update_decoder:
+                while self._running:
+                    try:
+                        if raw := await self.get_updates():
+                            updates, offset = self.decode_updates(raw, updates_decoder, update_decoder)
+
+                            # Confirm the offset before the batch is dispatched to request the next one right away.
+                            if offset is not None:
+                                self.offset = offset
+
+                            if updates:
+                                await queue.put(updates)
+
+                        if self._reconnects_counter != 0:
+                            self._reset_reconnects_counter()
+                    except asyncio.QueueShutDown:
+                        return
+                    except (Exception, InvalidTokenError) as error:
+                        # Cancellation of the producer on shutdown must propagate, not be passed to the error handler.
+                        if not await self._error_handler.handle(error):
+                            logger.exception("Traceback message below:")
+
+                        if isinstance(error, self.api.http.CONNECTION_TIMEOUT_ERRORS):
+                            self._reconnects_counter += 1
+        finally:
+            queue.shutdown()
+
+    async def _listen_prefetch(self) -> typing.AsyncGenerator[list[Update], None]:
+        queue: asyncio.Queue[list[Update]] = asyncio.Queue(maxsize=self.prefetch)
+        producer = asyncio.get_running_loop().create_task(self._prefetch_updates(queue))
+
+        try:
+            while True:
+                yield await queue.get()
+        except asyncio.QueueShutDown:
+            pass
+        finally:
+            self.stop()
+            await cancel_future(producer)
+
     async def listen(self) -> typing.AsyncGenerator[list[Update], None]:
         logger.debug("Listening polling")
         self._running = True
 
-        with decoder(list[self.update_model]) as updates_decoder:
+        if self.prefetch:
+            async with contextlib.aclosing(self._listen_prefetch()) as prefetched_updates:
+                async for updates in prefetched_updates:
+                    yield updates
+            return
+
+        with decoder(list[self.update_model]) as updates_decoder, decoder(self.update_model) as update_decoder:
             while self._running:
                 try:
-                    if (raw := await self.get_updates()) and (updates := updates_decoder.decode(raw)):
-                        yield updates
-                        self.offset = updates[-1].update_id + 1
+                    if raw := await self.get_updates():
+                        updates, offset = self.decode_updates(raw, updates_decoder, update_decoder)
+
+                        if updates:
+                            yield updates
+
+                        if offset is not None:
+                            self.offset = offset
 
                     if self._reconnects_counter != 0:
                         self._reset_reconnects_counter()
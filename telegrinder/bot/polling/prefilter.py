@@ -0,0 +1,178 @@
+import dataclasses
+import typing
+
+import msgspec
+
+from telegrinder.modules import logger
+from telegrinder.types.enums import UpdateType
+
+type Predicate = typing.Callable[[UpdateHeader], bool]
+
+UPDATE_TYPES: typing.Final = tuple(UpdateType)
+
+
+class _Id(msgspec.Struct):
+    id: int
+
+
+class _MessageHeader(msgspec.Struct):
+    chat: _Id | None = None
+
+
+class _EventHeader(msgspec.Struct):
+    chat: _Id | None = None
+    from_: _Id | None = msgspec.field(default=None, name="from")
+    user: _Id | None = None
+    message: _MessageHeader | None = None
+
+
+_RawUpdateHeader = msgspec.defstruct(
+    "_RawUpdateHeader",
+    [("update_id", int), *((update_type.value, _EventHeader | None, None) for update_type in UPDATE_TYPES)],
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class UpdateHeader:
+    update_id: int
+    """Update identifier."""
+
+    update_type: UpdateType | None
+    """Update type, None if the update type is unknown."""
+
+    chat_id: int | None
+    """Identifier of the chat of the event (or of the message of the callback query), if any."""
+
+    from_id: int | None
+    """Identifier of the sender (`from` or `user` field) of the event, if any."""
+
+
+class Prefilter:
+    """Cheap prefilter of the raw updates applied before the full decoding.
+
+    Each update is decoded into the `UpdateHeader` (update id, update type, chat id and sender id),
+    fields of the event other than these are skipped by the decoder. Only updates which pass all predicates
+    are fully decoded and dispatched, the rest are dropped (but still confirmed by the polling offset).
+    Updates whose header can't be decoded and updates for which a predicate raises pass the prefilter.
+
+    Example:
+    ```python
+    prefilter = Prefilter(chat_not_in(IGNORED_CHAT_ID))
+
+    @prefilter
+    def no_edits(header: UpdateHeader) -> bool:
+        return header.update_type not in (UpdateType.EDITED_MESSAGE, UpdateType.EDITED_CHANNEL_POST)
+
+    bot = Telegrinder(api, polling=Polling(api, prefilter=prefilter))
+    dispatch = Dispatch(prefilter=prefilter)  # checked by `Dispatch.feed_raw`
+    ```
+    """
+
+    __slots__ = ("predicates", "_header_decoder", "_raw_updates_decoder")
+
+    def __init__(self, *predicates: Predicate) -> None:
+        self.predicates = list(predicates)
+        self._header_decoder = msgspec.json.Decoder(_RawUpdateHeader)
+        self._raw_updates_decoder = msgspec.json.Decoder(list[msgspec.Raw])
+
+    def __repr__(self) -> str:
+        return "<{}: predicates={}>".format(type(self).__name__, len(self.predicates))
+
+    def __call__(self, predicate: Predicate, /) -> Predicate:
+        self.predicates.append(predicate)
+        return predicate
+
+    def get_header(self, raw_update: str | bytes | msgspec.Raw, /) -> UpdateHeader:
+        raw_header = self._header_decoder.decode(raw_update)
+
+        for update_type in UPDATE_TYPES:
+            if (event := getattr(raw_header, update_type.value)) is not None:
+                break
+        else:
+            return UpdateHeader(raw_header.update_id, None, None, None)
+
+        chat = event.chat or (event.message.chat if event.message is not None else None)
+        sender = event.from_ or event.user
+        return UpdateHeader(
+            raw_header.update_id,
+            update_type,
+            chat.id if chat is not None else None,
+            sender.id if sender is not None else None,
+        )
+
+    def _get_header_or_none(self, raw_update: str | bytes | msgspec.Raw, /) -> UpdateHeader | None:
+        try:
+            return self.get_header(raw_update)
+        except msgspec.DecodeError:
+            logger.debug("Failed to decode the update header, the update passes the prefilter")
+            return None
+
+    def check(self, header: UpdateHeader, /) -> bool:
+        try:
+            return all(predicate(header) for predicate in self.predicates)
+        except Exception:
+            logger.exception(
+                "Prefilter predicate failed on update (id={}), the update passes the prefilter, "
+                "traceback message below:",
+                header.update_id,
+            )
+            return True
+
+    def check_raw(self, raw_update: str | bytes | msgspec.Raw, /) -> bool:
+        header = self._get_header_or_none(raw_update)
+        return header is None or self.check(header)
+
+    def filter(self, raw_updates: bytes | msgspec.Raw, /) -> tuple[list[msgspec.Raw], int | None]:
+        """Filter the raw JSON array of updates.
+        Returns raw updates which passed the prefilter and the offset to confirm all updates of the array,
+        None if the array is empty.
+        """
+        passed: list[msgspec.Raw] = []
+        offset = None
+
+        for raw_update in self._raw_updates_decoder.decode(raw_updates):
+            if (header := self._get_header_or_none(raw_update)) is None:
+                passed.append(raw_update)
+                continue
+
+            offset = header.update_id + 1
+
+            if self.check(header):
+                passed.append(raw_update)
+
+        return passed, offset
+
+
+def update_type_in(*update_types: UpdateType) -> Predicate:
+    """Pass updates of the given types."""
+    allowed = frozenset(update_types)
+    return lambda header: header.update_type in allowed
+
+
+def chat_in(*chat_ids: int) -> Predicate:
+    """Pass updates from the given chats, updates without a chat are dropped."""
+    allowed = frozenset(chat_ids)
+    return lambda header: header.chat_id in allowed
+
+
+def chat_not_in(*chat_ids: int) -> Predicate:
+    """Drop updates from the given chats."""
+    ignored = frozenset(chat_ids)
+    return lambda header: header.chat_id not in ignored
+
+
+def from_not_in(*user_ids: int) -> Predicate:
+    """Drop updates from the given senders."""
+    ignored = frozenset(user_ids)
+    return lambda header: header.from_id not in ignored
+
+
+__all__ = (
+    "Predicate",
+    "Prefilter",
+    "UpdateHeader",
+    "chat_in",
+    "chat_not_in",
+    "from_not_in",
+    "update_type_in",
+)
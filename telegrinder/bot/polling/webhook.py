@@ -0,0 +1,346 @@
+import asyncio
+import contextlib
+import hmac
+import typing
+from functools import cache
+from http import HTTPStatus
+
+import msgspec
+from kungfu.library.misc import is_ok
+from msgspex import decoder
+
+from telegrinder.api.api import API
+from telegrinder.bot.cute_types.update import UpdateCute
+from telegrinder.bot.polling.abc import ABCPolling
+from telegrinder.bot.polling.polling import Polling
+from telegrinder.bot.polling.prefilter import Prefilter
+from telegrinder.modules import logger
+from telegrinder.tools.limited_dict import LimitedDict
+from telegrinder.types.objects import Update, UpdateType
+from telegrinder.verification_utils import SECRET_TOKEN_KEY
+
+DEFAULT_HOST: typing.Final = "0.0.0.0"
+DEFAULT_PORT: typing.Final = 8080
+DEFAULT_PATH: typing.Final = "/"
+DEFAULT_MAX_QUEUE_SIZE: typing.Final = 1000
+DEFAULT_MAX_BODY_SIZE: typing.Final = 1024 * 1024
+DEFAULT_DEDUPLICATION_SIZE: typing.Final = 10_000
+DEFAULT_READ_TIMEOUT: typing.Final = 30.0
+MAX_BATCH_SIZE: typing.Final = 100
+MAX_HEADERS_SIZE: typing.Final = 16 * 1024
+RETRY_AFTER_SECONDS: typing.Final = 1
+SECRET_TOKEN_HEADER: typing.Final = SECRET_TOKEN_KEY.lower()
+
+
+class WebhookUpdateId(msgspec.Struct):
+    update_id: int
+
+
+@cache
+def make_response(status: HTTPStatus, keep_alive: bool, /) -> bytes:
+    headers = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        "Content-Length: 0",
+        "Connection: {}".format("keep-alive" if keep_alive else "close"),
+    ]
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        headers.append(f"Retry-After: {RETRY_AFTER_SECONDS}")
+    return ("\r\n".join(headers) + "\r\n\r\n").encode()
+
+
+class Webhook(ABCPolling):
+    """Webhook ingress with a built-in HTTP/1.1 server running on the event loop of the loop wrapper.
+
+    Every accepted update is answered with `200 OK` right away and put into a bounded queue,
+    from which `listen` yields updates decoded into `update_model`. If the queue is full,
+    the request is answered with `503 Service Unavailable`, so Telegram retries it later.
+    Updates redelivered by Telegram are deduplicated by `update_id`. If `prefilter` is set,
+    only updates which pass it are decoded. A connection is closed if the request headers or body
+    (or the next request of a keep-alive connection) aren't received within `read_timeout` seconds.
+
+    If `url` is set, the webhook is registered via `setWebhook` when listening starts, and registered again
+    after a batch of updates if `allowed_updates` was changed meanwhile (e.g. by `Telegrinder.update_allowed_updates`).
+
+    Example:
+    ```python
+    bot = Telegrinder(
+        api,
+        polling=Webhook(api, url="https://example.com/bot", path="/bot", port=8443, secret_token="secret"),
+    )
+    ```
+    """
+
+    __slots__ = (
+        "api",
+        "host",
+        "port",
+        "path",
+        "url",
+        "secret_token",
+        "update_model",
+        "allowed_updates",
+        "max_connections",
+        "max_queue_size",
+        "max_body_size",
+        "read_timeout",
+        "prefilter",
+        "offset",
+        "_running",
+        "_webhook_allowed_updates",
+        "_seen_updates",
+        "_queue",
+        "_server",
+    )
+
+    def __init__(
+        self,
+        api: API,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        path: str = DEFAULT_PATH,
+        url: str | None = None,
+        secret_token: str | None = None,
+        update_model: type[Update] = UpdateCute,
+        max_connections: int | None = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+        deduplication_size: int = DEFAULT_DEDUPLICATION_SIZE,
+        include_updates: set[UpdateType] | None = None,
+        exclude_updates: set[UpdateType] | None = None,
+        prefilter: Prefilter | None = None,
+    ) -> None:
+        self.api = api
+        self.host = host
+        self.port = port
+        self.path = path
+        self.url = url
+        self.secret_token = secret_token
+        self.update_model = update_model
+        self.allowed_updates = Polling.get_allowed_updates(
+            include_updates=include_updates,
+            exclude_updates=exclude_updates,
+        )
+        self.max_connections = max_connections
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_body_size = max_body_size
+        self.read_timeout = read_timeout
+        self.prefilter = prefilter
+        self.offset = 0
+        self._running = False
+        self._webhook_allowed_updates: list[UpdateType] | None = None
+        self._seen_updates: LimitedDict[int, None] = LimitedDict(maxlimit=deduplication_size)
+        self._queue: asyncio.Queue[msgspec.Raw] | None = None
+        self._server: asyncio.Server | None = None
+
+    def __repr__(self) -> str:
+        return "<{}: api={!r}, update_model={!r}, running={}, address={}:{}{}, url={!r}, max_queue_size={}>".format(
+            type(self).__name__,
+            self.api,
+            self.update_model,
+            self._running,
+            self.host,
+            self.port,
+            self.path,
+            self.url,
+            self.max_queue_size,
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def sockets(self) -> tuple[typing.Any, ...]:
+        return tuple(self._server.sockets) if self._server is not None else ()
+
+    def _accept_update(self, body: bytes) -> HTTPStatus:
+        try:
+            update_id = msgspec.json.decode(body, type=WebhookUpdateId).update_id
+        except msgspec.DecodeError:
+            return HTTPStatus.BAD_REQUEST
+
+        if update_id in self._seen_updates:
+            logger.debug("Webhook received duplicate update (update_id={}), skipping", update_id)
+            return HTTPStatus.OK
+
+        if self._queue is None:
+            return HTTPStatus.SERVICE_UNAVAILABLE
+
+        try:
+            self._queue.put_nowait(msgspec.Raw(body))
+        except asyncio.QueueFull:
+            logger.warning("Webhook update queue is full, rejecting update (update_id={})", update_id)
+            return HTTPStatus.SERVICE_UNAVAILABLE
+        except asyncio.QueueShutDown:
+            return HTTPStatus.SERVICE_UNAVAILABLE
+
+        self._seen_updates[update_id] = None
+        return HTTPStatus.OK
+
+    def _handle_request(self, method: str, path: str, headers: dict[str, str], body: bytes) -> HTTPStatus:
+        if path.partition("?")[0] != self.path:
+            return HTTPStatus.NOT_FOUND
+
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED
+
+        if self.secret_token is not None and not hmac.compare_digest(
+            headers.get(SECRET_TOKEN_HEADER, "").encode(),
+            self.secret_token.encode(),
+        ):
+            return HTTPStatus.UNAUTHORIZED
+
+        return self._accept_update(body)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while self._running:
+                try:
+                    async with asyncio.timeout(self.read_timeout):
+                        head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, TimeoutError:
+                    break
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, path, version = (request_line.split(" ", 2) + ["", ""])[:3]
+                headers: dict[str, str] = {}
+
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    if version == "HTTP/1.1"
+                    else headers.get("connection", "").lower() == "keep-alive"
+                )
+
+                try:
+                    content_length = int(headers.get("content-length", 0))
+                except ValueError:
+                    content_length = -1
+
+                if content_length < 0 or content_length > self.max_body_size:
+                    status = HTTPStatus.BAD_REQUEST if content_length < 0 else HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                    writer.write(make_response(status, False))
+                    await writer.drain()
+                    break
+
+                async with asyncio.timeout(self.read_timeout):
+                    body = await reader.readexactly(content_length) if content_length else b""
+
+                writer.write(make_response(self._handle_request(method, path, headers, body), keep_alive))
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except asyncio.IncompleteReadError, ConnectionError, TimeoutError:
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def set_webhook(self) -> None:
+        if self.url is None:
+            return
+
+        allowed_updates = list(self.allowed_updates)
+        result = await self.api.set_webhook(
+            url=self.url,
+            max_connections=self.max_connections,
+            allowed_updates=allowed_updates,
+            secret_token=self.secret_token,
+        )
+
+        if not is_ok(result):
+            raise result.error
+
+        self._webhook_allowed_updates = allowed_updates
+        logger.info("Webhook was set to {!r}", self.url)
+
+    async def _update_webhook(self) -> None:
+        if self.url is None or self.allowed_updates == self._webhook_allowed_updates:
+            return
+
+        logger.debug("Webhook allowed updates changed, setting webhook again")
+
+        try:
+            await self.set_webhook()
+        except Exception:
+            logger.exception("Failed to set webhook, traceback message below:")
+
+    async def get_updates(self) -> list[msgspec.Raw]:
+        """Wait for incoming updates and return the batch of raw updates from the queue."""
+        assert self._queue is not None, "Webhook is not listening."
+
+        raw_updates = [await self._queue.get()]
+
+        while len(raw_updates) < MAX_BATCH_SIZE and not self._queue.empty():
+            raw_updates.append(self._queue.get_nowait())
+
+        return raw_updates
+
+    async def listen(self) -> typing.AsyncGenerator[list[Update], None]:
+        self._running = True
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self.host,
+            self.port,
+            limit=MAX_HEADERS_SIZE,
+        )
+        logger.debug("Listening webhook on {}:{}{}", self.host, self.port, self.path)
+
+        try:
+            await self.set_webhook()
+
+            with decoder(self.update_model) as update_decoder:
+                while True:
+                    try:
+                        raw_updates = await self.get_updates()
+                    except asyncio.QueueShutDown:
+                        # Accepted updates are drained before the queue reports shutdown.
+                        break
+
+                    updates: list[Update] = []
+
+                    for raw_update in raw_updates:
+                        if self.prefilter is not None and not self.prefilter.check_raw(raw_update):
+                            continue
+
+                        try:
+                            updates.append(update_decoder.decode(raw_update))
+                        except msgspec.DecodeError:
+                            logger.exception("Failed to decode webhook update, traceback message below:")
+
+                    if updates:
+                        yield updates
+                        self.offset = updates[-1].update_id + 1
+                        await self._update_webhook()
+        finally:
+            self.stop()
+            server, self._server = self._server, None
+
+            if server is not None:
+                server.close_clients()
+                await server.wait_closed()
+
+    def stop(self) -> None:
+        self._running = False
+
+        if self._server is not None:
+            self._server.close()
+
+        if self._queue is not None:
+            self._queue.shutdown()
+
+
+__all__ = ("Webhook",)
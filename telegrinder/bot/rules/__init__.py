@@ -1,4 +1,4 @@
-from telegrinder.bot.rules.abc import ABCRule, AndRule, NotRule, OrRule, check_rule
+from telegrinder.bot.rules.abc import ABCRule, AndRule, NotRule, OrRule, check_rule, compile_rule
 from telegrinder.bot.rules.button import ButtonRule
 from telegrinder.bot.rules.callback_data import (
     CallbackDataEq,
@@ -163,4 +163,5 @@ __all__ = (
     "StateMeta",
     "Text",
     "check_rule",
+    "compile_rule",
 )
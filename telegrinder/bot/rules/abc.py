@@ -1,3 +1,5 @@
+import annotationlib
+import inspect
 import typing
 from abc import ABC, abstractmethod
 from collections import deque
@@ -6,9 +8,9 @@ from functools import cached_property
 from nodnod.agent.event_loop.agent import EventLoopAgent
 from nodnod.interface.node_from_function import create_node_from_function
 
-from telegrinder.bot.dispatch.context import Context
+from telegrinder.bot.dispatch.context import SELF_CONTEXT_KEYS, Context
 from telegrinder.bot.dispatch.process import check_rule
-from telegrinder.modules import log_scope
+from telegrinder.modules import debug_log_scope
 from telegrinder.node.compose import create_composable
 from telegrinder.node.scope import PER_EVENT, NodeScope
 from telegrinder.node.utils import get_globals_from_function, get_locals_from_function
@@ -28,11 +30,24 @@ def get_rules_names(rules: typing.Iterable[ABCRule], /) -> typing.Iterable[str]:
     return (type(rule).__name__ for rule in rules)
 
 
+def is_context_parameter(parameter: inspect.Parameter, /) -> bool:
+    if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+        return False
+
+    if parameter.annotation is inspect.Parameter.empty:
+        return parameter.name in SELF_CONTEXT_KEYS
+
+    return isinstance(parameter.annotation, type) and issubclass(parameter.annotation, Context)
+
+
 class ABCRule(ABC):
     required_nodes: typing.Mapping[str, Node] | None = None
     agent_cls: type[Agent] = EventLoopAgent
     requires: deque[ABCRule] | None = None
     rule_scope: NodeScope = NodeScope.PER_CALL
+    pure: bool = False
+    """Whether the rule result depends only on the event and the rule doesn't change the context.
+    Results of pure rules are memoized per event, so the rule is checked at most once per update."""
 
     @abstractmethod
     def check(self, *args: typing.Any, **kwargs: typing.Any) -> CheckResult:
@@ -43,6 +58,7 @@ class ABCRule(ABC):
         *,
         requires: typing.Iterable[ABCRule] | None = None,
         scope: NodeScope = NodeScope.PER_CALL,
+        pure: bool = False,
     ) -> None:
         requirements: list[ABCRule] = []
 
@@ -53,6 +69,7 @@ class ABCRule(ABC):
         requirements.extend(requires or ())
         cls.requires = deque(dict.fromkeys(requirements))
         cls.rule_scope = scope
+        cls.pure = pure
 
     def __and__(self, other: object, /) -> AndRule:
         if not isinstance(other, ABCRule):
@@ -85,6 +102,27 @@ class ABCRule(ABC):
     def should_fail(self) -> ABCRule:
         return self & Never()
 
+    @cached_property
+    def context_parameters(self) -> tuple[str, ...] | None:
+        """Names of the `check` parameters if the rule needs nothing but the context,
+        so it can be checked by a direct call without composing nodes, otherwise `None`.
+        """
+        if self.required_nodes or self.agent_cls is not EventLoopAgent:
+            return None
+
+        if inspect.isgeneratorfunction(self.check) or inspect.isasyncgenfunction(self.check):
+            return None
+
+        try:
+            signature = inspect.signature(self.check, annotation_format=annotationlib.Format.FORWARDREF)
+        except TypeError, ValueError:
+            return None
+
+        if not all(map(is_context_parameter, signature.parameters.values())):
+            return None
+
+        return tuple(signature.parameters)
+
     @cached_property
     def composable(self) -> Composable:
         node = create_node_from_function(
@@ -99,9 +137,10 @@ class ABCRule(ABC):
 class AndRule(ABCRule):
     def __init__(self, *rules: ABCRule) -> None:
         self.rules = rules
+        self.pure = all(rule.pure for rule in rules)
 
     async def check(self, context: Context) -> bool:
-        with log_scope(lambda: "Rule{{{}}}".format(" & ".join(get_rules_names(self.rules)))):
+        with debug_log_scope(lambda: "Rule{{{}}}".format(" & ".join(get_rules_names(self.rules)))):
             for rule in self.rules:
                 if not await check_rule(rule, context):
                     return False
@@ -112,9 +151,10 @@ class AndRule(ABCRule):
 class OrRule(ABCRule):
     def __init__(self, *rules: ABCRule) -> None:
         self.rules = rules
+        self.pure = all(rule.pure for rule in rules)
 
     async def check(self, context: Context) -> bool:
-        with log_scope(lambda: "Rule{{{}}}".format(" | ".join(get_rules_names(self.rules)))):
+        with debug_log_scope(lambda: "Rule{{{}}}".format(" | ".join(get_rules_names(self.rules)))):
             for rule in self.rules:
                 if await check_rule(rule, context):
                     return True
@@ -125,20 +165,53 @@ class OrRule(ABCRule):
 class NotRule(ABCRule):
     def __init__(self, rule: ABCRule) -> None:
         self.rule = rule
+        self.pure = rule.pure
 
     async def check(self, context: Context) -> bool:
-        with log_scope(lambda: f"~{type(self).__name__}"):
+        with debug_log_scope(lambda: f"~{type(self).__name__}"):
             return not await check_rule(self.rule, context)
 
 
-class Never(ABCSingleton, ABCRule, scope=PER_EVENT):
+def compile_rule(rule: ABCRule, /) -> ABCRule:
+    """Compile the boolean rule tree into a flat evaluation plan.
+
+    Nested `AndRule` and `OrRule` are merged into one level, neutral elements (`Always` in `&`,
+    `Never` in `|`) are dropped, single-rule combinations are unwrapped and double negation is removed,
+    so short-circuiting evaluation of `(A & B) & (C & D)` costs one check of the combination instead of three.
+    Original rules are not changed.
+    """
+    rule_type = type(rule)
+
+    if rule_type is NotRule:
+        inner = compile_rule(typing.cast("NotRule", rule).rule)
+        return typing.cast("NotRule", inner).rule if type(inner) is NotRule else NotRule(inner)
+
+    if rule_type is not AndRule and rule_type is not OrRule:
+        return rule
+
+    neutral = Always if rule_type is AndRule else Never
+    rules: list[ABCRule] = []
+
+    for child in map(compile_rule, typing.cast("AndRule | OrRule", rule).rules):
+        if type(child) is rule_type:
+            rules.extend(typing.cast("AndRule | OrRule", child).rules)
+        elif type(child) is not neutral:
+            rules.append(child)
+
+    if not rules:
+        return neutral()
+
+    return rules[0] if len(rules) == 1 else rule_type(*rules)
+
+
+class Never(ABCSingleton, ABCRule, scope=PER_EVENT, pure=True):
     """Neutral element for `|` (OrRule)."""
 
     def check(self) -> typing.Literal[False]:
         return False
 
 
-class Always(ABCSingleton, ABCRule, scope=PER_EVENT):
+class Always(ABCSingleton, ABCRule, scope=PER_EVENT, pure=True):
     """Neutral element for `&` (AndRule)."""
 
     def check(self) -> typing.Literal[True]:
@@ -154,4 +227,5 @@ __all__ = (
     "NotRule",
     "OrRule",
     "check_rule",
+    "compile_rule",
 )
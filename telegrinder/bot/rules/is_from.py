@@ -10,22 +10,22 @@ type ForwardType = typing.Literal["user", "hidden_user", "chat", "channel"]
 TELEGRAM_ID: typing.Final = 777000
 
 
-class IsBot(ABCRule):
+class IsBot(ABCRule, pure=True):
     def check(self, user: UserSource) -> bool:
         return user.is_bot
 
 
-class IsUser(ABCRule):
+class IsUser(ABCRule, pure=True):
     def check(self, user: UserSource) -> bool:
         return not user.is_bot
 
 
-class IsPremium(ABCRule):
+class IsPremium(ABCRule, pure=True):
     def check(self, user: UserSource) -> bool:
         return user.is_premium.unwrap_or(False)
 
 
-class IsLanguageCode(ABCRule):
+class IsLanguageCode(ABCRule, pure=True):
     def __init__(self, lang_codes: str | list[str], /) -> None:
         self.lang_codes = [lang_codes] if isinstance(lang_codes, str) else lang_codes
 
@@ -33,7 +33,7 @@ class IsLanguageCode(ABCRule):
         return user.language_code.unwrap_or_none() in self.lang_codes
 
 
-class IsUserId(ABCRule):
+class IsUserId(ABCRule, pure=True):
     def __init__(self, user_ids: int | list[int], /) -> None:
         self.user_ids = [user_ids] if isinstance(user_ids, int) else user_ids
 
@@ -41,16 +41,16 @@ class IsUserId(ABCRule):
         return user.id in self.user_ids
 
 
-class IsTelegram(Always, requires=[IsUserId(TELEGRAM_ID)]):
+class IsTelegram(Always, requires=[IsUserId(TELEGRAM_ID)], pure=True):
     pass
 
 
-class IsForum(ABCRule):
+class IsForum(ABCRule, pure=True):
     def check(self, chat: ChatSource) -> bool:
         return chat.is_forum.unwrap_or(False)
 
 
-class IsChatId(ABCRule):
+class IsChatId(ABCRule, pure=True):
     def __init__(self, chat_ids: int | list[int], /) -> None:
         self.chat_ids = [chat_ids] if isinstance(chat_ids, int) else chat_ids
 
@@ -58,32 +58,32 @@ class IsChatId(ABCRule):
         return chat.id in self.chat_ids
 
 
-class IsPrivate(ABCRule):
+class IsPrivate(ABCRule, pure=True):
     def check(self, chat: ChatSource) -> bool:
         return chat.type == ChatType.PRIVATE
 
 
-class IsGroup(ABCRule):
+class IsGroup(ABCRule, pure=True):
     def check(self, chat: ChatSource) -> bool:
         return chat.type == ChatType.GROUP
 
 
-class IsSuperGroup(ABCRule):
+class IsSuperGroup(ABCRule, pure=True):
     def check(self, chat: ChatSource) -> bool:
         return chat.type == ChatType.SUPERGROUP
 
 
-class IsChat(ABCRule):
+class IsChat(ABCRule, pure=True):
     def check(self, chat: ChatSource) -> bool:
         return chat.type in (ChatType.GROUP, ChatType.SUPERGROUP)
 
 
-class IsDice(ABCRule):
+class IsDice(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.dice)
 
 
-class IsDiceEmoji(ABCRule, requires=[IsDice()]):
+class IsDiceEmoji(ABCRule, requires=[IsDice()], pure=True):
     def __init__(self, dice_emoji: DiceEmoji, /) -> None:
         self.dice_emoji = dice_emoji
 
@@ -91,12 +91,12 @@ class IsDiceEmoji(ABCRule, requires=[IsDice()]):
         return message.dice.unwrap().emoji == self.dice_emoji
 
 
-class IsForward(ABCRule):
+class IsForward(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.forward_origin)
 
 
-class IsForwardType(ABCRule, requires=[IsForward()]):
+class IsForwardType(ABCRule, requires=[IsForward()], pure=True):
     def __init__(self, fwd_type: ForwardType, /) -> None:
         self.fwd_type = fwd_type
 
@@ -104,77 +104,77 @@ class IsForwardType(ABCRule, requires=[IsForward()]):
         return message.forward_origin.unwrap().v.type == self.fwd_type
 
 
-class IsReply(ABCRule):
+class IsReply(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.reply_to_message)
 
 
-class IsSticker(ABCRule):
+class IsSticker(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.sticker)
 
 
-class IsVideoNote(ABCRule):
+class IsVideoNote(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.video_note)
 
 
-class IsDocument(ABCRule):
+class IsDocument(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.document)
 
 
-class IsPhoto(ABCRule):
+class IsPhoto(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.photo)
 
 
-class IsContact(ABCRule):
+class IsContact(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.contact)
 
 
-class IsLocation(ABCRule):
+class IsLocation(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.location)
 
 
-class IsChecklist(ABCRule):
+class IsChecklist(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.checklist)
 
 
-class IsGame(ABCRule):
+class IsGame(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.game)
 
 
-class IsPoll(ABCRule):
+class IsPoll(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.poll)
 
 
-class IsVenue(ABCRule):
+class IsVenue(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.venue)
 
 
-class IsNewChatMembers(ABCRule):
+class IsNewChatMembers(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.new_chat_members)
 
 
-class IsLeftChatMember(ABCRule):
+class IsLeftChatMember(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.left_chat_member)
 
 
-class IsNewChatTitle(ABCRule):
+class IsNewChatTitle(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.new_chat_title)
 
 
-class IsNewChatPhoto(ABCRule):
+class IsNewChatPhoto(ABCRule, pure=True):
     def check(self, message: MessageCute) -> bool:
         return bool(message.new_chat_photo)
 
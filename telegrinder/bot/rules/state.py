@@ -21,7 +21,11 @@ class State[Payload](ABCRule):
     key: str | StateMeta | enum.Enum
 
     async def check(self, source: Source, ctx: Context) -> bool:
-        state = await self.storage.get(source.from_user.id)
+        user_id = source.from_user.id
+        state_cache = ctx.get("state_cache")
+        state = await (
+            state_cache.get(self.storage, user_id) if state_cache is not None else self.storage.get(user_id)
+        )
         if not state:
             return self.key == StateMeta.NO_STATE
 
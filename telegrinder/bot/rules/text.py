@@ -3,17 +3,17 @@ from telegrinder.bot.rules.abc import ABCRule
 from telegrinder.bot.rules.node import NodeRule
 
 
-class HasText(NodeRule):
+class HasText(NodeRule, pure=True):
     def __init__(self) -> None:
         super().__init__(node.as_node(node.Text))
 
 
-class HasCaption(NodeRule):
+class HasCaption(NodeRule, pure=True):
     def __init__(self) -> None:
         super().__init__(node.as_node(node.Caption))
 
 
-class Text(ABCRule):
+class Text(ABCRule, pure=True):
     def __init__(self, texts: str | list[str], /, *, ignore_case: bool = False) -> None:
         if not isinstance(texts, list):
             texts = [texts]
@@ -1,11 +1,13 @@
-from telegrinder.client.abc import ABCClient, Response
+from telegrinder.client.abc import ABCClient, JsonBody, Response, StreamResponse
 from telegrinder.client.form_data import MultipartBuilderProto, encode_form_data
 from telegrinder.client.wreq_client import WreqClient
 
 __all__ = (
     "ABCClient",
+    "JsonBody",
     "MultipartBuilderProto",
     "Response",
+    "StreamResponse",
     "WreqClient",
     "encode_form_data",
 )
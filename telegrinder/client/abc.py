@@ -1,9 +1,12 @@
+import contextlib
 import dataclasses
 import typing
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from http import HTTPStatus
 
+from msgspex import encoder
+
 from telegrinder.client.form_data import MultipartBuilderProto, encode_form_data
 
 if typing.TYPE_CHECKING:
@@ -13,6 +16,8 @@ type Data = typing.Any
 type Files = dict[str, tuple[str, typing.Any]]
 type Timeout = int | float | datetime.timedelta
 
+JSON_CONTENT_TYPE: typing.Final = "application/json"
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class Response[T = typing.Any]:
@@ -21,9 +26,24 @@ class Response[T = typing.Any]:
     status: HTTPStatus
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class StreamResponse:
+    status: HTTPStatus
+    chunks: typing.AsyncIterator[bytes]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class JsonBody:
+    """Request body which is already serialized to `JSON`."""
+
+    content: str
+
+
 class ABCClient(ABC):
     CONNECTION_TIMEOUT_ERRORS: tuple[type[BaseException], ...] = ()
     CLIENT_CONNECTION_ERRORS: tuple[type[BaseException], ...] = ()
+    SUPPORTS_JSON_BODY: bool = False
+    """Whether the client accepts `JsonBody` as the request data, otherwise requests are sent as `multipart` form."""
 
     @abstractmethod
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
@@ -89,6 +109,25 @@ class ABCClient(ABC):
     ) -> bytes:
         pass
 
+    @contextlib.asynccontextmanager
+    async def request_stream(
+        self,
+        url: str,
+        method: str = "GET",
+        data: Data | None = None,
+        timeout: Timeout | None = None,
+        **kwargs: typing.Any,
+    ) -> typing.AsyncGenerator[StreamResponse, None]:
+        """Request a response whose body is read by chunks. Clients that cannot stream
+        the response body read it at once and return it as a single chunk.
+        """
+        response = await self.request(url, method, data, timeout, **kwargs)
+
+        async def chunks() -> typing.AsyncGenerator[bytes, None]:
+            yield response.content
+
+        yield StreamResponse(status=response.status, chunks=chunks())
+
     @abstractmethod
     async def close(self, **kwargs: typing.Any) -> None:
         pass
@@ -105,15 +144,17 @@ class ABCClient(ABC):
         data: dict[str, typing.Any] | None = None,
         files: Files | None = None,
     ) -> typing.Any:
-        builder = cls.multipart_form_builder()
-
         if not data and not files:
-            return builder.build()
+            return cls.multipart_form_builder().build()
 
-        data = data or {}
-        files = files or {}
+        files = files if files is not None else {}
+        return cls.build_form(encode_form_data(data or {}, files), files)
 
-        for k, v in encode_form_data(data, files).items():
+    @classmethod
+    def build_form(cls, fields: typing.Mapping[str, str], files: Files, /) -> typing.Any:
+        builder = cls.multipart_form_builder()
+
+        for k, v in fields.items():
             builder.add_field(k, v)
 
         for n, (filename, content) in files.items():
@@ -121,6 +162,27 @@ class ABCClient(ABC):
 
         return builder.build()
 
+    @classmethod
+    def get_body(
+        cls,
+        *,
+        data: dict[str, typing.Any] | None = None,
+        files: Files | None = None,
+    ) -> typing.Any:
+        """Get the request body: `JSON` body if there are no files to upload, otherwise `multipart` form.
+        The data is encoded to `JSON` at once, it's encoded into the `multipart` fields only if an input file
+        was found while encoding. Clients which don't set `SUPPORTS_JSON_BODY` always get the `multipart` form,
+        as returned by `get_form`.
+        """
+        if cls.SUPPORTS_JSON_BODY and not files:
+            attached_files: Files = {}
+            content = encoder.encode(data or {}, context=dict(files=attached_files))
+
+            if not attached_files:
+                return JsonBody(content)
+
+        return cls.get_form(data=data, files=files)
+
     async def __aenter__(self) -> typing.Self:
         return self
 
@@ -133,4 +195,4 @@ class ABCClient(ABC):
         await self.close()
 
 
-__all__ = ("ABCClient", "Response")
+__all__ = ("ABCClient", "JsonBody", "Response", "StreamResponse")
@@ -1,3 +1,4 @@
+import contextlib
 import dataclasses
 import datetime
 import pathlib
@@ -9,13 +10,13 @@ import certifi
 from wreq import exceptions, wreq
 
 from telegrinder.__meta__ import __version__
-from telegrinder.client.abc import ABCClient, Response
+from telegrinder.client.abc import JSON_CONTENT_TYPE, ABCClient, JsonBody, Response, StreamResponse
 from telegrinder.modules import json
 
 if typing.TYPE_CHECKING:
     from wreq.wreq import ClientConfig, Request
 
-type Data = dict[str, typing.Any] | wreq.Multipart
+type Data = dict[str, typing.Any] | wreq.Multipart | JsonBody
 type Method = typing.Literal["GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS", "TRACE", "PATCH"]
 
 _METHODS_MAP: typing.Final[dict[Method, wreq.Method]] = {
@@ -85,6 +86,7 @@ class WreqClient(ABCClient):
         exceptions.TlsError,
         exceptions.RustPanic,
     )
+    SUPPORTS_JSON_BODY: typing.ClassVar = True
 
     def __init__(self, **params: typing.Unpack[ClientConfig]) -> None:
         params.setdefault("user_agent", USER_AGENT)
@@ -120,35 +122,56 @@ class WreqClient(ABCClient):
     def multipart_form_builder(cls) -> WreqMultipartBuilder:
         return WreqMultipartBuilder()
 
-    async def request(
-        self,
-        url: str,
-        method: Method = "GET",
-        data: Data | None = None,
-        **kwargs: typing.Unpack[Request],
-    ) -> Response[wreq.Response]:
+    @staticmethod
+    def _prepare_request(data: Data | None, kwargs: Request, /) -> Request:
         kwargs.setdefault("version", wreq.Version.HTTP_2)
         kwargs.setdefault("zstd", DEFAULT_ZSTD)
 
         if data is not None:
             if isinstance(data, wreq.Multipart):
                 kwargs["multipart"] = data
+            elif isinstance(data, JsonBody):
+                kwargs["body"] = data.content
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": JSON_CONTENT_TYPE}
             elif isinstance(data, dict):
                 kwargs["json"] = data
 
         if (json_body := kwargs.pop("json", None)) is not None:
             kwargs["body"] = json.dumps(json_body)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": JSON_CONTENT_TYPE}
 
         if (timeout := kwargs.get("timeout")) is not None and isinstance(timeout, int | float):
             kwargs["timeout"] = datetime.timedelta(seconds=timeout)
 
-        response = await self._client.request(_METHODS_MAP[method], url, **kwargs)
+        return kwargs
+
+    async def request(
+        self,
+        url: str,
+        method: Method = "GET",
+        data: Data | None = None,
+        **kwargs: typing.Unpack[Request],
+    ) -> Response[wreq.Response]:
+        response = await self._client.request(_METHODS_MAP[method], url, **self._prepare_request(data, kwargs))
         return Response(
             response=response,
             content=await response.bytes(),
             status=HTTPStatus(response.status.as_int()),
         )
 
+    @contextlib.asynccontextmanager
+    async def request_stream(
+        self,
+        url: str,
+        method: Method = "GET",
+        data: Data | None = None,
+        **kwargs: typing.Unpack[Request],
+    ) -> typing.AsyncGenerator[StreamResponse, None]:
+        response = await self._client.request(_METHODS_MAP[method], url, **self._prepare_request(data, kwargs))
+
+        async with response.stream() as streamer:
+            yield StreamResponse(status=HTTPStatus(response.status.as_int()), chunks=aiter(streamer))
+
     async def request_text(
         self,
         *,
@@ -92,6 +92,7 @@ DEFAULT_BUFFERED_LOGURU_FORMAT: typing.Final = (
 
 CALL_STACK_CONTEXT: typing.Final = contextvars.ContextVar[tuple[types.FrameType, "OptExcInfo"]]("_call_stack")
 LOG_SCOPE: typing.Final = contextvars.ContextVar[str]("_log_scope", default="")
+NULL_CONTEXT: typing.Final = contextlib.nullcontext()
 LOG_BUFFER: typing.Final = contextvars.ContextVar[list["BufferedLogRecord"] | None](
     "_log_buffer",
     default=None,
@@ -219,6 +220,16 @@ def log_scope(
         LOG_SCOPE.reset(token)
 
 
+def debug_log_scope(
+    ident: str | typing.Callable[..., str],
+    /,
+    *args: typing.Any,
+    **kwargs: typing.Any,
+) -> contextlib.AbstractContextManager[None]:
+    """Log scope of the debug messages, which is skipped entirely if the debug level is disabled."""
+    return log_scope(ident, *args, **kwargs) if logger.is_enabled("DEBUG") else NULL_CONTEXT
+
+
 class BufferedStream:
     def __init__(self, stream: Sink, /) -> None:
         self.stream = stream
@@ -456,6 +467,38 @@ def _is_async_logger(logger: typing.Any, /) -> bool:
     return all(hasattr(logger, attr) for attr in AnyAsyncLogger.__protocol_attrs__)
 
 
+def _make_loguru_level_check(loguru_logger: typing.Any, /) -> typing.Callable[[str], bool]:
+    # Severities of loguru levels cannot be changed, and the core keeps the minimal level of its handlers up to date.
+    severities: dict[str, int] = {}
+
+    def is_enabled_for(level: str) -> bool:
+        if (severity := severities.get(level)) is None:
+            try:
+                severity = severities[level] = loguru_logger.level(level).no
+            except ValueError:
+                return False
+
+        return severity >= loguru_logger._core.min_level
+
+    return is_enabled_for
+
+
+def _make_level_check(logger: typing.Any, logger_module: LoggerModule | None, /) -> typing.Callable[[str], bool]:
+    if logger_module == "loguru" and hasattr(logger, "_core"):
+        return _make_loguru_level_check(logger)
+
+    # Adapters of logging loggers and structlog stdlib loggers; logging caches the checks until the level is set.
+    if (is_enabled_for := getattr(logger, "isEnabledFor", None)) is None:
+        if not isinstance(raw_logger := getattr(logger, "_logger", None), logging.Logger):
+            return lambda level: True
+
+        is_enabled_for = raw_logger.isEnabledFor
+
+    return lambda level: is_enabled_for(
+        logging.INFO if level == "SUCCESS" else logging._nameToLevel.get(level, logging.NOTSET),
+    )
+
+
 class AnyLogger(typing.Protocol):
     def debug(self, __msg: str, *args: typing.Any, **kwargs: typing.Any) -> None: ...
 
@@ -487,6 +530,8 @@ class AnyAsyncLogger(typing.Protocol):
 class Logger(AnyLogger, AnyAsyncLogger, typing.Protocol):
     def set_logger(self, __logger: AnyLogger) -> None: ...
 
+    def is_enabled(self, __level: str) -> bool: ...
+
 
 class WrapperAsyncLogger:
     def __init__(self, logger: Logger, /) -> None:
@@ -791,6 +836,7 @@ class _LoggerProxy:
     def __init__(self) -> None:
         self.logger = None
         self.logger_module = None
+        self.is_enabled_for: typing.Callable[[str], bool] = lambda level: False
 
     def __repr__(self) -> str:
         return "<LoggerProxy {}: {}>".format(
@@ -812,29 +858,19 @@ class _LoggerProxy:
             return self
 
         if __name in AnyLogger.__dict__ or __name in AnyAsyncLogger.__dict__:
-            is_async = __name.startswith("a")
-
-            if self.logging_module is not None:
-                level_name = __name.removeprefix("a").upper()
-                level_name = (
-                    "INFO"
-                    if level_name == "SUCCESS" and self.logger_module != "loguru"
-                    else "ERROR"
-                    if level_name == "EXCEPTION"
-                    else level_name
-                )
-                level = (
-                    logging._nameToLevel.get(level_name, logging.NOTSET)
-                    if self.logger_module != "loguru"
-                    else level_name
-                )
-                if not hasattr(self.logger, "isEnabledFor") and self.logger.isEnabledFor(level):  # type: ignore
-                    return self
-
-            return getattr(self.logger if not is_async else self.async_logger, __name)
+            return getattr(self.logger if not __name.startswith("a") else self.async_logger, __name)
 
         return self
 
+    def is_enabled(self, level: str, /) -> bool:
+        """Check whether messages of the level (e.g. `DEBUG`) are logged, so the work
+        needed only to log them can be skipped.
+
+        The check is resolved once per configured logger: it uses the cached level checks
+        of logging loggers (including structlog stdlib loggers) and the minimal handler level of loguru.
+        """
+        return self.is_enabled_for(level)
+
     def set_logger(self, logger: Logger, logger_module: LoggerModule | None = None) -> None:
         configured_logger = logger if not isinstance(logger, logging.Logger) else LoggingStyleAdapter(logger)
         self.logger = configured_logger
@@ -842,6 +878,7 @@ class _LoggerProxy:
             WrapperAsyncLogger(configured_logger) if not _is_async_logger(configured_logger) else configured_logger  # type: ignore
         )
         self.logger_module = logger_module
+        self.is_enabled_for = _make_level_check(configured_logger, logger_module)
 
 
 class _SetupLoggerKwargs(typing.TypedDict):
@@ -1220,15 +1257,7 @@ def _configure_loguru(
         extra=dict(telegrinder=True),
     )
 
-    def is_enabled_for(lvl: str) -> bool:
-        try:
-            lno = loguru_logger.level(lvl).no
-        except ValueError:
-            return False
-
-        return any(lno >= x.levelno for x in loguru_logger._core.handlers.values())
-
-    loguru_logger.isEnabledFor = is_enabled_for
+    loguru_logger.isEnabledFor = _make_loguru_level_check(loguru_logger)
     handlers = []
 
     if console_sink is not None:
@@ -1364,6 +1393,7 @@ __all__ = (
     "FileHandlerConfig",
     "LoggingStyleAdapter",
     "configure_dotenv",
+    "debug_log_scope",
     "json",
     "log_scope",
     "logger",
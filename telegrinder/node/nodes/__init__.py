@@ -28,7 +28,7 @@ from telegrinder.node.nodes.channel import (
 from telegrinder.node.nodes.command import CommandInfo
 from telegrinder.node.nodes.error import Error
 from telegrinder.node.nodes.event import EventNode
-from telegrinder.node.nodes.file import File, FileId
+from telegrinder.node.nodes.file import File, FileId, FileStream, StreamedFile
 from telegrinder.node.nodes.global_node import GlobalNode
 from telegrinder.node.nodes.i18n import ABCTranslator, BaseTranslator, I18NConfig, KeySeparator
 from telegrinder.node.nodes.managed_bot import (
@@ -73,6 +73,7 @@ __all__ = (
     "EventNode",
     "File",
     "FileId",
+    "FileStream",
     "GlobalNode",
     "HTMLCaption",
     "HTMLText",
@@ -96,6 +97,7 @@ __all__ = (
     "Source",
     "State",
     "StateMutator",
+    "StreamedFile",
     "SuccessfulPayment",
     "Text",
     "TextInteger",
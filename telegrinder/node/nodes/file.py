@@ -1,10 +1,14 @@
+import dataclasses
+import os
 import typing
 
+from kungfu.library.monad.result import Result
 from nodnod.error import NodeError
 from nodnod.interface.node_constructor import NodeConstructor
 
 import telegrinder.types as tg_types
-from telegrinder.api.api import API
+from telegrinder.api.api import API, FileWriter, ProgressCallback
+from telegrinder.api.error import APIError
 from telegrinder.node.nodes.attachment import Animation, Audio, Document, Photo, Video, VideoNote, Voice
 
 type Attachment = Animation | Audio | Document | Photo | Video | VideoNote | Voice
@@ -28,12 +32,47 @@ class FileNode(NodeConstructor):
         return (await api.get_file(file_id=file_id)).expect(NodeError("File can't be downloaded."))
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class FileStream:
+    """File which is downloaded by chunks without buffering the whole file in memory."""
+
+    api: API
+    file: tg_types.File
+
+    @property
+    def file_path(self) -> str:
+        return self.file.file_path.unwrap()
+
+    def __aiter__(self) -> typing.AsyncGenerator[bytes, None]:
+        return self.api.iter_file(self.file_path)
+
+    async def save(
+        self,
+        destination: str | os.PathLike[str] | FileWriter,
+        *,
+        on_progress: ProgressCallback | None = None,
+    ) -> Result[int, APIError]:
+        return await self.api.download_file_to(self.file_path, destination, on_progress=on_progress)
+
+
+class FileStreamNode(NodeConstructor):
+    def __init__(self, attachment_node: type[Attachment], /) -> None:
+        self.__map__ = {tg_types.File: FileNode[attachment_node]}
+
+    def __compose__(self, api: API, file: tg_types.File) -> FileStream:
+        if not file.file_path:
+            raise NodeError("File can't be downloaded.")
+        return FileStream(api, file)
+
+
 if typing.TYPE_CHECKING:
     type FileId[T: Attachment] = str
     type File[T: Attachment] = tg_types.File
+    type StreamedFile[T: Attachment] = FileStream
 else:
     FileId = FileIdNode
     File = FileNode
+    StreamedFile = FileStreamNode
 
 
-__all__ = ("File", "FileId")
+__all__ = ("File", "FileId", "FileStream", "StreamedFile")
@@ -4,10 +4,12 @@ from kungfu.library.monad.option import Some
 from nodnod.error import NodeError
 from nodnod.node import Node
 
+from telegrinder.bot.dispatch.context import Context
 from telegrinder.node.nodes.payload import PayloadSerializer
 from telegrinder.node.nodes.source import Source
 from telegrinder.tools.fullname import fullname
 from telegrinder.tools.serialization import ABCDataSerializer
+from telegrinder.tools.state_storage.cache import StateCache
 from telegrinder.tools.state_storage.memory import ABCStateStorage, MemoryStateStorage
 
 
@@ -20,13 +22,21 @@ class StateMutator(Node):
         storage: ABCStateStorage[str],
         user_id: int,
         serializer: type[ABCDataSerializer[State]],
+        cache: StateCache | None = None,
     ) -> None:
         self.storage = storage
         self.user_id = user_id
         self.serializer = serializer
+        self.cache = cache
 
     async def get(self) -> State | None:
-        match await self.storage.get(self.user_id):
+        stored_state = (
+            await self.cache.get(self.storage, self.user_id)
+            if self.cache is not None
+            else await self.storage.get(self.user_id)
+        )
+
+        match stored_state:
             case Some(state_data) if state_data.key in self.KEY_MAP:
                 return (
                     self.serializer(self.KEY_MAP[state_data.key])
@@ -41,12 +51,17 @@ class StateMutator(Node):
         state_cls = state.__class__
         key = fullname(state_cls)
         payload = self.serializer(state_cls).serialize(state)
-        await self.storage.set(self.user_id, key, payload)
+
+        if self.cache is not None:
+            await self.cache.set(self.storage, self.user_id, key, payload)
+        else:
+            await self.storage.set(self.user_id, key, payload)
+
         self.KEY_MAP[key] = state_cls
 
     @classmethod
-    def __compose__(cls, src: Source, serializer: PayloadSerializer) -> typing.Self:
-        return cls(cls.STORAGE, src.from_user.id, serializer.serializer)
+    def __compose__(cls, src: Source, serializer: PayloadSerializer, context: Context) -> typing.Self:
+        return cls(cls.STORAGE, src.from_user.id, serializer.serializer, context.get("state_cache"))
 
 
 class State:
@@ -101,7 +101,7 @@ from telegrinder.tools.serialization import (
     MsgPackSerializer,
 )
 from telegrinder.tools.singleton import ABCSingleton, ABCSingletonMeta, Singleton, SingletonMeta
-from telegrinder.tools.state_storage import ABCStateStorage, MemoryStateStorage, StateData
+from telegrinder.tools.state_storage import ABCStateStorage, MemoryStateStorage, StateCache, StateData
 from telegrinder.tools.strings import to_utf16_map, utf8_utf16_length, utf16_to_py_index
 from telegrinder.tools.waiter_machine import (
     CALLBACK_QUERY_FOR_MESSAGE,
@@ -112,6 +112,7 @@ from telegrinder.tools.waiter_machine import (
     MESSAGE_IN_CHAT,
     Hasher,
     ShortState,
+    TimerWheel,
     WaiterMachine,
 )
 
@@ -156,11 +157,13 @@ __all__ = (
     "ShortState",
     "Singleton",
     "SingletonMeta",
+    "StateCache",
     "StateData",
     "SuccessButton",
     "SuccessInlineButton",
     "TaskGroup",
     "TelegrinderContext",
+    "TimerWheel",
     "WaiterMachine",
     "additional_property",
     "blockquote",
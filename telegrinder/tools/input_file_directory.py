@@ -1,30 +1,64 @@
 import dataclasses
 import pathlib
+import typing
+from collections import OrderedDict
 
+from telegrinder.types.input_file import PathInputFile
 from telegrinder.types.objects import InputFile
 
+DEFAULT_CACHE_SIZE: typing.Final = 128
+
 
 @dataclasses.dataclass
 class InputFileDirectory:
+    """Directory of input files.
+
+    By default all files are read into memory on creation. In `lazy` mode the directory
+    only indexes paths and reads files on demand, keeping at most `cache_size` recently used files
+    in memory. With `cache_size=0` files are never read into memory: they're streamed
+    from the disk into the `multipart` body at send time.
+    """
+
     directory: pathlib.Path
+    lazy: bool = dataclasses.field(default=False, kw_only=True)
+    cache_size: int = dataclasses.field(default=DEFAULT_CACHE_SIZE, kw_only=True)
     storage: dict[str, InputFile] = dataclasses.field(init=False, repr=False)
+    paths: dict[str, pathlib.Path] = dataclasses.field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.storage = self._load_files()
+        self.paths = self._index_files()
+        self.storage = OrderedDict() if self.lazy else self._load_files()
+
+    def _index_files(self) -> dict[str, pathlib.Path]:
+        return {
+            str(path.relative_to(self.directory)): path for path in self.directory.rglob("*") if path.is_file()
+        }
 
     def _load_files(self) -> dict[str, InputFile]:
-        files = {}
+        return {name: InputFile(path.name, path.read_bytes()) for name, path in self.paths.items()}
+
+    def _load_file(self, filename: str, /) -> InputFile:
+        path = self.paths[filename]
+
+        if self.cache_size <= 0:
+            return PathInputFile(path)
+
+        storage = typing.cast("OrderedDict[str, InputFile]", self.storage)
+
+        if (input_file := storage.get(filename)) is not None:
+            storage.move_to_end(filename)
+            return input_file
+
+        input_file = storage[filename] = InputFile(path.name, path.read_bytes())
 
-        for path in self.directory.rglob("*"):
-            if path.is_file():
-                relative_path = path.relative_to(self.directory)
-                files[str(relative_path)] = InputFile(path.name, path.read_bytes())
+        if len(storage) > self.cache_size:
+            storage.popitem(last=False)
 
-        return files
+        return input_file
 
     def get(self, filename: str, /) -> InputFile:
-        assert filename in self.storage, f"File {filename!r} not found."
-        return self.storage[filename]
+        assert filename in self.paths, f"File {filename!r} not found."
+        return self._load_file(filename) if self.lazy else self.storage[filename]
 
 
 __all__ = ("InputFileDirectory",)
@@ -1,35 +1,69 @@
-from collections import UserDict, deque
+import typing
+from collections import OrderedDict, UserDict
+
+type EvictionPolicy = typing.Literal["fifo", "lru"]
 
 
 class LimitedDict[Key, Value](UserDict[Key, Value]):
-    def __init__(self, *, maxlimit: int = 1000) -> None:
+    """Mapping bounded by `maxlimit` items, all operations are O(1).
+
+    When the limit is reached, setting a new key evicts the oldest item: the first inserted one
+    with the `fifo` policy or the least recently set or got one with the `lru` policy.
+    Membership checks and iteration don't count as usage.
+    """
+
+    data: OrderedDict[Key, Value]
+
+    def __init__(self, *, maxlimit: int = 1000, policy: EvictionPolicy = "fifo") -> None:
+        if maxlimit < 1:
+            raise ValueError("LimitedDict maxlimit must be a positive number.")
+
+        if policy not in ("fifo", "lru"):
+            raise ValueError("Unknown eviction policy {!r}.".format(policy))
+
         super().__init__()
+        self.data = OrderedDict()
         self.maxlimit = maxlimit
-        self.queue: deque[Key] = deque(maxlen=maxlimit)
+        self.policy = policy
+        self._lru = policy == "lru"
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.data)
 
     def set(self, key: Key, value: Value, /) -> Value | None:
         """Set item in the dictionary.
         Returns a value that was deleted when the limit in the dictionary
         was reached, otherwise None.
         """
-        deleted_item = None
+        data = self.data
 
-        if len(self.queue) >= self.maxlimit:
-            deleted_item = self.pop(self.queue.popleft(), None)
+        if key in data:
+            data[key] = value
 
-        if key not in self.queue:
-            self.queue.append(key)
+            if self._lru:
+                data.move_to_end(key)
 
-        super().__setitem__(key, value)
+            return None
+
+        deleted_item = data.popitem(last=False)[1] if len(data) >= self.maxlimit else None
+        data[key] = value
         return deleted_item
 
+    def copy(self) -> typing.Self:
+        limited_dict = type(self)(maxlimit=self.maxlimit, policy=self.policy)
+        limited_dict.data.update(self.data)
+        return limited_dict
+
+    def __getitem__(self, key: Key, /) -> Value:
+        value = self.data[key]
+
+        if self._lru:
+            self.data.move_to_end(key)
+
+        return value
+
     def __setitem__(self, key: Key, value: Value, /) -> None:
         self.set(key, value)
 
-    def __delitem__(self, key: Key, /) -> None:
-        if key in self.queue:
-            self.queue.remove(key)
-        return super().__delitem__(key)
-
 
-__all__ = ("LimitedDict",)
+__all__ = ("EvictionPolicy", "LimitedDict")
@@ -1,4 +1,5 @@
 from telegrinder.tools.state_storage.abc import ABCStateStorage, StateData
+from telegrinder.tools.state_storage.cache import StateCache
 from telegrinder.tools.state_storage.memory import MemoryStateStorage
 
-__all__ = ("ABCStateStorage", "MemoryStateStorage", "StateData")
+__all__ = ("ABCStateStorage", "MemoryStateStorage", "StateCache", "StateData")
@@ -28,6 +28,15 @@ class ABCStateStorage[Payload](abc.ABC):
     @abc.abstractmethod
     async def set(self, user_id: int, key: str | enum.Enum, payload: Payload) -> None: ...
 
+    async def get_many(self, user_ids: typing.Iterable[int]) -> dict[int, Option[StateData[Payload]]]:
+        """Get states of the users, override it if the storage can fetch them in one round-trip."""
+        return {user_id: await self.get(user_id) for user_id in user_ids}
+
+    async def set_many(self, states: typing.Mapping[int, StateData[Payload]]) -> None:
+        """Set states of the users, override it if the storage can save them in one round-trip."""
+        for user_id, state in states.items():
+            await self.set(user_id, key=state.key, payload=state.payload)
+
     def State(self, key: str | StateMeta | enum.Enum | None = None, /) -> State[Payload]:  # noqa: N802
         """Can be used as a shortcut to get a state rule dependant on current storage."""
         from telegrinder.bot.rules.state import State, StateMeta
@@ -0,0 +1,89 @@
+import enum
+import typing
+
+from kungfu.library.monad.option import NOTHING, Option, Some
+
+from telegrinder.tools.state_storage.abc import ABCStateStorage, StateData
+
+type CacheKey = tuple[int, int]
+
+
+class StateCache:
+    """Per-event read-through cache of the states, so the state of the user is fetched
+    from the storage at most once while the event is processed (by the rules and the handler).
+
+    Writes through the cache (`set`, `delete`, or `StateMutator` of the handler) update the cached state.
+    Writes made directly with the storage (e.g. `storage.set(...)` in the handler) bypass the cache,
+    so the state must be dropped from the cache with `invalidate` to be read from the storage again.
+
+    The dispatch calls `release` when the event is processed, which runs the release callbacks
+    (e.g. added by `StatePrefetchMiddleware`) and drops the cached states.
+    """
+
+    __slots__ = ("_states", "_release_callbacks")
+
+    def __init__(self) -> None:
+        self._states: dict[CacheKey, Option[StateData[typing.Any]]] = {}
+        self._release_callbacks: list[typing.Callable[[], typing.Any]] = []
+
+    def __repr__(self) -> str:
+        return "<{}: states={}>".format(type(self).__name__, len(self._states))
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, key: object, /) -> bool:
+        return key in self._states
+
+    def add_release_callback(self, callback: typing.Callable[[], typing.Any], /) -> None:
+        """Add the callback which is called once the event is processed."""
+        self._release_callbacks.append(callback)
+
+    def release(self) -> None:
+        """Run the release callbacks and drop the cached states."""
+        self._states.clear()
+
+        while self._release_callbacks:
+            self._release_callbacks.pop()()
+
+    @staticmethod
+    def get_key(storage: ABCStateStorage[typing.Any], user_id: int, /) -> CacheKey:
+        return (id(storage), user_id)
+
+    def put[Payload](
+        self,
+        storage: ABCStateStorage[Payload],
+        user_id: int,
+        state: Option[StateData[Payload]],
+        /,
+    ) -> None:
+        self._states[self.get_key(storage, user_id)] = state
+
+    def invalidate(self, storage: ABCStateStorage[typing.Any], user_id: int, /) -> None:
+        """Drop the cached state of the user, so it's read from the storage again."""
+        self._states.pop(self.get_key(storage, user_id), None)
+
+    async def get[Payload](self, storage: ABCStateStorage[Payload], user_id: int, /) -> Option[StateData[Payload]]:
+        key = self.get_key(storage, user_id)
+
+        if (state := self._states.get(key)) is None:
+            state = self._states[key] = await storage.get(user_id)
+
+        return state
+
+    async def set[Payload](
+        self,
+        storage: ABCStateStorage[Payload],
+        user_id: int,
+        key: str | enum.Enum,
+        payload: Payload,
+    ) -> None:
+        await storage.set(user_id, key=key, payload=payload)
+        self.put(storage, user_id, Some(StateData(key, payload)))
+
+    async def delete(self, storage: ABCStateStorage[typing.Any], user_id: int, /) -> None:
+        await storage.delete(user_id)
+        self.put(storage, user_id, NOTHING)
+
+
+__all__ = ("StateCache",)
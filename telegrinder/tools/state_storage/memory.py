@@ -20,6 +20,12 @@ class MemoryStateStorage[T = Payload](ABCStateStorage[T]):
     async def set(self, user_id: int, key: str, payload: T) -> None:
         self.storage[user_id] = StateData(key, payload)
 
+    async def get_many(self, user_ids: typing.Iterable[int]) -> dict[int, Option[StateData[T]]]:
+        return {user_id: from_optional(self.storage.get(user_id)) for user_id in user_ids}
+
+    async def set_many(self, states: typing.Mapping[int, StateData[T]]) -> None:
+        self.storage.update(states)
+
     async def delete(self, user_id: int) -> None:
         self.storage.pop(user_id)
 
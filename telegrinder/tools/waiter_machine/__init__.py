@@ -9,6 +9,7 @@ from telegrinder.tools.waiter_machine.hasher import (
 )
 from telegrinder.tools.waiter_machine.machine import WaiterMachine
 from telegrinder.tools.waiter_machine.short_state import ShortState
+from telegrinder.tools.waiter_machine.timer_wheel import Timer, TimerWheel
 
 __all__ = (
     "CALLBACK_QUERY_FOR_MESSAGE",
@@ -19,5 +20,7 @@ __all__ = (
     "MESSAGE_IN_CHAT",
     "Hasher",
     "ShortState",
+    "Timer",
+    "TimerWheel",
     "WaiterMachine",
 )
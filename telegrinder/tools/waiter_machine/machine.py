@@ -11,6 +11,7 @@ from telegrinder.tools.waiter_machine.short_state import (
     ShortState,
     ShortStateContext,
 )
+from telegrinder.tools.waiter_machine.timer_wheel import TIMER_RESOLUTION, TimerWheel
 
 if typing.TYPE_CHECKING:
     from telegrinder.bot.cute_types.base import BaseCute
@@ -58,9 +59,11 @@ class WaiterMachine:
         *,
         max_storage_size: int = MAX_STORAGE_SIZE,
         base_state_lifetime: datetime.timedelta = WEEK,
+        timer_resolution: float = TIMER_RESOLUTION,
     ) -> None:
         self.max_storage_size = max_storage_size
         self.base_state_lifetime = base_state_lifetime
+        self.timer_wheel = TimerWheel(resolution=timer_resolution)
         self.view = None
         self.storage = {}
 
@@ -197,7 +200,12 @@ class WaiterMachine:
 
         async with lifespan or Lifespan():
             try:
-                await short_state.acquire(self.drop_state_many, (hasher, data), lifetime=lifetime)
+                await short_state.acquire(
+                    self.drop_state_many,
+                    (hasher, data),
+                    timer_wheel=self.timer_wheel,
+                    lifetime=lifetime,
+                )
             finally:
                 if hasher in self.storage:
                     self.storage[hasher].pop(waiter_hash, None)
@@ -246,7 +254,12 @@ class WaiterMachine:
 
         async with lifespan or Lifespan():
             try:
-                await short_state.acquire(self.drop_state_many, *hashers, lifetime=lifetime)
+                await short_state.acquire(
+                    self.drop_state_many,
+                    *hashers,
+                    timer_wheel=self.timer_wheel,
+                    lifetime=lifetime,
+                )
             finally:
                 for h, hashes in waiter_hashes.items():
                     for waiter_hash in hashes:
@@ -1,6 +1,7 @@
 import asyncio
 import dataclasses
 import datetime
+import time
 import typing
 
 from telegrinder.modules import flush_log_buffer
@@ -13,6 +14,7 @@ if typing.TYPE_CHECKING:
     from telegrinder.bot.rules.abc import ABCRule
     from telegrinder.tools.waiter_machine.actions import WaiterActions
     from telegrinder.tools.waiter_machine.machine import HasherWithData, HasherWithViewAndData
+    from telegrinder.tools.waiter_machine.timer_wheel import Timer, TimerWheel
 
 
 class ShortStateContext[Event: BaseCute[typing.Any] = typing.Any](typing.NamedTuple):
@@ -36,17 +38,24 @@ class ShortState[Event: BaseCute[typing.Any] = typing.Any]:
     )
     expiration_date: datetime.datetime = dataclasses.field(init=False)
     creation_date: datetime.datetime = dataclasses.field(init=False)
+    deadline: float = dataclasses.field(init=False)
+    """Expiration time on the `time.monotonic()` clock."""
     event: asyncio.Event = dataclasses.field(default_factory=asyncio.Event, init=False)
     context: ShortStateContext[Event] | None = dataclasses.field(default=None, init=False)
-    drop_timer: asyncio.TimerHandle | None = dataclasses.field(default=None, init=False)
+    drop_timer: Timer | None = dataclasses.field(default=None, init=False)
 
     def __post_init__(self, expiration: datetime.timedelta) -> None:
         self.lifetime = expiration
         self.creation_date = datetime.datetime.now()
         self.expiration_date = self.creation_date + expiration
+        self.deadline = time.monotonic() + expiration.total_seconds()
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.deadline
 
     def _cancel_drop_timer(self) -> None:
-        if self.drop_timer is not None and not self.drop_timer.cancelled():
+        if self.drop_timer is not None:
             self.drop_timer.cancel()
             self.drop_timer = None
 
@@ -59,9 +68,7 @@ class ShortState[Event: BaseCute[typing.Any] = typing.Any]:
         if event is not None and context is not None:
             self.context = ShortStateContext(event, context)
 
-        if self.drop_timer is not None and not self.drop_timer.cancelled():
-            self.drop_timer.cancel()
-            self.drop_timer = None
+        self._cancel_drop_timer()
 
         if not self.event.is_set():
             self.event.set()
@@ -71,14 +78,15 @@ class ShortState[Event: BaseCute[typing.Any] = typing.Any]:
         dropper: typing.Callable[..., typing.Coroutine[typing.Any, typing.Any, typing.Any]],
         /,
         *hashers: HasherWithData[Event, HasherData] | HasherWithViewAndData[Event, ViewType, HasherData],
+        timer_wheel: TimerWheel,
         **context: typing.Any,
     ) -> None:
         self.event.clear()
 
         loop = asyncio.get_running_loop()
-        self.drop_timer = loop.call_later(
-            delay=self.lifetime.total_seconds(),
-            callback=lambda: loop.create_task(dropper(self, *hashers, expired=True, **context)),
+        self.drop_timer = timer_wheel.schedule(
+            self.deadline,
+            lambda: loop.create_task(dropper(self, *hashers, expired=True, **context)),
         )
 
         flush_log_buffer()
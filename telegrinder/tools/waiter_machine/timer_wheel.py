@@ -0,0 +1,178 @@
+import asyncio
+import math
+import time
+import typing
+
+from telegrinder.modules import logger
+
+TIMER_RESOLUTION: typing.Final = 1.0
+WHEEL_BITS: typing.Final = 6
+WHEEL_SIZE: typing.Final = 1 << WHEEL_BITS
+WHEEL_MASK: typing.Final = WHEEL_SIZE - 1
+WHEEL_LEVELS: typing.Final = 4
+
+
+class Timer:
+    """Timer scheduled in the timer wheel, cancelled in O(1)."""
+
+    __slots__ = ("deadline", "tick", "callback", "_wheel", "_bucket")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        deadline: float,
+        tick: int,
+        callback: typing.Callable[[], typing.Any],
+        /,
+    ) -> None:
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self._wheel = wheel
+        self._bucket: set[Timer] | None = None
+
+    def __repr__(self) -> str:
+        return "<{}: deadline={}, pending={}>".format(type(self).__name__, self.deadline, self.pending)
+
+    @property
+    def pending(self) -> bool:
+        return self._bucket is not None
+
+    def cancel(self) -> None:
+        if self._bucket is not None:
+            self._bucket.discard(self)
+            self._bucket = None
+            self._wheel._size -= 1
+
+
+class TimerWheel:
+    """Hierarchical timer wheel with `monotonic` clock deadlines.
+
+    Timers are bucketed by the tick of `resolution` seconds into `WHEEL_LEVELS` levels of `WHEEL_SIZE` slots,
+    each level covering `WHEEL_SIZE` times more ticks than the previous one (about 194 days with one second
+    resolution, later timers are cascaded until they fit). Scheduling and cancelling are O(1).
+
+    While the wheel has timers, a single loop callback ticks it every `resolution` seconds,
+    cascading the timers of the upper levels down and firing the callbacks of the expired ones.
+    Timers fire no earlier than their deadline and no later than one tick after it.
+    """
+
+    __slots__ = ("resolution", "_origin", "_tick", "_size", "_levels", "_loop", "_handle")
+
+    def __init__(self, *, resolution: float = TIMER_RESOLUTION) -> None:
+        if resolution <= 0:
+            raise ValueError("Timer wheel resolution must be a positive number.")
+
+        self.resolution = resolution
+        self._origin = time.monotonic()
+        self._tick = 0
+        self._size = 0
+        self._levels: tuple[tuple[set[Timer], ...], ...] = tuple(
+            tuple(set() for _ in range(WHEEL_SIZE)) for _ in range(WHEEL_LEVELS)
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return "<{}: timers={}, resolution={}>".format(type(self).__name__, self._size, self.resolution)
+
+    def _insert(self, timer: Timer, min_tick: int, /) -> None:
+        tick = max(timer.tick, min_tick)
+        delta = tick - self._tick
+        level = 0
+
+        while level < WHEEL_LEVELS - 1 and delta >> (WHEEL_BITS * (level + 1)):
+            level += 1
+
+        if delta >> (WHEEL_BITS * WHEEL_LEVELS):
+            # Beyond the range of the wheel, the timer is cascaded again from the farthest slot.
+            tick = self._tick + (1 << (WHEEL_BITS * WHEEL_LEVELS)) - 1
+
+        bucket = self._levels[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK]
+        bucket.add(timer)
+        timer._bucket = bucket
+
+    def schedule(self, deadline: float, callback: typing.Callable[[], typing.Any], /) -> Timer:
+        """Schedule the callback to be called at the `time.monotonic()` deadline."""
+        if not self._size:
+            # The wheel isn't ticking while empty, catch up with the clock in one step.
+            self._tick = max(self._tick, math.floor((time.monotonic() - self._origin) / self.resolution))
+
+        timer = Timer(self, deadline, math.ceil((deadline - self._origin) / self.resolution), callback)
+        self._insert(timer, self._tick + 1)
+        self._size += 1
+        self._start_ticking()
+        return timer
+
+    def schedule_after(self, delay: float, callback: typing.Callable[[], typing.Any], /) -> Timer:
+        return self.schedule(time.monotonic() + delay, callback)
+
+    def advance(self, now: float, /) -> int:
+        """Advance the wheel to the `time.monotonic()` time and fire the expired timers.
+        Returns the number of fired timers.
+        """
+        target = math.floor((now - self._origin) / self.resolution)
+        fired = 0
+
+        while self._tick < target:
+            if not self._size:
+                self._tick = target
+                break
+
+            tick = self._tick = self._tick + 1
+
+            for level in range(1, WHEEL_LEVELS):
+                if tick & ((1 << (WHEEL_BITS * level)) - 1):
+                    break
+
+                bucket = self._levels[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK]
+                timers = tuple(bucket)
+                bucket.clear()
+
+                for timer in timers:
+                    self._insert(timer, tick)
+
+            bucket = self._levels[0][tick & WHEEL_MASK]
+            timers = tuple(bucket)
+            bucket.clear()
+
+            for timer in timers:
+                timer._bucket = None
+                self._size -= 1
+                fired += 1
+
+                try:
+                    timer.callback()
+                except Exception:
+                    logger.exception("Timer callback {!r} failed, traceback message below:", timer.callback)
+
+        return fired
+
+    def _start_ticking(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if self._handle is None or self._loop is not loop:
+            self._loop = loop
+            self._handle = loop.call_later(self._get_next_tick_delay(), self._on_tick)
+
+    def _get_next_tick_delay(self) -> float:
+        return max(self._origin + (self._tick + 1) * self.resolution - time.monotonic(), 0.0)
+
+    def _on_tick(self) -> None:
+        self._handle = None
+        self.advance(time.monotonic())
+
+        if self._size and self._loop is not None:
+            self._handle = self._loop.call_later(self._get_next_tick_delay(), self._on_tick)
+
+    def close(self) -> None:
+        """Stop ticking, pending timers are kept and fire after the wheel is ticking again."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+__all__ = ("Timer", "TimerWheel")
@@ -4,7 +4,7 @@ import typing
 
 from msgspex import encoder
 
-type Files = dict[str, tuple[str, bytes]]
+type Files = dict[str, tuple[str, bytes | pathlib.Path]]
 
 
 class InputFile:
@@ -32,10 +32,21 @@ class InputFile:
             (self.data[:30] + b"...") if len(self.data) > 30 else self.data,
         )
 
+    @typing.overload
     @classmethod
-    def from_path(cls, path: str | pathlib.Path, /) -> typing.Self:
+    def from_path(cls, path: str | pathlib.Path, /, *, lazy: typing.Literal[False] = False) -> typing.Self: ...
+
+    @typing.overload
+    @classmethod
+    def from_path(cls, path: str | pathlib.Path, /, *, lazy: typing.Literal[True]) -> PathInputFile: ...
+
+    @classmethod
+    def from_path(cls, path: str | pathlib.Path, /, *, lazy: bool = False) -> typing.Self | PathInputFile:
+        """Create an input file from the path. If `lazy` is True, the file isn't read into memory,
+        it's streamed from the disk into the `multipart` body at send time as `PathInputFile`.
+        """
         path = pathlib.Path(path)
-        return cls(path.name, path.read_bytes())
+        return PathInputFile(path) if lazy else cls(path.name, path.read_bytes())
 
     def _to_multipart(self, files: Files, /) -> str:
         attach_name = secrets.token_urlsafe(16)
@@ -43,9 +54,44 @@ class InputFile:
         return f"attach://{attach_name}"
 
 
+class PathInputFile(InputFile):
+    """Input file backed by the filesystem path, which is streamed into the `multipart` body at send time."""
+
+    __slots__ = ("path",)
+
+    path: pathlib.Path
+    """Path to the file."""
+
+    def __init__(self, path: str | pathlib.Path, /, filename: str | None = None) -> None:
+        self.path = pathlib.Path(path)
+        self.filename = filename or self.path.name
+
+    def __repr__(self) -> str:
+        return "{}(filename={!r}, path={!r})".format(type(self).__name__, self.filename, self.path)
+
+    @classmethod
+    def from_path(cls, path: str | pathlib.Path, /, *, lazy: bool = True) -> typing.Self:  # type: ignore[override]
+        """Create a path-backed input file from the path, it's always lazy."""
+        return cls(path)
+
+    @property
+    def data(self) -> bytes:  # type: ignore[override]
+        return self.path.read_bytes()
+
+    def _to_multipart(self, files: Files, /) -> str:
+        attach_name = secrets.token_urlsafe(16)
+        files[attach_name] = (self.filename, self.path)
+        return f"attach://{attach_name}"
+
+
 @encoder.add_enc_hook(InputFile)
 def encode_input_file(input_file: InputFile, files: Files) -> str:
     return input_file._to_multipart(files)
 
 
-__all__ = ("InputFile",)
+@encoder.add_enc_hook(PathInputFile)
+def encode_path_input_file(input_file: PathInputFile, files: Files) -> str:
+    return input_file._to_multipart(files)
+
+
+__all__ = ("InputFile", "PathInputFile")
@@ -0,0 +1,69 @@
+import typing
+
+import msgspec
+from kungfu.library.monad.option import NOTHING, Some
+from msgspex import Option, decoder, encoder
+
+_UNSET: typing.Final = object()
+
+
+class LazySome[T](Some[T]):
+    """`Some` whose value is created by the factory on first access."""
+
+    __slots__ = ("_factory", "_is_resolved")
+
+    def __init__(self, factory: typing.Callable[[], T], /) -> None:
+        self._factory = factory
+        self._is_resolved = False
+        super().__init__(typing.cast("T", _UNSET))
+
+    def _resolve(self) -> T:
+        if not self._is_resolved:
+            self._value = self._factory()
+            self._is_resolved = True
+
+        return object.__getattribute__(self, "_value")
+
+    def __getattribute__(self, name: str, /) -> typing.Any:
+        if name == "_value":
+            return object.__getattribute__(self, "_resolve")()
+        return object.__getattribute__(self, name)
+
+
+if typing.TYPE_CHECKING:
+    type LazyOption[Value] = Option[Value]
+else:
+
+    class LazyOption[Value](Option[Value]):
+        """Option field whose value is decoded into `Value` on first access.
+
+        The field is decoded into `LazySome`, which keeps the decoded builtin value and converts it
+        when it's accessed, so the nested models which are never touched aren't created.
+        An invalid value raises the validation error on first access, not while decoding.
+        """
+
+
+@decoder.add_dec_hook(LazyOption)
+def lazy_option_dec_hook(
+    tp: typing.Any,
+    obj: typing.Any,
+    /,
+    context: dict[str, typing.Any],
+    strict: bool = True,
+) -> typing.Any:
+    if obj is msgspec.UNSET or obj is NOTHING:
+        return obj
+
+    if obj is None:
+        return NOTHING
+
+    (value_type,) = typing.get_args(tp) or (typing.Any,)
+    return LazySome(lambda: decoder.convert(obj, type=value_type, strict=strict, context=context))
+
+
+@encoder.add_enc_hook(LazySome)
+def lazy_some_enc_hook(obj: LazySome[typing.Any], /) -> typing.Any:
+    return obj.unwrap()
+
+
+__all__ = ("LazyOption", "LazySome")
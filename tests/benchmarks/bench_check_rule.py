@@ -0,0 +1,55 @@
+"""Benchmark of `check_rule`: rules per second checked by composing nodes (before)
+and by the direct call fast path for rules which need nothing but the context (after).
+
+Run with `python -m tests.benchmarks.bench_check_rule`.
+"""
+
+import asyncio
+import time
+import typing
+
+from telegrinder.api.api import API, Token
+from telegrinder.bot.dispatch.context import Context
+from telegrinder.bot.dispatch.process import check_rule
+from telegrinder.bot.rules.abc import ABCRule, Always
+from telegrinder.node.compose import compose
+from telegrinder.node.scope import create_per_event_scope
+from tests.fixtures.message_update import UPDATE
+from tests.test_utils import MockedHttpClient
+
+ITERATIONS: typing.Final = 10_000
+
+type Check = typing.Callable[[ABCRule, Context], typing.Awaitable[bool]]
+
+
+class ContextRule(ABCRule):
+    def check(self, context: Context) -> bool:
+        return "update" in context
+
+
+async def check_composed(rule: ABCRule, context: Context) -> bool:
+    async with compose(rule.composable, context) as result:
+        return result.unwrap()
+
+
+async def measure(check: Check, rule: ABCRule, context: Context) -> float:
+    start = time.perf_counter()
+
+    for _ in range(ITERATIONS):
+        await check(rule, context)
+
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    api = API(Token("123:ABCdef"), http=MockedHttpClient())
+    context = Context().add_roots(api, UPDATE, create_per_event_scope())
+
+    for rule in (Always(), ContextRule(), ContextRule() & ContextRule()):
+        before = await measure(check_composed, rule, context)
+        after = await measure(check_rule, rule, context)
+        print(f"{type(rule).__name__}: {before:,.0f} -> {after:,.0f} rules/s (x{after / before:.1f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""Benchmark of `Context` attribute access and copying, compared with the context
+which looks up every attribute (including methods) in the mapping first.
+
+Run with `python -m tests.benchmarks.bench_context`.
+"""
+
+import time
+import typing
+
+from telegrinder.api.api import API, Token
+from telegrinder.bot.dispatch.context import Context
+from telegrinder.node.scope import create_per_event_scope
+from tests.fixtures.message_update import UPDATE
+from tests.test_utils import MockedHttpClient
+
+ITERATIONS: typing.Final = 1_000_000
+
+
+class MappingFirstContext(Context):
+    def __getattribute__(self, name: str, /) -> typing.Any:
+        try:
+            return self[name]
+        except KeyError:
+            return object.__getattribute__(self, name)
+
+    def copy(self) -> Context:
+        return MappingFirstContext(self)
+
+
+def measure(name: str, function: typing.Callable[[], typing.Any], /) -> float:
+    start = time.perf_counter()
+
+    for _ in range(ITERATIONS):
+        function()
+
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1_000_000_000
+    print(f"  {name}: {elapsed:.0f} ns")
+    return elapsed
+
+
+def main() -> None:
+    api = API(Token("123:ABCdef"), http=MockedHttpClient())
+
+    for context in (
+        MappingFirstContext().add_roots(api, UPDATE, create_per_event_scope()),
+        Context().add_roots(api, UPDATE, create_per_event_scope()),
+    ):
+        context.set("key", "value")
+        print(type(context).__name__)
+        measure("root attribute (context.api)", lambda: context.api)
+        measure("key attribute (context.key)", lambda: context.key)
+        measure("method lookup (context.get)", lambda: context.get)
+        measure("copy (context.copy())", lambda: context.copy())
+
+
+if __name__ == "__main__":
+    main()
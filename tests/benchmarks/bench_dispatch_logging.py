@@ -0,0 +1,54 @@
+"""Benchmark of `Dispatch.feed`: updates per second with the `INFO` log level,
+when the debug log scopes, formatting and timing are skipped, and with the `DEBUG` log level.
+
+Run with `python -m tests.benchmarks.bench_dispatch_logging`.
+"""
+
+import asyncio
+import io
+import time
+import typing
+
+from telegrinder.api.api import API, Token
+from telegrinder.bot.dispatch.dispatch import Dispatch
+from telegrinder.bot.rules.is_from import IsPrivate
+from telegrinder.bot.rules.text import Text
+from telegrinder.modules import _configure_logging
+from tests.fixtures.message_update import UPDATE
+from tests.test_utils import MockedHttpClient
+
+UPDATES: typing.Final = 5_000
+
+
+async def measure(level: typing.Literal["INFO", "DEBUG"], /) -> float:
+    _configure_logging(level, None, False, io.StringIO())
+
+    api = API(Token("123:ABCdef"), http=MockedHttpClient())
+    dispatch = Dispatch()
+
+    for index in range(10):
+
+        @dispatch.message(IsPrivate(), Text(f"text-{index}"))
+        async def handler() -> None:
+            pass
+
+    @dispatch.message(IsPrivate())
+    async def fallback_handler() -> None:
+        pass
+
+    start = time.perf_counter()
+
+    for _ in range(UPDATES):
+        await dispatch.feed(api, UPDATE)
+
+    return UPDATES / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    info = await measure("INFO")
+    debug = await measure("DEBUG")
+    print(f"INFO: {info:,.0f} updates/s, DEBUG: {debug:,.0f} updates/s (x{info / debug:.1f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
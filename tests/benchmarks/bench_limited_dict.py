@@ -0,0 +1,68 @@
+"""Benchmark of `LimitedDict` with 100k live waiters, compared with the previous implementation
+which tracked the insertion order in a `deque` with O(n) membership checks and removals.
+
+Run with `python -m tests.benchmarks.bench_limited_dict`.
+"""
+
+import time
+import typing
+from collections import UserDict, deque
+
+from telegrinder.tools.limited_dict import LimitedDict
+
+LIVE_WAITERS: typing.Final = 100_000
+OPERATIONS: typing.Final = 1_000
+
+
+class DequeLimitedDict[Key, Value](UserDict[Key, Value]):
+    def __init__(self, *, maxlimit: int = 1000) -> None:
+        super().__init__()
+        self.maxlimit = maxlimit
+        self.queue: deque[Key] = deque(maxlen=maxlimit)
+
+    def set(self, key: Key, value: Value, /) -> Value | None:
+        deleted_item = None
+
+        if len(self.queue) >= self.maxlimit:
+            deleted_item = self.pop(self.queue.popleft(), None)
+
+        if key not in self.queue:
+            self.queue.append(key)
+
+        super().__setitem__(key, value)
+        return deleted_item
+
+    def __setitem__(self, key: Key, value: Value, /) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Key, /) -> None:
+        if key in self.queue:
+            self.queue.remove(key)
+        return super().__delitem__(key)
+
+
+def measure(name: str, storage: typing.Any, /) -> float:
+    for waiter_hash in range(LIVE_WAITERS - 1):
+        storage[waiter_hash] = waiter_hash
+
+    start = time.perf_counter()
+
+    # A waiter is set and released while 100k other waiters are alive, as `WaiterMachine.wait` does.
+    for waiter_hash in range(LIVE_WAITERS, LIVE_WAITERS + OPERATIONS):
+        storage.set(waiter_hash, waiter_hash)
+        del storage[waiter_hash]
+
+    elapsed = (time.perf_counter() - start) / OPERATIONS * 1_000_000
+    print(f"  {name}: {elapsed:.2f} us per wait")
+    return elapsed
+
+
+def main() -> None:
+    print(f"{LIVE_WAITERS} live waiters")
+    measure("deque LimitedDict", DequeLimitedDict(maxlimit=LIVE_WAITERS))
+    measure("LimitedDict (fifo)", LimitedDict(maxlimit=LIVE_WAITERS))
+    measure("LimitedDict (lru)", LimitedDict(maxlimit=LIVE_WAITERS, policy="lru"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of decoding a batch of 100 updates where 90% come from an ignored chat,
+with the full `decoder(list[UpdateCute])` path and with the raw prefilter.
+
+Run with `python -m tests.benchmarks.bench_prefilter`.
+"""
+
+import time
+import typing
+
+import msgspec
+from msgspex import decoder
+
+from telegrinder.api.api import API, Token
+from telegrinder.bot.cute_types.update import UpdateCute
+from telegrinder.bot.polling import Polling, Prefilter
+from telegrinder.bot.polling.prefilter import chat_not_in
+from tests.test_utils import MockedHttpClient
+
+ITERATIONS: typing.Final = 1_000
+IGNORED_CHAT_ID: typing.Final = -100500
+
+
+def make_raw_updates() -> msgspec.Raw:
+    updates = []
+
+    for update_id in range(100):
+        chat_id = IGNORED_CHAT_ID if update_id % 10 else update_id
+        updates.append(
+            {
+                "update_id": update_id,
+                "message": {
+                    "message_id": update_id,
+                    "from": {"id": 123, "is_bot": False, "first_name": "John", "username": "Johndoe333"},
+                    "chat": {"id": chat_id, "type": "supergroup", "title": "Telegrinder"},
+                    "date": 1_713_971_200,
+                    "text": "Hello, Telegrinder! " * 10,
+                    "entities": [{"type": "bold", "offset": 0, "length": 5}],
+                },
+            },
+        )
+
+    return msgspec.Raw(msgspec.json.encode(updates))
+
+
+def measure(name: str, polling: Polling, raw: msgspec.Raw, /) -> float:
+    with decoder(list[UpdateCute]) as updates_decoder, decoder(UpdateCute) as update_decoder:
+        start = time.perf_counter()
+
+        for _ in range(ITERATIONS):
+            updates, _ = polling.decode_updates(raw, updates_decoder, update_decoder)
+
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1_000_000
+    print(f"  {name}: {elapsed:.0f} us per batch, {len(updates)} updates decoded")
+    return elapsed
+
+
+def main() -> None:
+    api = API(Token("123:ABCdef"), http=MockedHttpClient())
+    raw = make_raw_updates()
+
+    measure("full decoding", Polling(api), raw)
+    measure("prefilter", Polling(api, prefilter=Prefilter(chat_not_in(IGNORED_CHAT_ID))), raw)
+
+
+if __name__ == "__main__":
+    main()
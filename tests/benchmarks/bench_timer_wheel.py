@@ -0,0 +1,57 @@
+"""Benchmark of scheduling and cancelling 100k waiter expirations with the `TimerWheel`,
+compared with one `loop.call_later` handle per waiter.
+
+Run with `python -m tests.benchmarks.bench_timer_wheel`.
+"""
+
+import asyncio
+import time
+import typing
+
+from telegrinder.tools.waiter_machine.timer_wheel import TimerWheel
+
+WAITERS: typing.Final = 100_000
+WEEK: typing.Final = 7 * 24 * 60 * 60.0
+
+
+def callback() -> None:
+    pass
+
+
+def measure(name: str, schedule: typing.Callable[[float], typing.Any], /) -> None:
+    start = time.perf_counter()
+    timers = [schedule(WEEK + index) for index in range(WAITERS)]
+    scheduled = time.perf_counter()
+
+    for timer in timers:
+        timer.cancel()
+
+    elapsed = time.perf_counter()
+    print(
+        f"  {name}: schedule {(scheduled - start) / WAITERS * 1_000_000_000:.0f} ns,"
+        f" cancel {(elapsed - scheduled) / WAITERS * 1_000_000_000:.0f} ns per waiter",
+    )
+
+
+async def main() -> None:
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel()
+
+    print(f"{WAITERS} waiters")
+    measure("loop.call_later", lambda delay: loop.call_later(delay, callback))
+    measure("TimerWheel", lambda delay: wheel.schedule_after(delay, callback))
+    wheel.close()
+
+    # Expired waiters are dropped in batches by one tick of the wheel.
+    for _ in range(WAITERS):
+        wheel.schedule_after(0.0, callback)
+
+    start = time.perf_counter()
+    fired = wheel.advance(time.monotonic() + wheel.resolution)
+    elapsed = time.perf_counter() - start
+    wheel.close()
+    print(f"  TimerWheel: expired {fired} waiters in one tick in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+"""Benchmark of decoding and wrapping updates into cute objects for large media group and reply chain payloads.
+
+Compares the polling decode path (the batch is decoded straight into `UpdateCute`, nested messages
+are created on first access), the same path with the nested messages accessed, the `from_update` path
+(the batch is decoded into `Update` models, which are converted with `UpdateCute.from_update`),
+and `UpdateCute.from_update` of the already decoded `UpdateCute`, which only binds the API.
+
+Run with `python -m tests.benchmarks.bench_update_cute`.
+"""
+
+import time
+import typing
+
+import msgspec
+from msgspex import decoder
+
+from telegrinder.api.api import API, Token
+from telegrinder.bot.cute_types.update import UpdateCute
+from telegrinder.types.objects import Update
+from tests.test_utils import MockedHttpClient
+
+ITERATIONS: typing.Final = 10_000
+CHAT: typing.Final = {"id": -100123, "type": "supergroup", "title": "Telegrinder"}
+USER: typing.Final = {"id": 123, "is_bot": False, "first_name": "John", "username": "Johndoe333"}
+
+
+def make_photo(message_id: int, /) -> list[dict[str, typing.Any]]:
+    return [
+        {
+            "file_id": f"photo-{message_id}-{size}",
+            "file_unique_id": f"unique-{message_id}-{size}",
+            "width": size,
+            "height": size,
+            "file_size": size * 100,
+        }
+        for size in (90, 320, 800, 1280)
+    ]
+
+
+def make_message(message_id: int, /, **fields: typing.Any) -> dict[str, typing.Any]:
+    return {
+        "message_id": message_id,
+        "from": USER,
+        "chat": CHAT,
+        "date": 1_713_971_200,
+        "photo": make_photo(message_id),
+        "caption": "Caption with the #hashtag and @mention",
+        "caption_entities": [
+            {"type": "hashtag", "offset": 17, "length": 8},
+            {"type": "mention", "offset": 30, "length": 8},
+        ],
+        **fields,
+    }
+
+
+def make_raw_batches() -> dict[str, tuple[bytes, int]]:
+    media_group = [{"update_id": index, "message": make_message(index, media_group_id="album")} for index in range(10)]
+    reply_chain = [
+        {
+            "update_id": 100,
+            "message": make_message(
+                100,
+                reply_to_message=make_message(99),
+                external_reply={"origin": {"type": "hidden_user", "date": 1_713_971_100, "sender_user_name": "J"}},
+            ),
+        },
+        {
+            "update_id": 101,
+            "message": make_message(101, pinned_message=make_message(100, reply_to_message=make_message(99))),
+        },
+    ]
+    return {
+        "media group": (msgspec.json.encode(media_group), len(media_group)),
+        "reply chain": (msgspec.json.encode(reply_chain), len(reply_chain)),
+    }
+
+
+def touch_nested(updates: list[UpdateCute], /) -> None:
+    for update in updates:
+        message = update.message.unwrap()
+        message.reply_to_message.unwrap_or_none()
+        message.pinned_message.unwrap_or_none()
+        message.external_reply.unwrap_or_none()
+
+
+def measure(name: str, function: typing.Callable[[], typing.Any], size: int, /) -> float:
+    start = time.perf_counter()
+
+    for _ in range(ITERATIONS):
+        function()
+
+    elapsed = (time.perf_counter() - start) / (ITERATIONS * size) * 1_000_000
+    print(f"  {name}: {elapsed:.2f} us per update")
+    return elapsed
+
+
+def main() -> None:
+    api = API(Token("123:ABCdef"), http=MockedHttpClient())
+
+    with decoder(list[UpdateCute]) as cute_decoder, decoder(list[Update]) as model_decoder:
+        for name, (raw_batch, size) in make_raw_batches().items():
+            print(name)
+            decoded = cute_decoder.decode(raw_batch)
+            measure("polling decode into UpdateCute", lambda: cute_decoder.decode(raw_batch), size)
+            measure(
+                "polling decode into UpdateCute + nested access",
+                lambda: touch_nested(cute_decoder.decode(raw_batch)),
+                size,
+            )
+            measure(
+                "decode into Update + from_update",
+                lambda: [UpdateCute.from_update(update, bound_api=api) for update in model_decoder.decode(raw_batch)],
+                size,
+            )
+            measure(
+                "from_update of decoded UpdateCute",
+                lambda: [UpdateCute.from_update(update, bound_api=api) for update in decoded],
+                size,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from .fixtures.api_instance import api_instance
 from .fixtures.callback_query_update import callback_query_update
 from .fixtures.context import callback_query_context, context_factory, message_context
 from .fixtures.message_update import message_update
+from .fixtures.middleware_box import isolated_middleware_box
 from .fixtures.node_scope import callback_query_node_scope, message_node_scope, node_scope_factory
 
 __all__ = (
@@ -10,6 +11,7 @@ __all__ = (
     "callback_query_node_scope",
     "callback_query_update",
     "context_factory",
+    "isolated_middleware_box",
     "message_context",
     "message_node_scope",
     "message_update",
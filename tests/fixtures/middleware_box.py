@@ -0,0 +1,23 @@
+import pytest
+
+from telegrinder.bot.dispatch.middleware.box import MiddlewareBox
+from telegrinder.tools.global_context.builtin_context import TelegrinderContext
+
+
+@pytest.fixture()
+def isolated_middleware_box():
+    """Reset the global middleware box, so dispatches created in the test share a new one.
+    The previous middleware box is restored after the test.
+    """
+    context = TelegrinderContext()
+    middleware_box = context.pop("middleware_box")
+    instance = MiddlewareBox._SingletonMeta__instance  # type: ignore
+    MiddlewareBox._SingletonMeta__instance = None  # type: ignore
+
+    yield
+
+    context.pop("middleware_box")
+    MiddlewareBox._SingletonMeta__instance = instance  # type: ignore
+
+    if middleware_box:
+        context["middleware_box"] = middleware_box.unwrap().value
@@ -1,12 +1,21 @@
+import asyncio
+import io
+
 import pytest
+from kungfu.library.monad.result import Error, Ok
 from msgspex import decoder
 
 from telegrinder.api.api import API, Token
+from telegrinder.api.broadcast import Broadcast, get_api_method_name
 from telegrinder.api.error import APIError
+from telegrinder.api.rate_limiter import Limit, RateLimiter
 from telegrinder.api.response import APIResponse
+from telegrinder.api.upload_cache import MemoryUploadCache, get_upload_keys
+from telegrinder.client import JsonBody, WreqClient
+from telegrinder.types.input_file import InputFile
 from telegrinder.types.objects import User
 
-from .test_utils import with_mocked_api
+from .test_utils import MockedHttpClient, with_mocked_api
 
 API_ERROR_RESPONSE = {"ok": False, "error_code": 404, "description": "Not Found"}
 
@@ -95,3 +104,186 @@ async def test_download_file(api: API):
     result = await api.download_file("cool_file")
     assert result
     assert result.unwrap() == b"somefile"
+
+
+def test_request_body_is_json_without_files():
+    body = WreqClient.get_body(data={"chat_id": 1, "text": "Hello", "entities": [{"type": "bold", "offset": 0, "length": 5}]})
+
+    assert isinstance(body, JsonBody)
+    assert decoder.decode(body.content, type=dict) == {
+        "chat_id": 1,
+        "text": "Hello",
+        "entities": [{"type": "bold", "offset": 0, "length": 5}],
+    }
+
+
+def test_request_body_is_multipart_with_files():
+    body = WreqClient.get_body(data={"chat_id": 1, "document": InputFile("file.txt", b"content")})
+    assert not isinstance(body, JsonBody)
+
+    class FormHttpClient(MockedHttpClient):
+        SUPPORTS_JSON_BODY = True
+
+        @classmethod
+        def build_form(cls, fields, files, /):
+            return (dict(fields), files)
+
+    fields, files = FormHttpClient.get_body(data={"chat_id": 1, "document": InputFile("file.txt", b"content")})
+    assert fields["chat_id"] == "1"
+    assert list(files.values()) == [("file.txt", b"content")]
+    assert fields["document"] == "attach://{}".format(*files)
+
+
+def test_request_body_is_form_for_clients_without_json_body_support():
+    class FormClient(MockedHttpClient):
+        @classmethod
+        def get_form(cls, *, data=None, files=None):
+            return ("form", data)
+
+    assert not FormClient.SUPPORTS_JSON_BODY
+    assert FormClient.get_body(data={"chat_id": 1}) == ("form", {"chat_id": 1})
+
+
+@pytest.mark.asyncio()
+async def test_rate_limiter_limits_chat_and_adapts_to_flood_error():
+    rate_limiter = RateLimiter(private_chat_limit=Limit(2, 0.1), group_chat_limit=Limit(1, 60.0))
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for _ in range(3):
+        await rate_limiter.acquire("sendMessage", {"chat_id": 1})
+    assert loop.time() - start >= 0.04
+
+    start = loop.time()
+    await rate_limiter.acquire("getMe")
+    await rate_limiter.acquire("answerCallbackQuery", {"callback_query_id": "1"})
+    await rate_limiter.acquire("sendMessage", {"chat_id": -100})
+    assert loop.time() - start < 0.04
+
+    rate_limiter.feedback(
+        "sendMessage",
+        {"chat_id": 2},
+        APIError(code=429, error="Too Many Requests: retry after 0", data={"retry_after": 0.05}),
+    )
+    start = loop.time()
+    await rate_limiter.acquire("sendMessage", {"chat_id": 2})
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio()
+async def test_rate_limiter_counts_only_sent_messages_and_keeps_busy_buckets():
+    rate_limiter = RateLimiter(private_chat_limit=Limit(1, 60.0), max_chats=1)
+    loop = asyncio.get_running_loop()
+
+    assert rate_limiter.is_counted("sendMessage") and rate_limiter.is_counted("copyMessage")
+    assert not rate_limiter.is_counted("sendChatAction") and not rate_limiter.is_counted("editMessageText")
+
+    start = loop.time()
+    await rate_limiter.acquire("sendChatAction", {"chat_id": 1})
+    await rate_limiter.acquire("deleteMessage", {"chat_id": 1})
+    await rate_limiter.acquire("sendMessage", {"chat_id": 1})
+    assert loop.time() - start < 0.04
+
+    waiting = asyncio.create_task(rate_limiter.acquire("sendMessage", {"chat_id": 1}))
+    await asyncio.sleep(0)
+    await rate_limiter.acquire("sendMessage", {"chat_id": 2})
+
+    # The bucket of the chat 1 is in use, so it's kept even though the limit of chats is exceeded.
+    assert set(rate_limiter._chat_buckets) == {1, 2}
+    waiting.cancel()
+
+
+@pytest.mark.asyncio()
+async def test_broadcast_yields_per_recipient_results_and_checkpoint():
+    running = 0
+    max_running = 0
+
+    async def send_message(*, chat_id: int, text: str):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001 * (chat_id % 3))
+        running -= 1
+        if chat_id == 5:
+            return Error(APIError(code=403, error="Forbidden: bot was blocked by the user", data={}))
+        return Ok(text)
+
+    async def recipients():
+        for chat_id in range(10):
+            yield chat_id
+
+    broadcast = Broadcast(send_message, recipients(), concurrency=3, start_from=2, text="Hi")
+    results = {sent.chat_id: sent.result async for sent in broadcast}
+
+    assert sorted(results) == list(range(2, 10))
+    assert not results[5]
+    assert all(results[chat_id].unwrap() == "Hi" for chat_id in results if chat_id != 5)
+    assert max_running == 3
+    assert broadcast.checkpoint == 10
+
+
+def test_broadcasts_share_rate_limiter_of_api(api_instance):
+    first = api_instance.broadcast(api_instance.send_message, [1], text="Hi")
+    second = api_instance.broadcast(api_instance.send_message, [2], text="Hi")
+
+    assert first.rate_limiter is second.rate_limiter is api_instance.broadcast_rate_limiter
+    assert get_api_method_name(api_instance.send_message) == "sendMessage"
+
+
+@pytest.mark.asyncio()
+@with_mocked_api(b"somefile")
+async def test_download_file_to(api: API, tmp_path):
+    progress: list[int] = []
+    buffer = io.BytesIO()
+
+    assert (await api.download_file_to("cool_file", buffer, on_progress=progress.append)).unwrap() == 8
+    assert buffer.getvalue() == b"somefile"
+    assert progress == [8]
+
+    assert (await api.download_file_to("cool_file", tmp_path / "file")).unwrap() == 8
+    assert (tmp_path / "file").read_bytes() == b"somefile"
+    assert [chunk async for chunk in api.iter_file("cool_file")] == [b"somefile"]
+
+
+@pytest.mark.asyncio()
+async def test_upload_cache_reuses_and_invalidates_file_id():
+    bodies = []
+    responses = [
+        b'{"ok": true, "result": {"message_id": 1, "document": {"file_id": "doc-1", "file_unique_id": "u"}}}',
+        b'{"ok": true, "result": {"message_id": 2, "document": {"file_id": "doc-1", "file_unique_id": "u"}}}',
+        b'{"ok": false, "error_code": 400, "description": "Bad Request: wrong file identifier/HTTP URL specified"}',
+        b'{"ok": true, "result": {"message_id": 3, "document": {"file_id": "doc-2", "file_unique_id": "u"}}}',
+    ]
+
+    def callback(method, url, data):
+        bodies.append(data)
+        return responses[len(bodies) - 1]
+
+    class JsonBodyHttpClient(MockedHttpClient):
+        SUPPORTS_JSON_BODY = True
+
+        @classmethod
+        def build_form(cls, fields, files, /):
+            return dict(fields)
+
+    cache = MemoryUploadCache()
+    api = API(Token("123:ABCdef"), http=JsonBodyHttpClient(callback=callback), upload_cache=cache)
+    document = InputFile("file.txt", b"content")
+
+    for _ in range(3):
+        assert await api.request_raw("sendDocument", {"chat_id": 1, "document": document})
+
+    assert not isinstance(bodies[0], JsonBody)
+    assert decoder.decode(bodies[1].content, type=dict)["document"] == "doc-1"
+    assert decoder.decode(bodies[2].content, type=dict)["document"] == "doc-1"
+    assert not isinstance(bodies[3], JsonBody)
+    assert list(cache.storage.values()) == ["doc-2"]
+
+
+def test_upload_keys_depend_on_field():
+    content = InputFile("image.png", b"content")
+    keys = get_upload_keys({"photo": content, "document": content, "caption": "hi"}, namespace="1:")
+
+    assert set(keys) == {"photo", "document"}
+    assert keys["photo"] != keys["document"]
+    assert keys["photo"].startswith("1:photo:sha256:")
@@ -3,18 +3,29 @@ import io
 import logging
 import re
 from collections import deque
+from unittest.mock import AsyncMock
 
+import msgspec
 import pytest
 from kungfu.library.monad.result import Ok
 
 from telegrinder import Message
 from telegrinder.api.api import API, Token
+from telegrinder.bot.bot import Telegrinder
+from telegrinder.bot.dispatch.abc import ABCDispatch
+from telegrinder.bot.dispatch.batch import group_updates
+from telegrinder.bot.dispatch.context import Context
 from telegrinder.bot.dispatch.dispatch import Dispatch
+from telegrinder.bot.dispatch.middleware.abc import ABCMiddleware
+from telegrinder.bot.executor import Executor, ShardedExecutor
+from telegrinder.bot.polling import Polling, Prefilter, Webhook
+from telegrinder.bot.polling.prefilter import chat_not_in
 from telegrinder.bot.rules.abc import ABCRule
 from telegrinder.bot.rules.regex import Regex
 from telegrinder.modules import (
     _configure_logging,
     _configure_loguru,
+    debug_log_scope,
     log_scope,
     logger,
     wrap_logging_logger,
@@ -22,6 +33,8 @@ from telegrinder.modules import (
     wrap_structlog_logger,
 )
 from telegrinder.node import Text
+from telegrinder.tools.waiter_machine import CALLBACK_QUERY_FROM_CHAT
+from telegrinder.types.enums import UpdateType
 from telegrinder.types.objects import Update, User
 from tests.test_utils import MockedHttpClient
 
@@ -98,6 +111,34 @@ async def test_dispatch_feed_flushes_buffered_logs_in_one_block(api_instance, me
     assert "[Update:12345 > Bot:123 > router-2] second" in output
 
 
+def test_disabled_log_level_skips_logging_work():
+    sink = io.StringIO()
+    _configure_logging("INFO", None, False, sink)
+
+    assert logger.is_enabled("INFO") and not logger.is_enabled("DEBUG")
+
+    with debug_log_scope("skipped"):
+        logger.debug("hidden")
+        logger.info("shown")
+
+    assert "hidden" not in sink.getvalue()
+    assert "skipped" not in sink.getvalue()
+    assert "shown" in sink.getvalue()
+
+
+def test_loguru_log_level_check_follows_handlers():
+    pytest.importorskip("loguru")
+
+    _configure_loguru("INFO", None, False, io.StringIO())
+    assert logger.is_enabled("INFO") and not logger.is_enabled("DEBUG")
+
+    handler_id = logger.logger.add(io.StringIO(), level="DEBUG")
+    assert logger.is_enabled("DEBUG")
+
+    logger.logger.remove(handler_id)
+    assert not logger.is_enabled("DEBUG")
+
+
 @pytest.mark.asyncio()
 async def test_dispatch_feed_flushes_buffered_loguru_logs(api_instance, message_update, monkeypatch):
     pytest.importorskip("loguru")
@@ -311,3 +352,440 @@ async def test_requires_are_isolated_between_rule_instances():
     await root.feed(api, make_update(2, "/explode"))
 
     assert called == ["/funnel", "/explode"]
+
+
+@pytest.mark.asyncio()
+async def test_dispatch_routes_only_to_routers_matching_update_type(api_instance, message_update):
+    messages = Dispatch()
+    callbacks = Dispatch()
+    root = Dispatch()
+    called: list[str] = []
+
+    @messages.message()
+    async def message_handler(message: Message):
+        called.append("message")
+
+    @callbacks.callback_query()
+    async def callback_handler():
+        called.append("callback_query")
+
+    root.load(callbacks)
+    assert not any(any(event_views) for _, event_views in root.get_routing_targets(message_update))
+
+    root.load(messages)
+    [(router, event_views)] = [target for target in root.get_routing_targets(message_update) if any(target[1])]
+    assert router is messages.main_router
+    assert router.message in event_views
+    assert router.callback_query not in event_views
+
+    await root.feed(api_instance, message_update)
+    assert called == ["message"]
+
+    root.routers[-1] = callbacks.main_router
+    assert not any(any(event_views) for _, event_views in root.get_routing_targets(message_update))
+
+
+class BlockingDispatch(ABCDispatch):
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.fed: list[int] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def feed(self, api, update):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.fed.append(update.update_id)
+        self.running -= 1
+
+    def load(self, external):
+        pass
+
+
+@pytest.mark.asyncio()
+async def test_executor_limits_concurrency_and_applies_backpressure(api_instance):
+    dispatch = BlockingDispatch()
+    executor = Executor(max_concurrency=2, max_pending=1)
+
+    for update_id in range(3):
+        await executor.submit(dispatch, api_instance, Update(update_id=update_id))
+
+    await asyncio.sleep(0)
+    assert executor.metrics.in_flight == 2
+    assert executor.metrics.queue_depth == 1
+
+    blocked_submit = asyncio.create_task(executor.submit(dispatch, api_instance, Update(update_id=3)))
+    await asyncio.sleep(0)
+    assert not blocked_submit.done()
+
+    dispatch.release.set()
+    await blocked_submit
+    await executor.join()
+
+    assert sorted(dispatch.fed) == [0, 1, 2, 3]
+    assert dispatch.max_running == 2
+    assert executor.metrics.processed == 4
+    assert executor.metrics.in_flight == 0
+    await executor.close()
+
+
+def test_executor_rejects_pending_limit_without_concurrency_limit():
+    with pytest.raises(ValueError):
+        Executor(max_pending=10)
+
+
+@pytest.mark.asyncio()
+async def test_bot_shutdown_feeds_submitted_updates_and_closes_executor(api_instance):
+    dispatch = BlockingDispatch()
+    executor = Executor(max_concurrency=1)
+    bot = Telegrinder(api_instance, dispatch=dispatch, executor=executor)
+    assert executor.max_pending == 10
+
+    for update_id in range(3):
+        await executor.submit(dispatch, api_instance, Update(update_id=update_id))
+
+    dispatch.release.set()
+    await bot.shutdown_executor()
+    assert dispatch.fed == [0, 1, 2]
+    assert executor.metrics.queue_depth == 0
+    assert not executor._workers
+
+
+@pytest.mark.asyncio()
+async def test_sharded_executor_keeps_order_per_chat(api_instance):
+    def make_update(update_id: int, chat_id: int) -> Update:
+        return Update.from_raw(
+            (
+                f'{{"update_id": {update_id}, "message": {{"message_id": {update_id}, '
+                f'"chat": {{"id": {chat_id}, "type": "private"}}, "date": 1234567898, "text": "hi"}}}}'
+            ).encode(),
+        )
+
+    class RecordingDispatch(ABCDispatch):
+        def __init__(self) -> None:
+            self.fed: dict[int, list[int]] = {}
+            self.running: set[int] = set()
+            self.overlapped = False
+            self.max_running = 0
+
+        async def feed(self, api, update):
+            chat_id = update.incoming_update.chat.id
+            self.overlapped |= chat_id in self.running
+            self.running.add(chat_id)
+            self.max_running = max(self.max_running, len(self.running))
+            await asyncio.sleep(0.01 if update.update_id % 2 else 0)
+            self.fed.setdefault(chat_id, []).append(update.update_id)
+            self.running.discard(chat_id)
+
+        def load(self, external):
+            pass
+
+    dispatch = RecordingDispatch()
+    executor = ShardedExecutor(idle_timeout=0.05)
+
+    for update_id in range(10):
+        await executor.submit(dispatch, api_instance, make_update(update_id, chat_id=update_id % 3))
+
+    assert executor.lanes == 3
+    await asyncio.sleep(0.2)
+
+    assert dispatch.fed == {0: [0, 3, 6, 9], 1: [1, 4, 7], 2: [2, 5, 8]}
+    assert not dispatch.overlapped
+    assert dispatch.max_running > 1
+    assert executor.lanes == 0
+    assert executor.metrics.processed == 10
+
+
+@pytest.mark.asyncio()
+async def test_polling_prefetch_requests_next_batch_before_dispatch(api_instance):
+    requested_offsets: list[int] = []
+
+    class PrefetchPolling(Polling):
+        async def get_updates(self):
+            requested_offsets.append(self.offset)
+            if len(requested_offsets) == 3:
+                self.stop()
+            update_id = len(requested_offsets)
+            return msgspec.Raw(f'[{{"update_id": {update_id}}}]'.encode())
+
+    polling = PrefetchPolling(api_instance, prefetch=2, update_model=Update)
+    received: list[int] = []
+
+    async for updates in polling.listen():
+        if not received:
+            await asyncio.sleep(0)
+            assert len(requested_offsets) >= 2
+        received.extend(update.update_id for update in updates)
+
+    assert received == [1, 2, 3]
+    assert requested_offsets == [0, 2, 3]
+    assert polling.offset == 4
+
+
+@pytest.mark.asyncio()
+async def test_webhook_accepts_verifies_and_deduplicates_updates(api_instance):
+    webhook = Webhook(api_instance, host="127.0.0.1", port=0, path="/bot", secret_token="secret", update_model=Update)
+    updates = webhook.listen()
+    first_batch = asyncio.create_task(anext(updates))
+
+    while not webhook.sockets:
+        await asyncio.sleep(0)
+
+    port = webhook.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def post(body: bytes, secret_token: str = "secret") -> bytes:
+        writer.write(
+            b"POST /bot HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            + f"X-Telegram-Bot-Api-Secret-Token: {secret_token}\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body,
+        )
+        await writer.drain()
+        return (await reader.readuntil(b"\r\n\r\n")).split(b"\r\n", 1)[0]
+
+    assert await post(b'{"update_id": 1}', secret_token="wrong") == b"HTTP/1.1 401 Unauthorized"
+    assert await post(b'{"update_id": 1}') == b"HTTP/1.1 200 OK"
+    assert await post(b'{"update_id": 1}') == b"HTTP/1.1 200 OK"
+    assert await post(b"not json") == b"HTTP/1.1 400 Bad Request"
+
+    assert [update.update_id for update in await first_batch] == [1]
+    assert webhook.queue_depth == 0
+
+    writer.close()
+    await writer.wait_closed()
+    webhook.stop()
+    await updates.aclose()
+
+
+@pytest.mark.asyncio()
+async def test_webhook_closes_connections_which_stall_reading(api_instance):
+    webhook = Webhook(api_instance, host="127.0.0.1", port=0, read_timeout=0.05, update_model=Update)
+    updates = webhook.listen()
+    batch = asyncio.create_task(anext(updates))
+
+    while not webhook.sockets:
+        await asyncio.sleep(0)
+
+    port = webhook.sockets[0].getsockname()[1]
+
+    for request in (b"POST / HTTP/1.1\r\nHost: local", b"POST / HTTP/1.1\r\nContent-Length: 16\r\n\r\n{}"):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+
+        async with asyncio.timeout(1):
+            assert await reader.read() == b""
+
+        writer.close()
+        await writer.wait_closed()
+
+    webhook.stop()
+
+    with pytest.raises(StopAsyncIteration):
+        await batch
+
+
+@pytest.mark.asyncio()
+async def test_webhook_is_set_again_when_allowed_updates_change(api_instance):
+    api_instance.set_webhook = AsyncMock(return_value=Ok(True))
+    webhook = Webhook(api_instance, host="127.0.0.1", port=0, url="https://example.com", update_model=Update)
+    updates = webhook.listen()
+    first_batch = asyncio.create_task(anext(updates))
+
+    while not webhook.sockets:
+        await asyncio.sleep(0)
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", webhook.sockets[0].getsockname()[1])
+
+    async def post(update_id: int) -> None:
+        writer.write(b"POST / HTTP/1.1\r\nContent-Length: 16\r\n\r\n" + f'{{"update_id": {update_id}}}'.encode())
+        await writer.drain()
+        await reader.readuntil(b"\r\n\r\n")
+
+    await post(1)
+    await first_batch
+    webhook.allowed_updates = [UpdateType.MESSAGE]
+    second_batch = asyncio.create_task(anext(updates))
+    await post(2)
+    await second_batch
+
+    assert [call.kwargs["allowed_updates"] for call in api_instance.set_webhook.await_args_list] == [
+        list(UpdateType),
+        [UpdateType.MESSAGE],
+    ]
+
+    writer.close()
+    await writer.wait_closed()
+    webhook.stop()
+    await updates.aclose()
+
+
+def test_context_attributes_and_copy(api_instance, message_update):
+    context = Context(key="value")
+    assert context.key == "value"
+    assert context.exception_update.unwrap_or_none() is None
+
+    with pytest.raises(AttributeError):
+        context.missing_key  # noqa: B018
+
+    context.add_roots(api_instance, message_update, None)
+    assert context.api is api_instance and context["update"] is message_update
+
+    copied = context.copy()
+    copied.responses = [1]
+    assert type(copied) is Context and copied.key == "value"
+    assert "responses" not in context
+    assert copied.exceptions_update is context.exceptions_update
+
+    copied.set("get", "stored")
+    assert copied["get"] == "stored" and copied.get("key") == "value"
+
+
+def test_telegrinder_requests_only_update_types_the_dispatch_handles(api_instance, isolated_middleware_box):
+    dispatch = Dispatch()
+    polling = Polling(api_instance, exclude_updates={UpdateType.POLL})
+    bot = Telegrinder(api_instance, dispatch=dispatch, polling=polling, auto_allowed_updates=True)
+
+    @dispatch.message()
+    async def message_handler():
+        pass
+
+    bot.update_allowed_updates()
+    assert polling.allowed_updates == [UpdateType.MESSAGE]
+    assert dispatch.get_allowed_updates() is dispatch.get_allowed_updates()
+
+    dispatch.middlewares.waiter.add_hasher(CALLBACK_QUERY_FROM_CHAT)
+    assert dispatch.get_allowed_updates() == [UpdateType.MESSAGE, UpdateType.CALLBACK_QUERY]
+
+    @dispatch.raw()
+    async def raw_handler():
+        pass
+
+    bot.update_allowed_updates()
+    assert polling.allowed_updates == [update_type for update_type in UpdateType if update_type != UpdateType.POLL]
+
+
+@pytest.mark.asyncio()
+async def test_polling_prefilter_skips_updates_before_decoding(api_instance):
+    def message(chat_id: int) -> str:
+        return f'{{"message_id": 1, "date": 1234567898, "chat": {{"id": {chat_id}, "type": "private"}}, "text": "hi"}}'
+
+    raw_updates = (
+        f'[{{"update_id": 1, "message": {message(1)}}}, {{"update_id": 2, "edited_message": {message(2)}}},'
+        f' {{"update_id": 3, "callback_query": {{"id": "1", "from": {{"id": 7, "is_bot": false, "first_name": "J"}},'
+        f' "chat_instance": "1", "message": {message(1)}}}}}]'
+    )
+
+    class PrefilterPolling(Polling):
+        async def get_updates(self):
+            self.stop()
+            return msgspec.Raw(raw_updates.encode())
+
+    prefilter = Prefilter(chat_not_in(1))
+    header = prefilter.get_header(msgspec.json.encode(msgspec.json.decode(raw_updates)[2]))
+    assert (header.update_type, header.chat_id, header.from_id) == (UpdateType.CALLBACK_QUERY, 1, 7)
+
+    polling = PrefilterPolling(api_instance, update_model=Update, prefilter=prefilter)
+    received = [update.update_id async for updates in polling.listen() for update in updates]
+
+    assert received == [2]
+    assert polling.offset == 4
+
+
+@pytest.mark.asyncio()
+async def test_dispatch_feed_raw_applies_prefilter(api_instance, monkeypatch):
+    def failing_predicate(header):
+        raise ValueError("predicate failed")
+
+    def raw_message(update_id: int, chat_id: int) -> str:
+        return (
+            f'{{"update_id": {update_id}, "message": {{"message_id": 1, "date": 1234567898, '
+            f'"chat": {{"id": {chat_id}, "type": "private"}}, "text": "hi"}}}}'
+        )
+
+    fed: list[int] = []
+    dispatch = Dispatch(prefilter=Prefilter(chat_not_in(1)))
+
+    async def feed(api, update):
+        fed.append(update.update_id)
+
+    monkeypatch.setattr(dispatch, "feed", feed)
+
+    await dispatch.feed_raw(api_instance, raw_message(1, chat_id=1))
+    await dispatch.feed_raw(api_instance, raw_message(2, chat_id=2))
+    assert fed == [2]
+
+    # A failing predicate lets the update through, so the offset still advances.
+    dispatch.prefilter.predicates.insert(0, failing_predicate)
+    passed, offset = dispatch.prefilter.filter(f"[{raw_message(3, chat_id=1)}]".encode())
+    assert len(passed) == 1 and offset == 4
+
+
+@pytest.mark.asyncio()
+async def test_dispatch_feed_batch_prepares_batch_and_keeps_order_per_chat(api_instance, isolated_middleware_box):
+    def make_update(update_id: int, chat_id: int) -> Update:
+        return Update.from_raw(
+            (
+                f'{{"update_id": {update_id}, "message": {{"message_id": {update_id}, '
+                f'"chat": {{"id": {chat_id}, "type": "private"}}, "date": 1234567898, "text": "hi"}}}}'
+            ).encode(),
+        )
+
+    class BatchMiddleware(ABCMiddleware):
+        def __init__(self) -> None:
+            self.batches: list[list[int]] = []
+
+        async def pre_batch(self, api, updates):
+            self.batches.append([update.update_id for update in updates])
+
+    middleware = BatchMiddleware()
+    dispatch = Dispatch()
+    dispatch.middlewares.put(middleware)
+    fed: dict[int, list[int]] = {}
+
+    @dispatch.message()
+    async def handler(message: Message):
+        await asyncio.sleep(0.01 if message.message_id % 2 else 0)
+        fed.setdefault(message.chat.id, []).append(message.message_id)
+
+    updates = [make_update(update_id, chat_id=update_id % 3) for update_id in range(10)]
+    await dispatch.feed_batch(api_instance, updates, ordered=True)
+
+    assert middleware.is_pre_batch and not middleware.is_pre
+    assert middleware.batches == [list(range(10))]
+    assert fed == {0: [0, 3, 6, 9], 1: [1, 4, 7], 2: [2, 5, 8]}
+
+    # Updates are fed concurrently by default, so the slower odd updates finish last.
+    fed.clear()
+    await dispatch.feed_batch(api_instance, updates)
+    assert fed == {0: [0, 6, 3, 9], 1: [4, 1, 7], 2: [2, 8, 5]}
+    assert [[update.update_id for update in group] for group in group_updates(updates)] == [
+        [0, 3, 6, 9],
+        [1, 4, 7],
+        [2, 5, 8],
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_dispatch_feed_batch_interrupted_group_does_not_cancel_others(api_instance):
+    class Interrupted(BaseException):
+        pass
+
+    class InterruptingDispatch(ABCDispatch):
+        def __init__(self) -> None:
+            self.fed: list[int] = []
+
+        async def feed(self, api, update):
+            if update.update_id == 0:
+                raise Interrupted
+
+            await asyncio.sleep(0.01)
+            self.fed.append(update.update_id)
+
+        def load(self, external):
+            pass
+
+    dispatch = InterruptingDispatch()
+    await dispatch.feed_batch(api_instance, [Update(update_id=update_id) for update_id in range(3)])
+    assert dispatch.fed == [1, 2]
@@ -7,7 +7,9 @@ from msgspex import decoder
 
 from telegrinder.api.api import API, Token
 from telegrinder.bot.cute_types.message import MessageCute, execute_method_answer, execute_method_edit
-from telegrinder.types.objects import Message
+from telegrinder.bot.cute_types.update import UpdateCute
+from telegrinder.types.objects import Message, Update
+from telegrinder.types.utils.lazy_option import LazySome
 
 from .test_utils import MockedHttpClient
 
@@ -84,3 +86,37 @@ async def test_message_forward_is_lazy(mocker):
     assert spy.call_count == 0
     assert result.unwrap().message_id == source_message.message_id
     assert spy.call_count == 1
+
+
+def test_from_update_creates_nested_cute_on_first_access(mocker):
+    api = make_api()
+    chat = {"id": 1, "type": "private"}
+    reply_to_message = {"message_id": 1, "date": 1_713_971_100, "chat": chat, "text": "hi"}
+    message = {"message_id": 2, "date": 1_713_971_200, "chat": chat, "reply_to_message": reply_to_message}
+    update = Update.from_raw(msgspec.json.encode({"update_id": 1, "message": message}))
+    spy = mocker.spy(MessageCute, "from_update")
+
+    update_cute = UpdateCute.from_update(update, bound_api=api)
+
+    assert spy.call_count == 1
+    assert UpdateCute.from_update(update_cute, bound_api=api) is update_cute
+    assert spy.call_count == 1
+
+    reply = update_cute.incoming_update.reply_to_message.unwrap()
+    assert isinstance(reply, MessageCute) and reply.text.unwrap() == "hi"
+    assert reply.bound_api is api
+    assert spy.call_count == 2
+
+
+def test_decoded_nested_cute_is_created_on_first_access():
+    chat = {"id": 1, "type": "private"}
+    reply_to_message = {"message_id": 1, "date": 1_713_971_100, "chat": chat, "text": "hi"}
+    message = {"message_id": 2, "date": 1_713_971_200, "chat": chat, "reply_to_message": reply_to_message}
+    message_cute = decoder.decode(msgspec.json.encode(message), type=MessageCute)
+    reply = message_cute.reply_to_message
+
+    assert isinstance(reply, LazySome) and not reply._is_resolved
+    assert not message_cute.pinned_message
+    assert decoder.decode(message_cute.to_raw(), type=dict)["reply_to_message"]["text"] == "hi"
+    assert reply._is_resolved
+    assert type(reply.unwrap()) is MessageCute and reply.unwrap().text.unwrap() == "hi"
@@ -1,7 +1,8 @@
 import pytest
 
 from telegrinder.bot.cute_types import CallbackQueryCute, MessageCute
-from telegrinder.rules import ABCRule, IsPrivate, PayloadEqRule, check_rule
+from telegrinder.bot.rules.abc import Always
+from telegrinder.rules import ABCRule, AndRule, IsPrivate, OrRule, PayloadEqRule, check_rule, compile_rule
 from telegrinder.types.objects import CallbackQuery, Message
 
 message_event_with_text = {
@@ -75,3 +76,56 @@ async def test_rule_is_private_message_source(message_context):
 @pytest.mark.asyncio()
 async def test_rule_is_private_callback_query_source(callback_query_context):
     assert await check_rule(IsPrivate(), callback_query_context)
+
+
+@pytest.mark.asyncio()
+async def test_pure_rule_is_checked_once_per_event(message_context):
+    class CountingRule(ABCRule, pure=True):
+        calls = 0
+
+        def check(self) -> bool:
+            CountingRule.calls += 1
+            return True
+
+    class ImpureRule(CountingRule):
+        pass
+
+    pure_rule, impure_rule = CountingRule(), ImpureRule()
+    assert pure_rule.pure and not impure_rule.pure
+
+    for _ in range(3):
+        assert await check_rule(pure_rule, message_context.copy())
+
+    assert CountingRule.calls == 1
+    assert (pure_rule & IsPrivate()).pure
+    assert not (pure_rule | impure_rule).pure
+
+    # A memoized result of another rule with the same id (e.g. a collected rule) isn't reused.
+    other_rule = CountingRule()
+    message_context.rule_memo[id(other_rule)] = (pure_rule, False)
+    assert await check_rule(other_rule, message_context)
+    assert CountingRule.calls == 2
+
+
+@pytest.mark.asyncio()
+async def test_rule_with_only_context_is_checked_without_composition(message_context):
+    class ContextRule(ABCRule):
+        def check(self, ctx) -> bool:
+            return ctx is message_context
+
+    rule = ContextRule()
+    assert rule.context_parameters == ("ctx",)
+    assert Text("hello").context_parameters is None
+    assert await check_rule(rule, message_context)
+
+
+def test_compile_rule_flattens_boolean_tree():
+    a, b, c, d = Text("a"), Text("b"), Text("c"), Text("d")
+
+    compiled = compile_rule((Always() & a & b) | (c & ~~d))
+    assert isinstance(compiled, OrRule)
+    assert isinstance(compiled.rules[0], AndRule) and compiled.rules[0].rules == (a, b)
+    assert isinstance(compiled.rules[1], AndRule) and compiled.rules[1].rules == (c, d)
+
+    assert compile_rule(AndRule(a, AndRule(b, AndRule(c, d)))).rules == (a, b, c, d)
+    assert compile_rule(Always() & a) is a
@@ -8,6 +8,8 @@ from telegrinder.bot.dispatch.return_manager.abc import register_manager
 from telegrinder.bot.dispatch.return_manager.message import MessageReturnManager
 from telegrinder.bot.dispatch.view.base import View
 from telegrinder.bot.rules.abc import ABCRule, AndRule
+from telegrinder.bot.rules.command import Command
+from telegrinder.bot.rules.payload import PayloadEqRule
 from telegrinder.bot.rules.text import Text
 
 
@@ -143,3 +145,49 @@ async def test_process_with_return_manager(api_instance, message_update, message
 
     assert bool(await view.check(api_instance, message_update, message_context)) is True
     assert bool(await view.process(api_instance, message_update, message_context.copy())) is True
+
+
+@pytest.mark.asyncio()
+async def test_handler_index_keeps_only_candidate_handlers_in_order(api_instance, message_update, message_context):
+    view = CustomMessageView()
+    text = message_update.message.unwrap().text.unwrap()
+
+    class Rule(ABCRule):
+        async def check(self, event: MessageCute) -> bool: ...
+
+    @view(Command("start"))
+    async def start_handler(message: MessageCute): ...
+
+    @view(Text("hello", ignore_case=True))
+    async def hello_handler(message: MessageCute): ...
+
+    @view(PayloadEqRule("payload"))
+    async def payload_handler(message: MessageCute): ...
+
+    @view(Rule())
+    async def unindexed_handler(message: MessageCute): ...
+
+    @view(Text(text.upper(), ignore_case=True))
+    async def text_handler(message: MessageCute): ...
+
+    assert [handler.function for handler in view.get_candidate_handlers(message_context)] == [
+        unindexed_handler,
+        text_handler,
+    ]
+
+    @view(Command(text.split(" ")[0].lower(), ignore_case=True, prefixes=("",)))
+    async def command_handler(message: MessageCute): ...
+
+    assert [handler.function for handler in view.get_candidate_handlers(message_context)] == [
+        unindexed_handler,
+        text_handler,
+        command_handler,
+    ]
+
+    view.handlers[0] = FuncHandler(start_handler, [Text(text)])
+    assert [handler.function for handler in view.get_candidate_handlers(message_context)] == [
+        start_handler,
+        unindexed_handler,
+        text_handler,
+        command_handler,
+    ]
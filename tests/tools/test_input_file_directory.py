@@ -0,0 +1,39 @@
+from telegrinder.tools.input_file_directory import InputFileDirectory
+from telegrinder.types.input_file import InputFile, PathInputFile
+
+
+def test_lazy_input_file_directory_loads_on_demand_with_lru_cap(tmp_path):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_bytes(name.encode())
+
+    directory = InputFileDirectory(tmp_path, lazy=True, cache_size=2)
+    assert not directory.storage
+
+    assert directory.get("a.txt").data == b"a.txt"
+    directory.get("b.txt")
+    directory.get("a.txt")
+    directory.get("c.txt")
+    assert list(directory.storage) == ["a.txt", "c.txt"]
+
+
+def test_input_file_directory_streams_files_without_cache(tmp_path):
+    (tmp_path / "video.mp4").write_bytes(b"video")
+
+    input_file = InputFileDirectory(tmp_path, lazy=True, cache_size=0).get("video.mp4")
+    files = {}
+
+    assert isinstance(input_file, PathInputFile)
+    assert input_file._to_multipart(files).startswith("attach://")
+    assert list(files.values()) == [("video.mp4", tmp_path / "video.mp4")]
+    assert isinstance(InputFile.from_path(tmp_path / "video.mp4", lazy=True), PathInputFile)
+
+
+def test_input_file_from_path_keeps_subclass(tmp_path):
+    class NamedInputFile(InputFile):
+        __slots__ = ()
+
+    (tmp_path / "a.txt").write_bytes(b"a")
+
+    assert type(NamedInputFile.from_path(tmp_path / "a.txt")) is NamedInputFile
+    assert type(PathInputFile.from_path(tmp_path / "a.txt")) is PathInputFile
+    assert PathInputFile.from_path(tmp_path / "a.txt").data == b"a"
@@ -0,0 +1,48 @@
+import pytest
+
+from telegrinder.tools.limited_dict import LimitedDict
+
+
+def test_limited_dict_evicts_first_inserted_item():
+    storage = LimitedDict[str, int](maxlimit=2)
+
+    assert storage.set("a", 1) is None
+    assert storage.set("b", 2) is None
+    assert storage.set("a", 3) is None
+    assert storage.set("c", 4) == 3
+    assert dict(storage) == {"b": 2, "c": 4}
+    assert repr(storage) == "{'b': 2, 'c': 4}"
+
+
+def test_limited_dict_pop_does_not_leave_stale_keys():
+    storage = LimitedDict[str, int](maxlimit=2)
+    storage["a"] = 1
+    storage["b"] = 2
+
+    assert storage.pop("a") == 1
+    del storage["b"]
+
+    storage["c"] = 3
+    storage["d"] = 4
+    assert dict(storage) == {"c": 3, "d": 4}
+
+
+def test_limited_dict_lru_policy_evicts_least_recently_used_item():
+    storage = LimitedDict[str, int](maxlimit=2, policy="lru")
+    storage["a"] = 1
+    storage["b"] = 2
+
+    assert storage.get("a") == 1
+    assert "b" in storage
+    assert storage.set("c", 3) == 2
+    assert list(storage) == ["a", "c"]
+
+    copied = storage.copy()
+    copied["d"] = 4
+    assert list(copied) == ["c", "d"]
+    assert list(storage) == ["a", "c"]
+
+
+def test_limited_dict_requires_positive_limit():
+    with pytest.raises(ValueError):
+        LimitedDict(maxlimit=0)
@@ -0,0 +1,100 @@
+import pytest
+from kungfu.library.monad.option import NOTHING
+
+from telegrinder.bot.dispatch.context import Context
+from telegrinder.bot.dispatch.middleware.state_prefetch import StatePrefetchMiddleware
+from telegrinder.tools.state_storage import MemoryStateStorage, StateCache, StateData
+from telegrinder.types.objects import Update
+
+
+class CountingStateStorage(MemoryStateStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets: list[int] = []
+        self.get_manys: list[list[int]] = []
+
+    async def get(self, user_id):
+        self.gets.append(user_id)
+        return await super().get(user_id)
+
+    async def get_many(self, user_ids):
+        self.get_manys.append(list(user_ids))
+        return await super().get_many(user_ids)
+
+
+def make_update(update_id: int, user_id: int) -> Update:
+    return Update.from_raw(
+        (
+            f'{{"update_id": {update_id}, "message": {{"message_id": {update_id}, '
+            f'"from": {{"id": {user_id}, "is_bot": false, "first_name": "J"}}, '
+            f'"chat": {{"id": {user_id}, "type": "private"}}, "date": 1234567898, "text": "hi"}}}}'
+        ).encode(),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_state_cache_fetches_state_once_per_event():
+    storage = CountingStateStorage()
+    await storage.set_many({1: StateData("start", {})})
+    cache = StateCache()
+
+    assert (await cache.get(storage, 1)).unwrap().key == "start"
+    assert (await cache.get(storage, 1)).unwrap().key == "start"
+    assert not await cache.get(storage, 2)
+    assert storage.gets == [1, 2]
+
+    await cache.set(storage, 2, "name", {"step": 1})
+    assert (await cache.get(storage, 2)).unwrap().payload == {"step": 1}
+    await cache.delete(storage, 1)
+    assert not await cache.get(storage, 1)
+    assert storage.gets == [1, 2]
+    assert (await storage.get_many([1, 2]))[2].unwrap().key == "name"
+
+
+@pytest.mark.asyncio()
+async def test_state_prefetch_middleware_prefetches_batch_in_one_call(api_instance):
+    storage = CountingStateStorage()
+    await storage.set(1, key="start", payload={})
+    middleware = StatePrefetchMiddleware(storage)
+    updates = [make_update(update_id, user_id=min(update_id, 3)) for update_id in range(1, 5)]
+
+    await middleware.pre_batch(api_instance, updates)
+    assert storage.get_manys == [[1, 2]]
+    assert set(middleware.prefetched) == {1, 2}
+
+    context = Context(raw_update=updates[0], state_cache=StateCache())
+    assert await middleware.pre(context) is True
+    assert (await context.state_cache.get(storage, 1)).unwrap().key == "start"
+    assert not storage.gets
+    assert 1 not in middleware.prefetched
+    assert middleware.in_flight[1] == 1
+
+
+@pytest.mark.asyncio()
+async def test_state_prefetch_middleware_skips_senders_in_flight(api_instance):
+    storage = CountingStateStorage()
+    middleware = StatePrefetchMiddleware(storage)
+    state_cache = StateCache()
+
+    await middleware.pre(Context(raw_update=make_update(1, user_id=1), state_cache=state_cache))
+    await middleware.pre_batch(api_instance, [make_update(2, user_id=1), make_update(3, user_id=2)])
+    assert storage.get_manys == [[2]]
+    assert set(middleware.prefetched) == {2}
+
+    assert middleware.in_flight[1] == 1
+    state_cache.release()
+    assert 1 not in middleware.in_flight
+
+
+@pytest.mark.asyncio()
+async def test_state_cache_is_invalidated_after_direct_storage_writes():
+    storage = CountingStateStorage()
+    cache = StateCache()
+    cache.put(storage, 1, NOTHING)
+
+    await storage.set(1, key="start", payload={})
+    assert not await cache.get(storage, 1)
+    cache.invalidate(storage, 1)
+    assert (await cache.get(storage, 1)).unwrap().key == "start"
+    assert (await cache.get(storage, 1)).unwrap().key == "start"
+    assert storage.gets == [1]
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from telegrinder.tools.waiter_machine.timer_wheel import TimerWheel
+
+
+@pytest.mark.asyncio()
+async def test_timer_wheel_fires_timers_within_one_tick_after_deadline():
+    wheel = TimerWheel(resolution=1.0)
+    origin = wheel._origin
+    fired: dict[float, float] = {}
+    now = origin
+    deadlines = (0.5, 3.0, 63.2, 64.0, 5_000.7, 300_000.1, 20_000_000.0)
+
+    for delay in deadlines:
+        wheel.schedule(origin + delay, lambda delay=delay: fired.setdefault(delay, now - origin))
+
+    cancelled = wheel.schedule(origin + 10.0, lambda: fired.setdefault(10.0, now - origin))
+    cancelled.cancel()
+    assert not cancelled.pending
+    assert len(wheel) == len(deadlines)
+
+    for step in range(0, 21_000_000, 997):
+        now = origin + step
+        wheel.advance(now)
+
+    wheel.close()
+    assert not wheel
+    assert sorted(fired) == list(deadlines)
+    assert all(delay <= fired_at < delay + 997 for delay, fired_at in fired.items())
+
+
+@pytest.mark.asyncio()
+async def test_timer_wheel_ticks_on_event_loop_while_not_empty():
+    wheel = TimerWheel(resolution=0.01)
+    fired = asyncio.Event()
+
+    timer = wheel.schedule_after(0.02, fired.set)
+    await asyncio.wait_for(fired.wait(), timeout=1.0)
+
+    assert not timer.pending
+    assert not wheel
+    assert wheel._handle is None
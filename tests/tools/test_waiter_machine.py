@@ -0,0 +1,34 @@
+import pytest
+
+from telegrinder.bot.dispatch.context import Context
+from telegrinder.bot.dispatch.middleware.waiter import WaiterMiddleware
+from telegrinder.tools.waiter_machine import Hasher, WaiterMachine
+from telegrinder.types.enums import UpdateType
+
+
+@pytest.mark.asyncio()
+async def test_waiter_middleware_indexes_hashers_by_update_type(api_instance, message_update):
+    machine = WaiterMachine()
+    middleware = WaiterMiddleware(machine)
+    events = []
+    message_hasher = Hasher(
+        update_types=frozenset((UpdateType.MESSAGE,)),
+        hash_from_data=lambda chat_id: chat_id,
+        data_from_event=lambda event: events.append(event) or event.chat.id,
+    )
+    callback_hasher = Hasher(update_types=frozenset((UpdateType.CALLBACK_QUERY,)))
+    any_hasher = Hasher(update_types=frozenset())
+
+    for hasher in (message_hasher, callback_hasher, any_hasher):
+        machine.add_hasher(hasher, waiter_middleware=middleware)
+
+    assert set(middleware.get_hashers(UpdateType.MESSAGE)) == {message_hasher, any_hasher}
+    assert middleware.get_hashers(UpdateType.EDITED_MESSAGE) == (any_hasher,)
+
+    context = Context().add_roots(api_instance, message_update, None)
+    assert await middleware.pre(api_instance, context) is True
+    assert not events
+
+    machine.storage[message_hasher]["other chat"] = None
+    assert await middleware.pre(api_instance, context) is True
+    assert len(events) == 1